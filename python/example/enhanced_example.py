@@ -34,12 +34,12 @@ class LoggingMiddleware:
     def process_request(self, request):
         self.request_count += 1
         start_time = time.time()
-        request.start_time = start_time
+        request.state['start_time'] = start_time
         print(f"🔍 [{self.request_count}] {request.method} {request.path} - Started")
         return None  # Continue to next middleware/handler
     
     def process_response(self, request, response):
-        duration = time.time() - getattr(request, 'start_time', 0)
+        duration = time.time() - request.state.get('start_time', 0)
         print(f"✅ {request.method} {request.path} - {response.status} ({duration:.3f}s)")
         return response
 
@@ -0,0 +1,50 @@
+"""
+Internal JSON helpers for Sufast.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. ``dumps`` always returns UTF-8 encoded bytes so callers can hand
+the result straight to the Rust core or a socket without re-encoding.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+JSONDecodeError = json.JSONDecodeError
+
+# Types that serialize without any custom encoder
+NATIVE_TYPES = (dict, list, str, int, float, bool, type(None))
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None,
+          indent: bool = False) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes (2-space indent if requested)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits - let the stdlib handle them
+            pass
+    if indent:
+        return json.dumps(obj, default=default, indent=2).encode('utf-8')
+    return json.dumps(obj, default=default, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: Any) -> Any:
+    """Deserialize JSON from ``bytes`` or ``str``
+
+    Raises ``JSONDecodeError`` on invalid input with either backend
+    (orjson's error type subclasses the stdlib one).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
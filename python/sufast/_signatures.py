@@ -0,0 +1,49 @@
+"""
+Internal handler-signature helpers for Sufast.
+
+Both cores decide at registration time how a route handler will be called,
+so these run once per route rather than once per request.
+"""
+
+import inspect
+from typing import Callable, FrozenSet, Optional, Tuple
+
+# Parameter kinds that can be filled positionally
+POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+# Parameter kinds that can be filled by keyword
+KEYWORD_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+def accepts_positional(handler: Callable, param_names: Tuple[str, ...]) -> bool:
+    """True if the handler's leading parameters are ``param_names`` in order"""
+    try:
+        parameters = list(inspect.signature(handler).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    if len(parameters) < len(param_names):
+        return False
+    for parameter, name in zip(parameters, param_names):
+        if parameter.name != name or parameter.kind not in POSITIONAL_KINDS:
+            return False
+    return True
+
+
+def accepted_params(handler: Callable) -> Optional[FrozenSet[str]]:
+    """Keyword names the handler takes, or None if it takes any.
+
+    None also covers signatures that cannot be inspected.
+    """
+    try:
+        parameters = inspect.signature(handler).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return frozenset(parameter.name for parameter in parameters if parameter.kind in KEYWORD_KINDS)
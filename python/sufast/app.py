@@ -54,9 +54,10 @@ from typing import (
     Type,
     Union,
 )
-from functools import wraps
+from functools import lru_cache, wraps
 from datetime import datetime, timezone
 
+from . import _json
 from .request import Request, Response, json_response, html_response
 from .exceptions import HTTPException, STATUS_PHRASES
 from .websocket import WebSocket, WebSocketRoute, WebSocketState
@@ -64,10 +65,223 @@ from .background import BackgroundTasks
 from .openapi import OpenAPIGenerator, extract_route_params, extract_function_info
 from .swagger import generate_swagger_html, generate_redoc_html
 
+# Initial size of the per-thread response buffer handed to the Rust core
+_FFI_BUFFER_SIZE = 4096
+
+# ===========================================================
+# Rust Core Discovery
+# ===========================================================
+
+_RUST_LIBRARY_NAMES = {
+    "win32": ["sufast_server.dll", "libsufast_server.dll"],
+    "linux": ["libsufast_server.so"],
+    "darwin": ["libsufast_server.dylib"],
+}
+
+
+@lru_cache(maxsize=8)
+def _rust_library_candidates(cwd: str) -> Tuple[Path, ...]:
+    """Existing Rust core libraries, in load-preference order.
+
+    Probing the filesystem is only done once per working directory.
+    """
+    names = _RUST_LIBRARY_NAMES.get(sys.platform, _RUST_LIBRARY_NAMES["linux"])
+    here = Path(__file__).parent
+    cwd_path = Path(cwd)
+    search_dirs = [
+        here,
+        here.parent,
+        cwd_path,
+        cwd_path / "rust-core" / "target" / "release",
+        cwd_path / "rust-core" / "target" / "debug",
+    ]
+    return tuple(
+        search_dir / name
+        for search_dir in search_dirs
+        for name in names
+        if (search_dir / name).exists()
+    )
+
+
+# Method names as sent by the Rust core, mapped to the strings the router uses
+_HTTP_METHODS = {
+    m.encode("ascii"): m
+    for m in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+}
+
+# Returns the address of a Python-owned buffer (see Sufast._make_ffi_callback).
+# ctypes acquires the GIL for each call, so Rust may invoke it from any thread.
+_PYTHON_CALLBACK_TYPE = ctypes.CFUNCTYPE(
+    ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p
+)
+
+
+@lru_cache(maxsize=64)
+def _envelope_prefix(status: int, content_type: str) -> bytes:
+    """Fixed leading bytes of a callback envelope, up to the body value."""
+    return b'{"status":%d,"headers":{"Content-Type":%s},"body":' % (
+        status,
+        _json.dumps(content_type),
+    )
+
+
+def _encode_envelope(resp: dict) -> bytes:
+    """Encode a ``{"body", "status", "headers"}`` envelope for the Rust core.
+
+    The usual shape (int status, a Content-Type header only) is written from
+    a cached prefix so only the body goes through the JSON encoder.
+    """
+    headers = resp["headers"]
+    status = resp["status"]
+    if type(status) is int and len(headers) == 1 and "Content-Type" in headers:
+        return b"".join(
+            (
+                _envelope_prefix(status, headers["Content-Type"]),
+                _json.dumps(resp["body"], default=str),
+                b"}",
+            )
+        )
+    return _json.dumps(resp, default=str)
+
+
+# Library handle -> trampoline currently installed in that Rust core
+_installed_callbacks: Dict[int, Any] = {}
+
+
+@lru_cache(maxsize=None)
+def _load_rust_library(path: str) -> Optional[ctypes.CDLL]:
+    """Open the Rust core at ``path`` and declare its FFI signatures.
+
+    Done once per path and process; returns None if the library cannot be
+    loaded or lacks an expected export.
+    """
+    try:
+        lib = ctypes.CDLL(path)
+
+        # Static route registration
+        lib.add_static_route.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_uint16,
+            ctypes.c_char_p,
+        ]
+        lib.add_static_route.restype = ctypes.c_bool
+
+        # Dynamic route registration
+        lib.add_dynamic_route.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_uint64,
+        ]
+        lib.add_dynamic_route.restype = ctypes.c_bool
+
+        # Python callback
+        lib.set_python_callback.argtypes = [_PYTHON_CALLBACK_TYPE]
+        lib.set_python_callback.restype = None
+
+        # Server start
+        lib.start_ultra_fast_server.argtypes = [ctypes.c_char_p, ctypes.c_uint16]
+        lib.start_ultra_fast_server.restype = ctypes.c_int
+
+        # Performance stats
+        lib.get_performance_stats.argtypes = []
+        lib.get_performance_stats.restype = ctypes.POINTER(ctypes.c_char)
+
+        # Cache
+        lib.clear_cache.argtypes = []
+        lib.clear_cache.restype = ctypes.c_bool
+
+        lib.precompile_static_routes.argtypes = []
+        lib.precompile_static_routes.restype = ctypes.c_uint64
+    except (OSError, AttributeError):
+        return None
+    return lib
+
+
+# ===========================================================
+# Response Formatting
+# ===========================================================
+
+
+def _format_dict(result: dict, status: int) -> dict:
+    # Already a formatted response
+    if "body" in result and "status" in result and "headers" in result:
+        return result
+    return {
+        "status": status,
+        "headers": {"Content-Type": "application/json"},
+        "body": _json.dumps(result, default=str).decode(),
+    }
+
+
+def _format_sequence(result: Union[list, tuple], status: int) -> dict:
+    return {
+        "status": status,
+        "headers": {"Content-Type": "application/json"},
+        "body": _json.dumps(result, default=str).decode(),
+    }
+
+
+def _format_str(result: str, status: int) -> dict:
+    return {
+        "status": status,
+        "headers": {"Content-Type": "text/plain"},
+        "body": result,
+    }
+
+
+def _format_bytes(result: bytes, status: int) -> dict:
+    return {
+        "status": status,
+        "headers": {"Content-Type": "application/octet-stream"},
+        "body": result,
+    }
+
+
+def _format_none(result: None, status: int) -> dict:
+    return {
+        "status": 204,
+        "headers": {"Content-Type": "application/json"},
+        "body": "",
+    }
+
+
+def _is_plain_json(result: Any) -> bool:
+    """True for a list or a dict that is not already a response envelope."""
+    kind = type(result)
+    if kind is list:
+        return True
+    return kind is dict and not (
+        "body" in result and "status" in result and "headers" in result
+    )
+
+
+# Exact-type dispatch table used by Sufast._format_handler_response
+_RESPONSE_FORMATTERS: Dict[type, Callable[[Any, int], dict]] = {
+    dict: _format_dict,
+    list: _format_sequence,
+    tuple: _format_sequence,
+    str: _format_str,
+    bytes: _format_bytes,
+    type(None): _format_none,
+}
+
+
 # ===========================================================
 # Route Storage
 # ===========================================================
 
+# Regex fragment for each path parameter type, e.g. "{item_id:int}"
+_PARAM_TYPE_PATTERNS = {
+    "str": r"[^/]+",
+    "int": r"\d+",
+    "float": r"\d+\.?\d*",
+    "uuid": r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    "slug": r"[a-z0-9-]+",
+    "path": r".+",
+}
+
 
 class RouteEntry:
     """Stores a single route definition."""
@@ -94,6 +308,7 @@ class RouteEntry:
         "cache_ttl",
         "tier",
         "middleware",
+        "arg_names",
     )
 
     def __init__(self, method: str, path: str, handler: Callable, **kwargs):
@@ -116,6 +331,12 @@ class RouteEntry:
         self.tier = kwargs.get("tier", "dynamic")
         self.middleware = kwargs.get("middleware", [])
 
+        # Handler parameter names, resolved once for the Rust callback path
+        try:
+            self.arg_names = tuple(inspect.signature(handler).parameters)
+        except (TypeError, ValueError):
+            self.arg_names = ()
+
         # Compile path pattern
         self.param_names = []
         self.param_types = {}
@@ -133,15 +354,7 @@ class RouteEntry:
             self.param_names.append(name)
             self.param_types[name] = ptype
 
-            type_patterns = {
-                "str": r"[^/]+",
-                "int": r"\d+",
-                "float": r"\d+\.?\d*",
-                "uuid": r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-                "slug": r"[a-z0-9-]+",
-                "path": r".+",
-            }
-            regex_part = type_patterns.get(ptype, r"[^/]+")
+            regex_part = _PARAM_TYPE_PATTERNS.get(ptype, r"[^/]+")
             full_match_str = match.group(0)
             pattern = pattern.replace(full_match_str, f"(?P<{name}>{regex_part})")
 
@@ -209,7 +422,9 @@ class Router:
     def __init__(self):
         self.routes: List[RouteEntry] = []
         self._exact_routes: Dict[str, RouteEntry] = {}  # "METHOD:/path" -> RouteEntry
-        self._pattern_routes: List[RouteEntry] = []
+        # Pattern routes bucketed by method so a lookup never scans other verbs
+        self._pattern_routes: Dict[str, List[RouteEntry]] = {}
+        self._named_routes: Dict[str, RouteEntry] = {}  # name -> first route
 
     def add(self, route: RouteEntry):
         """Add a route."""
@@ -217,9 +432,10 @@ class Router:
         key = f"{route.method}:{route.path}"
 
         if route.param_names:
-            self._pattern_routes.append(route)
+            self._pattern_routes.setdefault(route.method, []).append(route)
         else:
             self._exact_routes[key] = route
+        self._named_routes.setdefault(route.name, route)
 
     def find(
         self, method: str, path: str
@@ -228,20 +444,22 @@ class Router:
         method = method.upper()
 
         # Try exact match first (fastest)
-        key = f"{method}:{path}"
-        if key in self._exact_routes:
-            return self._exact_routes[key], {}
+        route = self._exact_routes.get(f"{method}:{path}")
+        if route is not None:
+            return route, {}
 
-        # Try pattern routes
-        for route in self._pattern_routes:
-            if route.method != method:
-                continue
+        # Try pattern routes registered for this method
+        for route in self._pattern_routes.get(method, ()):
             params = route.match(path)
             if params is not None:
                 return route, params
 
         return None
 
+    def get_named(self, name: str) -> Optional[RouteEntry]:
+        """Return the first route registered under ``name``."""
+        return self._named_routes.get(name)
+
     def get_all_metadata(self) -> List[dict]:
         """Get metadata for all routes."""
         return [r.to_metadata() for r in self.routes]
@@ -258,9 +476,10 @@ class MiddlewareWrapper:
     def __init__(self, func: Callable, type: str = "http"):
         self.func = func
         self.type = type
+        self.is_async = asyncio.iscoroutinefunction(func)
 
     async def __call__(self, request, call_next):
-        if asyncio.iscoroutinefunction(self.func):
+        if self.is_async:
             return await self.func(request, call_next)
         else:
             return self.func(request, call_next)
@@ -385,6 +604,12 @@ class Sufast:
         self._rust_core = None
         self._rust_available = False
         self._python_callback_ref = None
+        # Whether the core accepts a JSON document as the envelope body
+        self._inline_json_body = False
+
+        # Event loop that runs async handlers for the Rust callback
+        self._ffi_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ffi_loop_lock = threading.Lock()
 
         # Load Rust core (optional - won't fail)
         self._try_load_rust_core()
@@ -413,190 +638,166 @@ class Sufast:
 
     def _try_load_rust_core(self):
         """Try to load the Rust shared library. Non-fatal if not found."""
-        lib_names = {
-            "win32": ["sufast_server.dll", "libsufast_server.dll"],
-            "linux": ["libsufast_server.so"],
-            "darwin": ["libsufast_server.dylib"],
-        }
-
-        platform = sys.platform
-        names = lib_names.get(platform, lib_names.get("linux", []))
-
-        search_dirs = [
-            Path(__file__).parent,
-            Path(__file__).parent.parent,
-            Path.cwd(),
-            Path.cwd() / "rust-core" / "target" / "release",
-            Path.cwd() / "rust-core" / "target" / "debug",
-        ]
-
-        for search_dir in search_dirs:
-            for name in names:
-                lib_path = search_dir / name
-                if lib_path.exists():
-                    try:
-                        self._rust_core = ctypes.CDLL(str(lib_path))
-                        self._setup_rust_ffi()
-                        self._rust_available = True
-                        return
-                    except Exception:
-                        continue
+        for lib_path in _rust_library_candidates(os.getcwd()):
+            lib = _load_rust_library(str(lib_path))
+            if lib is None:
+                continue
+            try:
+                self._rust_core = lib
+                self._inline_json_body = hasattr(lib, "supports_inline_json_body")
+                self._register_rust_callback()
+                self._rust_available = True
+                return
+            except Exception:
+                self._rust_core = None
+                continue
 
         # Rust core not found - that's OK, we'll use Python server
         self._rust_available = False
 
-    def _setup_rust_ffi(self):
-        """Setup FFI bindings with the Rust core."""
-        if not self._rust_core:
-            return
-
-        try:
-            # Static route registration
-            self._rust_core.add_static_route.argtypes = [
-                ctypes.c_char_p,
-                ctypes.c_char_p,
-                ctypes.c_uint16,
-                ctypes.c_char_p,
-            ]
-            self._rust_core.add_static_route.restype = ctypes.c_bool
-
-            # Dynamic route registration
-            self._rust_core.add_dynamic_route.argtypes = [
-                ctypes.c_char_p,
-                ctypes.c_char_p,
-                ctypes.c_char_p,
-                ctypes.c_uint64,
-            ]
-            self._rust_core.add_dynamic_route.restype = ctypes.c_bool
-
-            # Python callback
-            self._PythonCallbackType = ctypes.CFUNCTYPE(
-                ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p
-            )
-            self._rust_core.set_python_callback.argtypes = [self._PythonCallbackType]
-            self._rust_core.set_python_callback.restype = None
-
-            # Server start
-            self._rust_core.start_ultra_fast_server.argtypes = [
-                ctypes.c_char_p,
-                ctypes.c_uint16,
-            ]
-            self._rust_core.start_ultra_fast_server.restype = ctypes.c_int
-
-            # Performance stats
-            self._rust_core.get_performance_stats.argtypes = []
-            self._rust_core.get_performance_stats.restype = ctypes.POINTER(
-                ctypes.c_char
-            )
-
-            # Cache
-            self._rust_core.clear_cache.argtypes = []
-            self._rust_core.clear_cache.restype = ctypes.c_bool
-
-            self._rust_core.precompile_static_routes.argtypes = []
-            self._rust_core.precompile_static_routes.restype = ctypes.c_uint64
-
-            # Register callback
-            self._register_rust_callback()
-
-        except Exception as e:
-            self._rust_available = False
-
     def _register_rust_callback(self):
-        """Register Python callback for Rust to call on dynamic routes."""
-        _response_buffer = threading.local()
-        router = self._router
-        middleware_stack = self._middleware
-        app = self
-
-        def rust_python_callback(method_ptr, path_ptr, params_ptr):
-            try:
-                method = ctypes.string_at(method_ptr).decode("utf-8")
-                path = ctypes.string_at(path_ptr).decode("utf-8")
-                params_json = ctypes.string_at(params_ptr).decode("utf-8")
+        """Install this app's callback in the Rust core (created once per app)."""
+        if self._python_callback_ref is None:
+            self._python_callback_ref = _PYTHON_CALLBACK_TYPE(self._make_ffi_callback())
+        self._rust_core.set_python_callback(self._python_callback_ref)
+        # The core only keeps a raw pointer, so the installed trampoline must
+        # outlive this app if another instance is created and dropped
+        _installed_callbacks[self._rust_core._handle] = self._python_callback_ref
+
+    def _make_ffi_callback(self) -> Callable[[bytes, bytes, bytes], int]:
+        """Build the raw callback handed to the Rust core.
+
+        Responses are written NUL-terminated into a per-thread bytearray that
+        is reused across calls and only reallocated (doubling) when a response
+        does not fit. The returned address stays valid until the next callback
+        on the same thread, so the Rust side must copy it before then.
+        """
+        local = threading.local()
+
+        def rust_python_callback(
+            method,
+            path,
+            params_json,
+            _handle=self._handle_ffi_request,
+            _local=local,
+        ):
+            # c_char_p arguments arrive as bytes; no string_at copy needed
+            resp_bytes = _handle(method, path, params_json)
+            size = len(resp_bytes)
+            buf = getattr(_local, "buf", None)
+            if buf is None or size >= len(buf):
+                capacity = len(buf) if buf is not None else _FFI_BUFFER_SIZE
+                while capacity <= size:
+                    capacity *= 2
+                buf = _local.buf = bytearray(capacity)
+                _local.view = (ctypes.c_char * capacity).from_buffer(buf)
+                _local.address = ctypes.addressof(_local.view)
+            buf[:size] = resp_bytes
+            buf[size] = 0
+            return _local.address
+
+        return rust_python_callback
+
+    def _get_ffi_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background loop for async handlers, starting it on first use."""
+        if self._ffi_loop is None:
+            with self._ffi_loop_lock:
+                if self._ffi_loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever, name="sufast-ffi-loop", daemon=True
+                    ).start()
+                    self._ffi_loop = loop
+        return self._ffi_loop
+
+    def _handle_ffi_request(
+        self, method: bytes, path: bytes, params_json: bytes
+    ) -> bytes:
+        """Handle a request forwarded by the Rust core.
+
+        Returns the ``{"body", "status", "headers"}`` envelope as JSON bytes.
+        """
+        try:
+            method = _HTTP_METHODS.get(method) or method.decode("utf-8")
+            path = path.decode("utf-8")
+
+            # params_json is not parsed: the core captures the same names
+            # from the same path pattern, and the router match below also
+            # applies the declared types ("{id:int}") the raw strings lack
+
+            # Find route
+            result = self._router.find(method, path)
+            if not result:
+                resp = {
+                    "body": _json.dumps({"detail": "Not Found", "path": path}).decode(),
+                    "status": 404,
+                    "headers": {"Content-Type": "application/json"},
+                }
+            else:
+                route, params = result
 
                 try:
-                    extra_params = json.loads(params_json) if params_json else {}
-                except Exception:
-                    extra_params = {}
-
-                # Find route
-                result = router.find(method, path)
-                if not result:
-                    resp = {
-                        "body": json.dumps({"detail": "Not Found", "path": path}),
-                        "status": 404,
-                        "headers": {"Content-Type": "application/json"},
+                    # Call handler
+                    handler = route.handler
+
+                    # Build args from the names captured at registration
+                    kwargs = {
+                        pname: params[pname]
+                        for pname in route.arg_names
+                        if pname in params
                     }
-                else:
-                    route, params = result
-                    params.update(extra_params)
 
-                    try:
-                        # Call handler
-                        handler = route.handler
-
-                        # Build args based on handler signature
-                        sig = inspect.signature(handler)
-                        kwargs = {}
-                        for pname in sig.parameters:
-                            if pname in params:
-                                kwargs[pname] = params[pname]
-
-                        if asyncio.iscoroutinefunction(handler):
-                            loop = asyncio.new_event_loop()
-                            try:
-                                response = loop.run_until_complete(handler(**kwargs))
-                            finally:
-                                loop.close()
-                        else:
-                            response = handler(**kwargs)
-
-                        resp = app._format_handler_response(response, route.status_code)
-
-                    except HTTPException as e:
-                        resp = {
-                            "body": json.dumps({"detail": e.detail}),
-                            "status": e.status_code,
-                            "headers": {
-                                "Content-Type": "application/json",
-                                **e.headers,
-                            },
-                        }
-                    except Exception as e:
+                    if route.is_async:
+                        response = asyncio.run_coroutine_threadsafe(
+                            handler(**kwargs), self._get_ffi_loop()
+                        ).result()
+                    else:
+                        response = handler(**kwargs)
+
+                    if self._inline_json_body and _is_plain_json(response):
+                        # Encoded once, together with the envelope
                         resp = {
-                            "body": json.dumps(
-                                {"detail": f"Internal Server Error: {str(e)}"}
-                            ),
-                            "status": 500,
+                            "body": response,
+                            "status": route.status_code,
                             "headers": {"Content-Type": "application/json"},
                         }
+                    else:
+                        resp = self._format_handler_response(
+                            response, route.status_code
+                        )
 
-                resp_json = json.dumps(resp, default=str)
-                result_buf = ctypes.create_string_buffer(resp_json.encode("utf-8"))
-
-                if not hasattr(_response_buffer, "buf"):
-                    _response_buffer.buf = []
-                _response_buffer.buf.append(result_buf)
-                if len(_response_buffer.buf) > 100:
-                    _response_buffer.buf = _response_buffer.buf[-50:]
-
-                return ctypes.cast(result_buf, ctypes.c_char_p).value
-
-            except Exception as e:
-                err = json.dumps(
-                    {
-                        "body": json.dumps({"detail": f"Callback error: {str(e)}"}),
+                except HTTPException as e:
+                    resp = {
+                        "body": _json.dumps({"detail": e.detail}).decode(),
+                        "status": e.status_code,
+                        "headers": {
+                            "Content-Type": "application/json",
+                            **e.headers,
+                        },
+                    }
+                except Exception as e:
+                    # Diagnostics only in debug mode, as on the Python path
+                    if self.debug:
+                        traceback.print_exc()
+                        detail = f"Internal Server Error: {str(e)}"
+                    else:
+                        detail = "Internal Server Error"
+                    resp = {
+                        "body": _json.dumps({"detail": detail}).decode(),
                         "status": 500,
                         "headers": {"Content-Type": "application/json"},
                     }
-                )
-                buf = ctypes.create_string_buffer(err.encode("utf-8"))
-                return ctypes.cast(buf, ctypes.c_char_p).value
 
-        callback = self._PythonCallbackType(rust_python_callback)
-        self._python_callback_ref = callback  # prevent GC
-        self._rust_core.set_python_callback(callback)
+            return _encode_envelope(resp)
+
+        except Exception as e:
+            return _json.dumps(
+                {
+                    "body": _json.dumps({"detail": f"Callback error: {str(e)}"}).decode(),
+                    "status": 500,
+                    "headers": {"Content-Type": "application/json"},
+                }
+            )
 
     def _register_with_rust(self, route: RouteEntry):
         """Register a route with the Rust core for acceleration."""
@@ -608,9 +809,9 @@ class Sufast:
                 # Try to pre-compute static response
                 try:
                     if route.is_async:
-                        loop = asyncio.new_event_loop()
-                        resp = loop.run_until_complete(route.handler())
-                        loop.close()
+                        resp = asyncio.run_coroutine_threadsafe(
+                            route.handler(), self._get_ffi_loop()
+                        ).result()
                     else:
                         resp = route.handler()
 
@@ -681,6 +882,14 @@ class Sufast:
 
         return handler
 
+    def _route_decorator(self, method: str, path: str, kwargs: dict) -> Callable:
+        """Build the decorator behind get/post/put/... for a single method."""
+
+        def decorator(func):
+            return self._add_route(method, path, func, **kwargs)
+
+        return decorator
+
     def route(self, path: str, methods: List[str] = None, **kwargs):
         """Generic route decorator.
 
@@ -706,11 +915,7 @@ class Sufast:
             async def list_users():
                 return {"users": []}
         """
-
-        def decorator(func):
-            return self._add_route("GET", path, func, **kwargs)
-
-        return decorator
+        return self._route_decorator("GET", path, kwargs)
 
     def post(self, path: str, **kwargs):
         """POST route decorator.
@@ -721,51 +926,27 @@ class Sufast:
                 data = await request.json()
                 return data
         """
-
-        def decorator(func):
-            return self._add_route("POST", path, func, **kwargs)
-
-        return decorator
+        return self._route_decorator("POST", path, kwargs)
 
     def put(self, path: str, **kwargs):
         """PUT route decorator."""
-
-        def decorator(func):
-            return self._add_route("PUT", path, func, **kwargs)
-
-        return decorator
+        return self._route_decorator("PUT", path, kwargs)
 
     def delete(self, path: str, **kwargs):
         """DELETE route decorator."""
-
-        def decorator(func):
-            return self._add_route("DELETE", path, func, **kwargs)
-
-        return decorator
+        return self._route_decorator("DELETE", path, kwargs)
 
     def patch(self, path: str, **kwargs):
         """PATCH route decorator."""
-
-        def decorator(func):
-            return self._add_route("PATCH", path, func, **kwargs)
-
-        return decorator
+        return self._route_decorator("PATCH", path, kwargs)
 
     def head(self, path: str, **kwargs):
         """HEAD route decorator."""
-
-        def decorator(func):
-            return self._add_route("HEAD", path, func, **kwargs)
-
-        return decorator
+        return self._route_decorator("HEAD", path, kwargs)
 
     def options(self, path: str, **kwargs):
         """OPTIONS route decorator."""
-
-        def decorator(func):
-            return self._add_route("OPTIONS", path, func, **kwargs)
-
-        return decorator
+        return self._route_decorator("OPTIONS", path, kwargs)
 
     def websocket(self, path: str, **kwargs):
         """WebSocket route decorator.
@@ -822,18 +1003,22 @@ class Sufast:
         else:
             instance = middleware_cls
 
+        # Resolve the optional hooks once instead of probing per request
+        process_request = getattr(instance, "process_request", None)
+        process_response = getattr(instance, "process_response", None)
+
         async def middleware_wrapper(request, call_next):
             # Process request
-            if hasattr(instance, "process_request"):
-                result = instance.process_request(request)
+            if process_request is not None:
+                result = process_request(request)
                 if result is not None and isinstance(result, Response):
                     return result
 
             response = await call_next(request)
 
             # Process response
-            if hasattr(instance, "process_response"):
-                response = instance.process_response(request, response)
+            if process_response is not None:
+                response = process_response(request, response)
 
             return response
 
@@ -1330,53 +1515,32 @@ class Sufast:
 
     def _format_handler_response(self, result: Any, default_status: int = 200) -> dict:
         """Convert handler return value to response dict."""
+        # Common return types resolve with one dict lookup on the exact type;
+        # subclasses and everything else go through the isinstance chain
+        formatter = _RESPONSE_FORMATTERS.get(type(result))
+        if formatter is not None:
+            return formatter(result, default_status)
+
         if isinstance(result, Response):
             return result.to_dict()
 
         if isinstance(result, dict):
-            # Check if it's already a formatted response
-            if "body" in result and "status" in result and "headers" in result:
-                return result
-            # Regular dict -> JSON response
-            return {
-                "status": default_status,
-                "headers": {"Content-Type": "application/json"},
-                "body": json.dumps(result, default=str),
-            }
+            return _format_dict(result, default_status)
 
         if isinstance(result, (list, tuple)):
-            return {
-                "status": default_status,
-                "headers": {"Content-Type": "application/json"},
-                "body": json.dumps(result, default=str),
-            }
+            return _format_sequence(result, default_status)
 
         if isinstance(result, str):
-            return {
-                "status": default_status,
-                "headers": {"Content-Type": "text/plain"},
-                "body": result,
-            }
+            return _format_str(result, default_status)
 
         if isinstance(result, bytes):
-            return {
-                "status": default_status,
-                "headers": {"Content-Type": "application/octet-stream"},
-                "body": result,
-            }
-
-        if result is None:
-            return {
-                "status": 204,
-                "headers": {"Content-Type": "application/json"},
-                "body": "",
-            }
+            return _format_bytes(result, default_status)
 
         # Fallback: serialize to JSON
         return {
             "status": default_status,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(result, default=str),
+            "body": _json.dumps(result, default=str).decode(),
         }
 
     # ===========================================================
@@ -1413,13 +1577,13 @@ class Sufast:
 
     def url_for(self, name: str, **kwargs) -> str:
         """Generate URL for a named route."""
-        for route in self._router.routes:
-            if route.name == name:
-                url = route.path
-                for k, v in kwargs.items():
-                    url = re.sub(r"\{" + k + r"(?::\w+)?\}", str(v), url)
-                return url
-        raise ValueError(f"Route '{name}' not found")
+        route = self._router.get_named(name)
+        if route is None:
+            raise ValueError(f"Route '{name}' not found")
+        url = route.path
+        for k, v in kwargs.items():
+            url = re.sub(r"\{" + k + r"(?::\w+)?\}", str(v), url)
+        return url
 
     @property
     def is_rust_accelerated(self) -> bool:
@@ -1552,6 +1716,10 @@ class Sufast:
         rust_state = {"result": 0, "error": None}
         done = threading.Event()
 
+        # Another Sufast instance may have installed its own callback since
+        # this one loaded the core
+        self._register_rust_callback()
+
         def _run_rust_blocking():
             try:
                 # Precompile static routes
@@ -9,18 +9,121 @@ Performance Targets:
 """
 
 import ctypes
+import dataclasses
+import importlib.resources
+import itertools
 import json
 import os
+import platform
+import signal
 import sys
 import time
 import asyncio
 import threading
-from typing import Dict, List, Optional, Callable, Any, Union
+from array import array
+from typing import Dict, List, Mapping, Optional, Callable, Any, Tuple, Union
 from functools import wraps, lru_cache
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
 
+from . import _json
+from ._signatures import accepts_positional
+
+# Fixed error bodies returned to the core
+_NOT_FOUND_BODY = b'{"error": "Route not found"}'
+_INTERNAL_ERROR_BODY = b'{"error": "Internal server error"}'
+
+# Responses returned through ctypes stay referenced for this many calls,
+# giving the core time to copy each buffer (must be a power of two)
+_RESPONSE_RING_SIZE = 1024
+_RESPONSE_RING_MASK = _RESPONSE_RING_SIZE - 1
+
+# Handler type tag passed to the core for Python-served routes
+_PYTHON_HANDLER_TYPE = b"python"
+
+# Critical route payloads, serialized once at import rather than per app
+_CRITICAL_ROUTE_PAYLOADS = {
+    '/': _json.dumps({
+        'message': 'Sufast Ultra-Optimized Server v2.0',
+        'performance': 'Three-tier optimization active',
+        'timestamp': datetime.utcnow().isoformat()
+    }),
+    '/api/status': _json.dumps({
+        'api': 'active',
+        'version': '2.0',
+        'optimization': 'optimized',
+        'routing': 'three-tier'
+    }),
+}
+
+# /health reports whether the Rust core is loaded
+_HEALTH_PAYLOADS = {
+    loaded: _json.dumps({
+        'status': 'healthy',
+        'optimization': 'optimized',
+        'rust_core': loaded,
+        'cache': 'active'
+    })
+    for loaded in (True, False)
+}
+
+
+# Shared library names shipped inside the package, per platform
+_LIBRARY_NAMES = {
+    'Windows': ('sufast_server.dll', 'libsufast_core.dll'),
+    'Linux': ('sufast_server.so', 'libsufast_server.so', 'libsufast_core.so'),
+    'Darwin': ('sufast_server.dylib', 'libsufast_server.dylib', 'libsufast_core.dylib'),
+}
+
+
+@lru_cache(maxsize=1)
+def _load_shared_library() -> Optional[ctypes.CDLL]:
+    """
+    Load the Rust core shared library once per process
+
+    ``SUFAST_LIB_PATH`` overrides the lookup; otherwise only the library
+    names for the current platform are tried inside the package directory.
+    """
+    override = os.environ.get('SUFAST_LIB_PATH')
+    if override:
+        candidates = [override]
+    else:
+        # importlib.resources.files is 3.9+; on 3.8 use the module's directory
+        files = getattr(importlib.resources, 'files', None)
+        package_dir = files(__package__) if files is not None else Path(__file__).parent
+        candidates = [
+            package_dir.joinpath(name)
+            for name in _LIBRARY_NAMES.get(platform.system(), ())
+        ]
+    
+    for candidate in candidates:
+        try:
+            return ctypes.CDLL(str(candidate))
+        except OSError:
+            continue
+    return None
+
+
+# Slots in RustCore.counters
+_COUNTER_REQUESTS = 0
+_COUNTER_CACHE_HITS = 1
+_COUNTER_STATIC_HITS = 2
+_COUNTER_DYNAMIC_HITS = 3
+_COUNTER_SLOTS = 4
+
+
+def _counter_property(index: int) -> property:
+    """Expose one packed counter slot as a plain int attribute"""
+    def getter(self):
+        return self.counters[index]
+    
+    def setter(self, value):
+        self.counters[index] = value
+    
+    return property(getter, setter)
+
+
 # === RUST CORE INTEGRATION ===
 class RustCore:
     """Optimized Rust core integration for performance"""
@@ -30,11 +133,11 @@ class RustCore:
         self.is_loaded = False
         self._load_rust_library()
         
-        # Performance counters
-        self.request_count = 0
-        self.cache_hits = 0
-        self.static_hits = 0
-        self.dynamic_hits = 0
+        # Performance counters, packed as uint64 slots (see _COUNTER_*).
+        # ``counters[i] += 1`` is a read-modify-write that another thread can
+        # interleave with, so bumps take the lock
+        self.counters = array('Q', bytes(8 * _COUNTER_SLOTS))
+        self.counter_lock = threading.Lock()
         
         # Route caches for optimization
         self.static_route_cache = {}
@@ -46,47 +149,27 @@ class RustCore:
         self.enable_cache_optimization = True
         self.enable_route_precompilation = True
         
+    request_count = _counter_property(_COUNTER_REQUESTS)
+    cache_hits = _counter_property(_COUNTER_CACHE_HITS)
+    static_hits = _counter_property(_COUNTER_STATIC_HITS)
+    dynamic_hits = _counter_property(_COUNTER_DYNAMIC_HITS)
+    
     def _load_rust_library(self):
         """Load the optimized Rust library with error handling"""
         try:
-            # Find the compiled Rust library
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            lib_paths = [
-                os.path.join(current_dir, "sufast_server.dll"),  # Current package directory
-                os.path.join(current_dir, "sufast_server.so"),   # Current package directory  
-                "rust-core/target/release/sufast_server.dll",  # Windows
-                "rust-core/target/release/sufast_server.so",   # Linux
-                "rust-core/target/release/sufast_server.dylib", # macOS
-                "../rust-core/target/release/sufast_server.dll",
-                "../rust-core/target/release/sufast_server.so",
-                "../rust-core/target/release/sufast_server.dylib",
-                "rust-core/target/release/libsufast_core.dll",  # Alternative naming
-                "rust-core/target/release/libsufast_core.so",   # Alternative naming
-                "rust-core/target/release/libsufast_core.dylib", # Alternative naming
-                "sufast_server.dll",  # Local fallback
-                "sufast_server.so",   # Local fallback
-            ]
-            
-            for lib_path in lib_paths:
-                if os.path.exists(lib_path):
-                    try:
-                        self.lib = ctypes.CDLL(lib_path)
-                        self._setup_function_signatures()
-                        self.is_loaded = True
-                        break
-                    except Exception as e:
-                        continue
-            
-            if not self.is_loaded:
-                pass  # Rust core not available, using Python fallback
-                
+            self.lib = _load_shared_library()
+            if self.lib is not None:
+                # Only trust a library that exposes the expected API
+                self.is_loaded = self._setup_function_signatures()
+                if not self.is_loaded:
+                    self.lib = None
         except Exception as e:
             self.is_loaded = False
     
-    def _setup_function_signatures(self):
-        """Setup C function signatures for FFI calls"""
+    def _setup_function_signatures(self) -> bool:
+        """Setup C function signatures for FFI calls, False if any are missing"""
         if not self.lib:
-            return
+            return False
             
         try:
             # Define callback function type (match Rust exactly)
@@ -110,8 +193,14 @@ class RustCore:
             self.lib.start_sufast_server.argtypes = [ctypes.c_char_p, ctypes.c_uint16]
             self.lib.start_sufast_server.restype = ctypes.c_int
             
+            # Raw pointer so the Rust-owned buffer can be read and then freed
             self.lib.get_performance_stats.argtypes = []
-            self.lib.get_performance_stats.restype = ctypes.c_char_p
+            self.lib.get_performance_stats.restype = ctypes.c_void_p
+            
+            free_rust_string = getattr(self.lib, 'free_rust_string', None)
+            if free_rust_string is not None:
+                free_rust_string.argtypes = [ctypes.c_void_p]
+                free_rust_string.restype = None
             
             self.lib.clear_cache.argtypes = []
             self.lib.clear_cache.restype = ctypes.c_bool
@@ -122,17 +211,28 @@ class RustCore:
             self.lib.static_routes_count.argtypes = []
             self.lib.static_routes_count.restype = ctypes.c_uint64
             
+            return True
+            
         except Exception as e:
-            pass
+            return False
     
-    def add_static_route(self, path: str, response_data: dict, cache_forever: bool = True):
-        """Add fast static route"""
+    def add_static_route(self, path: str, response_data: Union[dict, bytes],
+                         cache_forever: bool = True):
+        """
+        Add fast static route
+
+        ``response_data`` may be a dict or an already-serialized JSON payload
+        as bytes; bytes are handed to the core without re-encoding.
+        """
         try:
             if self.is_loaded and self.lib:
-                response_json = json.dumps(response_data)
+                if isinstance(response_data, (bytes, bytearray)):
+                    response_json = bytes(response_data)
+                else:
+                    response_json = _json.dumps(response_data)
                 result = self.lib.add_static_route(
                     path.encode('utf-8'),
-                    response_json.encode('utf-8')
+                    response_json
                 )
                 if result:
                     return True
@@ -148,17 +248,24 @@ class RustCore:
         except Exception as e:
             return False
     
-    def add_dynamic_route(self, method: str, path: str, handler: Callable, cache_ttl: int = 0):
-        """Add optimized dynamic route with optional caching"""
+    def add_dynamic_route(self, method: str, path: str, handler: Callable, cache_ttl: int = 0,
+                          method_bytes: Optional[bytes] = None,
+                          path_bytes: Optional[bytes] = None):
+        """
+        Add optimized dynamic route with optional caching
+        
+        ``method_bytes``/``path_bytes`` let callers that already hold the
+        encoded route skip re-encoding it for the FFI call.
+        """
         try:
             route_key = f"{method}:{path}"
             
             # Add to Rust core if available
             if self.is_loaded and self.lib:
                 result = self.lib.add_route(
-                    method.encode('utf-8'),
-                    path.encode('utf-8'),
-                    "python".encode('utf-8'),
+                    method_bytes or method.encode('utf-8'),
+                    path_bytes or path.encode('utf-8'),
+                    _PYTHON_HANDLER_TYPE,
                     cache_ttl
                 )
                 if result:
@@ -200,10 +307,9 @@ class RustCore:
             # Get Rust stats if available
             if self.is_loaded and self.lib:
                 try:
-                    rust_stats_ptr = self.lib.get_performance_stats()
-                    if rust_stats_ptr:
-                        rust_stats_str = ctypes.string_at(rust_stats_ptr).decode('utf-8')
-                        rust_stats = json.loads(rust_stats_str)
+                    rust_stats_raw = self._read_rust_stats()
+                    if rust_stats_raw:
+                        rust_stats = _json.loads(rust_stats_raw)
                         stats['sufast_optimization']['rust_stats'] = rust_stats
                         
                         # Get cache and route counts
@@ -223,6 +329,18 @@ class RustCore:
         except Exception as e:
             return {'error': str(e)}
     
+    def _read_rust_stats(self) -> Optional[bytes]:
+        """Fetch the core's stats JSON as bytes, releasing the Rust buffer"""
+        ptr = self.lib.get_performance_stats()
+        if not ptr:
+            return None
+        try:
+            return ctypes.string_at(ptr)
+        finally:
+            free_rust_string = getattr(self.lib, 'free_rust_string', None)
+            if free_rust_string is not None:
+                free_rust_string(ptr)
+    
     def clear_all_caches(self):
         """Clear all caches for fresh start"""
         try:
@@ -235,10 +353,7 @@ class RustCore:
             self.dynamic_route_cache.clear()
             
             # Reset counters
-            self.request_count = 0
-            self.cache_hits = 0
-            self.static_hits = 0
-            self.dynamic_hits = 0
+            self.counters[:] = array('Q', bytes(8 * _COUNTER_SLOTS))
             
             return True
             
@@ -246,6 +361,44 @@ class RustCore:
             return False
 
 
+# Bounds for the resolved-route LRU cache; the upper cap keeps adversarial
+# paths from growing it without limit
+_RESOLVE_CACHE_MIN = 5000
+_RESOLVE_CACHE_MAX = 100000
+
+
+def _resolve_cache_size(route_count: int) -> int:
+    """Next power of two above the route count, clamped to the cache bounds"""
+    size = 1 << max(route_count - 1, 0).bit_length()
+    return min(_RESOLVE_CACHE_MAX, max(_RESOLVE_CACHE_MIN, size))
+
+
+def _compile_param_builder(param_names: Tuple[str, ...]) -> Callable[[tuple], dict]:
+    """
+    Generate a function mapping captured segment values to a params dict
+    
+    The parameter names are baked into a dict literal, so building the
+    params for a request is a single expression with no zip or loop.
+    """
+    items = ", ".join(f"{name!r}: values[{index}]" for index, name in enumerate(param_names))
+    namespace = {}
+    exec(f"def build_params(values):\n    return {{{items}}}\n", namespace)
+    return namespace['build_params']
+
+
+_build_no_params = _compile_param_builder(())
+
+class _RouteTrieNode:
+    """Segment trie node for dynamic route lookup"""
+    
+    __slots__ = ('children', 'param_child', 'handlers')
+    
+    def __init__(self):
+        self.children = {}       # literal segment -> node
+        self.param_child = None  # node for a {param} segment
+        self.handlers = {}       # method -> (route_info, build_params, positional)
+
+
 # === OPTIMIZED APPLICATION CLASS ===
 class SufastUltraOptimized:
     """
@@ -258,9 +411,25 @@ class SufastUltraOptimized:
     def __init__(self, enable_rust_optimization: bool = True):
         self.rust_core = RustCore() if enable_rust_optimization else None
         self.routes = {}
+        self._literal_routes = {}
+        self._route_trie = _RouteTrieNode()
+        self._reset_resolve_cache()
         self.middleware_stack = []
         self.error_handlers = {}
         
+        # Keeps buffers handed to the ctypes bridge alive; slots are claimed
+        # with an atomic counter so concurrent core threads never share one
+        self._response_ring = [None] * _RESPONSE_RING_SIZE
+        self._ring_counter = itertools.count()
+        
+        # Set by stop() or SIGINT to release run()
+        self._shutdown_event = threading.Event()
+        
+        # Async handlers run on one background event loop, started lazily
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self.async_timeout = 30.0
+        
         # Performance optimization settings
         self.enable_request_batching = True
         self.enable_response_compression = True
@@ -276,73 +445,20 @@ class SufastUltraOptimized:
     def _register_python_handler(self):
         """Register Python callback with Rust core for dynamic route processing"""
         try:
-            # Store response strings to prevent garbage collection
-            self._response_strings = []
-            
-            # Create a global response storage to keep strings alive
-            self._current_response = None
+            # The core copies the returned buffer right after
+            # the callback returns, so each response is parked in the ring
+            # until enough later requests have gone through to overwrite it
+            dispatch = self._dispatch
+            ring = self._response_ring
+            counter = self._ring_counter
             
-            # Create the actual callback function with string return
-            def python_handler_impl(request_data_ptr, path_ptr):
-                try:
-                    # Convert C strings to Python strings
-                    request_data = ctypes.string_at(request_data_ptr).decode('utf-8')
-                    path = ctypes.string_at(path_ptr).decode('utf-8')
-                    
-                    # Parse request data
-                    import json
-                    request_info = json.loads(request_data)
-                    method = request_info.get('method', 'GET')
-                    
-                    # Find matching route
-                    route = self._find_matching_route(method, path)
-                    
-                    if route:
-                        # Extract parameters from path
-                        params = self._extract_parameters(route['path'], path)
-                        
-                        # Call the handler
-                        try:
-                            if params:
-                                result = route['handler'](**params)
-                            else:
-                                result = route['handler']()
-                            
-                            # Convert result to JSON
-                            if isinstance(result, dict):
-                                # Check if it's a response object with body/status/headers
-                                if 'body' in result:
-                                    response_json = result['body']
-                                else:
-                                    response_json = json.dumps(result)
-                            elif hasattr(result, 'body'):
-                                response_json = result.body
-                            else:
-                                response_json = json.dumps({'result': str(result)})
-                            
-                            # Store response globally and return it
-                            self._current_response = response_json
-                            return response_json.encode('utf-8')
-                            
-                        except Exception as e:
-                            error_response = json.dumps({
-                                'error': 'Handler execution failed',
-                                'message': str(e),
-                                'path': path,
-                                'method': method
-                            })
-                            self._current_response = error_response
-                            return error_response.encode('utf-8')
-                    
-                    # No matching route found
-                    error_response = '{"error": "Route not found"}'
-                    self._current_response = error_response
-                    return error_response.encode('utf-8')
-                    
-                except Exception as e:
-                    error_response = '{"error": "Internal server error"}'
-                    self._current_response = error_response
-                    return error_response.encode('utf-8')
+            # Everything the callback touches is bound as a default argument
+            # so each call resolves it with a local lookup
+            def python_handler_impl(request_data, path, _dispatch=dispatch, _ring=ring,
+                                    _next=next, _counter=counter, _mask=_RESPONSE_RING_MASK):
+                body = _dispatch(request_data, path)
+                _ring[_next(_counter) & _mask] = body
+                return body
             
             # Create the callback function with proper typing
             python_handler = self.rust_core.PythonHandlerType(python_handler_impl)
@@ -351,60 +467,229 @@ class SufastUltraOptimized:
             self._python_handler_func = python_handler
             
             # Register with Rust core
-            if self.rust_core.lib.set_python_handler:
-                # Pass the function directly (it's already the correct type)
-                result = self.rust_core.lib.set_python_handler(python_handler)
+            self.rust_core.lib.set_python_handler(python_handler)
             
         except Exception as e:
             pass
     
-    def _find_matching_route(self, method: str, path: str) -> dict:
-        """Find a route that matches the given method and path with parameters"""
-        # First try exact match
-        route_key = f"{method}:{path}"
-        if route_key in self.routes:
-            return self.routes[route_key]
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting it on first use"""
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="sufast-async-loop",
+                        daemon=True
+                    ).start()
+                    self._loop = loop
+        return self._loop
+    
+    def _dispatch(self, request_data: bytes, path_data: bytes, _loads=_json.loads) -> bytes:
+        """
+        Handle a dynamic request forwarded by the Rust core
         
-        # Try pattern matching
-        for route_key, route_info in self.routes.items():
-            stored_method, stored_path = route_key.split(':', 1)
-            if stored_method == method:
-                if self._path_matches_pattern(stored_path, path):
-                    return route_info
+        Args:
+            request_data: Request metadata as JSON bytes
+            path_data: Request path as UTF-8 bytes
         
-        return None
+        Returns:
+            Response body as JSON bytes
+        """
+        try:
+            path = path_data.decode('utf-8')
+            
+            # Parse request data
+            request_info = _loads(request_data)
+            method = request_info.get('method', 'GET')
+        except Exception as e:
+            return _INTERNAL_ERROR_BODY
+        
+        return self._handle_request(method, path)
+    
+    def _handle_request(self, method: str, path: str) -> bytes:
+        """Resolve, call and encode a single request"""
+        try:
+            # Find matching route
+            route, build_params, positional, values = self._resolve_route(method, path)
+            
+            # One lock round-trip per request; only requests that reached a
+            # handler count as dynamic hits
+            rust_core = self.rust_core
+            if rust_core:
+                counters = rust_core.counters
+                with rust_core.counter_lock:
+                    counters[_COUNTER_REQUESTS] += 1
+                    if route:
+                        counters[_COUNTER_DYNAMIC_HITS] += 1
+            
+            if route:
+                # Call the handler, positionally when its signature allows
+                try:
+                    if positional:
+                        result = route['handler'](*values)
+                    else:
+                        result = route['handler'](**build_params(values))
+                    
+                    # Coroutines run on the shared event loop
+                    if route['is_async']:
+                        future = asyncio.run_coroutine_threadsafe(result, self._get_event_loop())
+                        result = future.result(self.async_timeout)
+                    
+                    return self._encode_result(result)
+                    
+                except Exception as e:
+                    return _json.dumps({
+                        'error': 'Handler execution failed',
+                        'message': str(e),
+                        'path': path,
+                        'method': method
+                    })
+            
+            # No matching route found
+            return _NOT_FOUND_BODY
+            
+        except Exception as e:
+            return _INTERNAL_ERROR_BODY
     
-    def _path_matches_pattern(self, pattern: str, path: str) -> bool:
-        """Check if path matches pattern with {param} syntax"""
-        pattern_parts = pattern.split('/')
-        path_parts = path.split('/')
+    @staticmethod
+    def _encode_result(result: Any) -> bytes:
+        """
+        Encode a handler result as a JSON response body
+
+        JSON-native results go straight to the serializer without any
+        validation pass; only exotic types take the slower path.
+        """
+        if isinstance(result, dict):
+            # Response-shaped dicts carry a pre-rendered body
+            if 'body' in result:
+                return SufastUltraOptimized._encode_body(result['body'])
+            return _json.dumps(result)
+        if isinstance(result, (RawResponse, Response)):
+            return result.body_bytes
+        if isinstance(result, (bytes, bytearray)):
+            return bytes(result)
+        if isinstance(result, _json.NATIVE_TYPES):
+            return _json.dumps(result)
         
-        if len(pattern_parts) != len(path_parts):
-            return False
+        # Exotic results: Response objects, pydantic models, dataclasses
+        if hasattr(result, 'body'):
+            return SufastUltraOptimized._encode_body(result.body)
+        if hasattr(result, 'model_dump'):
+            return _json.dumps(result.model_dump(), default=str)
+        if hasattr(result, 'dict') and callable(result.dict):
+            return _json.dumps(result.dict(), default=str)
+        if dataclasses.is_dataclass(result) and not isinstance(result, type):
+            return _json.dumps(dataclasses.asdict(result), default=str)
+        return _json.dumps({'result': str(result)})
+    
+    @staticmethod
+    def _encode_body(body: Any) -> bytes:
+        """Encode a pre-rendered response body"""
+        if isinstance(body, (bytes, bytearray)):
+            return bytes(body)
+        return str(body).encode('utf-8')
+    
+    def _add_route_entry(self, method: str, path: str, route_info: dict):
+        """Store a route and index it in the segment trie"""
+        self.routes[f"{method}:{path}"] = route_info
+        if '{' not in path:
+            self._literal_routes[(method, path)] = route_info
+        
+        node = self._route_trie
+        param_names = []
+        for segment in path.split('/'):
+            if segment.startswith('{') and segment.endswith('}'):
+                param_names.append(segment[1:-1])
+                if node.param_child is None:
+                    node.param_child = _RouteTrieNode()
+                node = node.param_child
+            else:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _RouteTrieNode()
+                node = child
+        param_names = tuple(param_names)
+        node.handlers[method] = (
+            route_info,
+            _compile_param_builder(param_names),
+            accepts_positional(route_info['handler'], param_names),
+        )
+        
+        # Cached resolutions may now be stale
+        self._reset_resolve_cache()
+    
+    def _reset_resolve_cache(self):
+        """Rebuild the resolved-route cache sized to the current route table"""
+        size = _resolve_cache_size(len(self.routes))
+        self._resolve_cache = lru_cache(maxsize=size)(self._resolve_uncached)
+    
+    def _find_matching_route(self, method: str, path: str) -> tuple:
+        """
+        Find the route matching method and path
         
-        for pattern_part, path_part in zip(pattern_parts, path_parts):
-            if pattern_part.startswith('{') and pattern_part.endswith('}'):
-                # This is a parameter, it matches any non-empty string
-                if not path_part:
-                    return False
-            elif pattern_part != path_part:
-                # Literal parts must match exactly
-                return False
+        Returns:
+            ``(route_info, params)``, or ``(None, None)`` if nothing matches
+        """
+        route_info, build_params, _, values = self._resolve_route(method, path)
+        if route_info is None:
+            return None, None
+        return route_info, build_params(values)
+    
+    def _resolve_route(self, method: str, path: str) -> tuple:
+        """
+        Resolve a request to ``(route_info, build_params, positional, values)``
         
-        return True
+        ``values`` holds the captured path parameters in order; when
+        ``positional`` is true the handler can be called as ``handler(*values)``.
+        """
+        # Fully literal routes are a single dict lookup
+        route_info = self._literal_routes.get((method, path))
+        if route_info is not None:
+            return route_info, _build_no_params, True, ()
+        return self._resolve_cache(method, path)
     
-    def _extract_parameters(self, pattern: str, path: str) -> dict:
-        """Extract parameter values from path using pattern"""
-        pattern_parts = pattern.split('/')
-        path_parts = path.split('/')
-        params = {}
+    def _resolve_uncached(self, method: str, path: str) -> tuple:
+        """Trie lookup behind the resolved-route cache"""
+        values = []
+        entry = self._match_segments(self._route_trie, path, 0, method, values)
+        if entry is None:
+            return None, None, False, None
+        route_info, build_params, positional = entry
+        return route_info, build_params, positional, tuple(values)
+    
+    def _match_segments(self, node, path: str, start: int,
+                        method: str, values: List[str]):
+        """
+        Walk the trie preferring literal segments over parameters
+        
+        Segments are located with ``str.find`` from ``start`` rather than by
+        splitting the whole path; ``start`` past the end means it is consumed.
+        """
+        if start > len(path):
+            return node.handlers.get(method)
+        
+        end = path.find('/', start)
+        if end == -1:
+            end = len(path)
+        segment = path[start:end]
+        
+        child = node.children.get(segment)
+        if child is not None:
+            entry = self._match_segments(child, path, end + 1, method, values)
+            if entry is not None:
+                return entry
         
-        for pattern_part, path_part in zip(pattern_parts, path_parts):
-            if pattern_part.startswith('{') and pattern_part.endswith('}'):
-                param_name = pattern_part[1:-1]  # Remove { and }
-                params[param_name] = path_part
+        # Parameters match any non-empty segment
+        if segment and node.param_child is not None:
+            values.append(segment)
+            entry = self._match_segments(node.param_child, path, end + 1, method, values)
+            if entry is not None:
+                return entry
+            values.pop()
         
-        return params
+        return None
     
     def _precompile_critical_routes(self):
         """Pre-compile critical routes for fast serving"""
@@ -412,29 +697,10 @@ class SufastUltraOptimized:
             return
             
         try:
-            # Pre-compile essential routes with optimized responses
-            critical_routes = {
-                '/': {
-                    'message': 'Sufast Ultra-Optimized Server v2.0',
-                    'performance': 'Three-tier optimization active',
-                    'timestamp': datetime.utcnow().isoformat()
-                },
-                '/health': {
-                    'status': 'healthy',
-                    'optimization': 'optimized',
-                    'rust_core': self.rust_core.is_loaded,
-                    'cache': 'active'
-                },
-                '/api/status': {
-                    'api': 'active',
-                    'version': '2.0',
-                    'optimization': 'optimized',
-                    'routing': 'three-tier'
-                }
-            }
-            
-            for path, response in critical_routes.items():
-                self.rust_core.add_static_route(path, response, cache_forever=True)
+            # Payloads were serialized once at import
+            for path, payload in _CRITICAL_ROUTE_PAYLOADS.items():
+                self.rust_core.add_static_route(path, payload)
+            self.rust_core.add_static_route('/health', _HEALTH_PAYLOADS[self.rust_core.is_loaded])
             
         except Exception as e:
             pass
@@ -449,13 +715,28 @@ class SufastUltraOptimized:
             cache_ttl: Cache TTL in seconds (0 = no cache, >0 = cache for TTL)
         """
         def decorator(func):
+            is_async = asyncio.iscoroutinefunction(func)
+            if is_async:
+                self._get_event_loop()
+            path_bytes = path.encode('utf-8')
+            
             for method in methods:
-                route_key = f"{method}:{path}"
-                
                 # Determine optimization strategy
                 is_static = cache_ttl < 0  # -1 means static route
                 should_cache = cache_ttl > 0
                 
+                route_info = {
+                    'handler': func,
+                    'methods': methods,
+                    'path': path,
+                    'cache_ttl': cache_ttl,
+                    'is_static': is_static,
+                    'should_cache': should_cache,
+                    'is_async': is_async,
+                    'path_bytes': path_bytes,
+                    'method_bytes': method.encode('utf-8')
+                }
+                
                 if is_static and self.rust_core:
                     # For static routes, pre-compute response
                     try:
@@ -471,43 +752,51 @@ class SufastUltraOptimized:
                     except Exception as e:
                         pass  # Pre-compilation failed, will use dynamic route
                         # Fall back to dynamic route
-                        self._register_dynamic_route(method, path, func, cache_ttl)
+                        self._register_dynamic_route(method, route_info)
                 else:
                     # Register as dynamic route with optional caching
-                    self._register_dynamic_route(method, path, func, cache_ttl)
+                    self._register_dynamic_route(method, route_info)
                 
                 # Store in Python routes for fallback
-                self.routes[route_key] = {
-                    'handler': func,
-                    'methods': methods,
-                    'path': path,
-                    'cache_ttl': cache_ttl,
-                    'is_static': is_static,
-                    'should_cache': should_cache
-                }
+                self._add_route_entry(method, path, route_info)
             
             return func
         return decorator
     
-    def _register_dynamic_route(self, method: str, path: str, handler: Callable, cache_ttl: int):
-        """Register dynamic route with Rust core"""
+    def _register_dynamic_route(self, method: str, route_info: dict):
+        """Register dynamic route with Rust core using its pre-encoded keys"""
         if self.rust_core:
-            self.rust_core.add_dynamic_route(method, path, handler, cache_ttl)
+            self.rust_core.add_dynamic_route(
+                method,
+                route_info['path'],
+                route_info['handler'],
+                route_info['cache_ttl'],
+                method_bytes=route_info['method_bytes'],
+                path_bytes=route_info['path_bytes']
+            )
     
-    def static_route(self, path: str, response_data: dict):
-        """Add ultra-fast static route"""
+    def static_route(self, path: str, response_data: Union[dict, bytes]):
+        """
+        Add ultra-fast static route
+
+        Args:
+            path: Route path
+            response_data: Response dict, or pre-serialized JSON bytes
+                (the caller is responsible for the bytes being valid JSON)
+        """
         if self.rust_core:
             return self.rust_core.add_static_route(path, response_data)
         else:
             # Python fallback
-            self.routes[f"GET:{path}"] = {
+            self._add_route_entry('GET', path, {
                 'handler': lambda: response_data,
                 'methods': ['GET'],
                 'path': path,
                 'cache_ttl': -1,
                 'is_static': True,
-                'should_cache': False
-            }
+                'should_cache': False,
+                'is_async': False
+            })
             return True
     
     def cached_route(self, path: str, methods: List[str] = ["GET"], ttl: int = 60):
@@ -517,7 +806,71 @@ class SufastUltraOptimized:
     def dynamic_route(self, path: str, methods: List[str] = ["GET"]):
         """Add dynamic route"""
         return self.route(path, methods, cache_ttl=0)
+
+    def fused_dynamic_route(self, path: str, methods: List[str] = ["GET"]):
+        """
+        Add dynamic route that serializes its result inside the handler call
+
+        The registered handler returns the final JSON body as bytes, so the
+        dispatch path passes it straight through to the core without
+        inspecting the result or building a Response object.
+        """
+        def decorator(func):
+            dumps = _json.dumps
+            encode = self._encode_result
+            
+            if asyncio.iscoroutinefunction(func):
+                # Stay a coroutine function so the route is marked async
+                # and dispatch awaits it on the shared event loop
+                @wraps(func)
+                async def fused(*args, **kwargs):
+                    result = await func(*args, **kwargs)
+                    if type(result) is dict:
+                        return dumps(result)
+                    return encode(result)
+            else:
+                @wraps(func)
+                def fused(*args, **kwargs):
+                    result = func(*args, **kwargs)
+                    if type(result) is dict:
+                        return dumps(result)
+                    return encode(result)
+            
+            self.route(path, methods, cache_ttl=0)(fused)
+            return func
+        return decorator
     
+    def register_batch(self, specs: List[tuple]) -> int:
+        """
+        Register several routes in a single call
+
+        Args:
+            specs: ``(path, kind, handler, opts)`` tuples where ``kind`` is one of
+                "static", "cached", "dynamic", "fused" or "route". For static routes
+                ``handler`` is the response payload; ``opts`` are passed on as
+                keyword arguments to the matching decorator.
+
+        Returns:
+            Number of routes registered
+        """
+        registered = 0
+        for path, kind, handler, opts in specs:
+            opts = opts or {}
+            if kind == "static":
+                self.static_route(path, handler)
+            elif kind == "cached":
+                self.cached_route(path, **opts)(handler)
+            elif kind == "dynamic":
+                self.dynamic_route(path, **opts)(handler)
+            elif kind == "fused":
+                self.fused_dynamic_route(path, **opts)(handler)
+            elif kind == "route":
+                self.route(path, **opts)(handler)
+            else:
+                raise ValueError(f"Unknown route kind: {kind}")
+            registered += 1
+        return registered
+
     def middleware(self, middleware_func: Callable):
         """Add middleware to the processing stack"""
         self.middleware_stack.append(middleware_func)
@@ -558,10 +911,8 @@ class SufastUltraOptimized:
         
         This will attempt to use the Rust core for performance,
         falling back to Python implementation if Rust core is not available.
+        Blocks until SIGINT or ``stop()``.
         """
-        pass  # Starting server
-        pass  # Server will start on specified host and port
-        
         if self.rust_core and self.rust_core.is_loaded:
             try:
                 # Start Rust-powered server
@@ -571,15 +922,7 @@ class SufastUltraOptimized:
                 )
                 if result == 0:  # 0 means success in C convention
                     # Keep the process alive since Rust server is running
-                    try:
-                        pass  # Server running
-                        import threading
-                        # Keep main thread alive
-                        while True:
-                            time.sleep(1)
-                    except KeyboardInterrupt:
-                        pass  # Server stopped by user
-                        return
+                    self._wait_for_shutdown()
                 else:
                     self._run_python_fallback(host, port, debug)
                     
@@ -589,17 +932,41 @@ class SufastUltraOptimized:
             pass  # Using Python fallback implementation
             self._run_python_fallback(host, port, debug)
     
+    def stop(self):
+        """Stop the Rust server if it supports it and release ``run()``"""
+        core = self.rust_core
+        if core and core.is_loaded:
+            stop_server = getattr(core.lib, 'stop_sufast_server', None)
+            if stop_server is not None:
+                try:
+                    stop_server()
+                except Exception as e:
+                    pass
+        self._shutdown_event.set()
+    
+    def _wait_for_shutdown(self):
+        """Block until SIGINT or ``stop()``"""
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: self.stop())
+        try:
+            # Short timed waits: an untimed wait() is not woken by Ctrl+C
+            # on every platform, so the SIGINT handler might never run
+            while not self._shutdown_event.wait(0.2):
+                pass
+        finally:
+            # Re-arm so the app can be run again
+            self._shutdown_event.clear()
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+    
     def _run_python_fallback(self, host: str, port: int, debug: bool):
         """Run Python-only server as fallback"""
         pass  # Starting Python fallback server
         
         # Simple HTTP server implementation would go here
         # For now, just keep the process alive
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            pass  # Server stopped by user
+        self._wait_for_shutdown()
 
 
 # Global server instance
@@ -640,22 +1007,69 @@ class Response:
         if content_type not in self.headers:
             self.headers['Content-Type'] = content_type
         
-        # Serialize data based on type
+        # Serialize data based on type; ``body_bytes`` keeps the encoded
+        # form so the dispatch path does not re-encode it
         if isinstance(data, (dict, list)):
-            self.body = json.dumps(data)
+            self.body_bytes = _json.dumps(data)
+            self._body = self.body_bytes.decode('utf-8')
             self.json = data
         elif isinstance(data, str):
             self.body = data
             if content_type == "application/json":
                 try:
-                    self.json = json.loads(data)
-                except json.JSONDecodeError:
+                    self.json = _json.loads(self.body_bytes)
+                except _json.JSONDecodeError:
                     self.json = {"message": data}
             else:
                 self.json = {"message": data}
         else:
             self.body = str(data) if data is not None else ""
             self.json = {"message": self.body}
+    
+    @property
+    def body(self) -> str:
+        """Response body as text"""
+        return self._body
+    
+    @body.setter
+    def body(self, value: str):
+        self._body = value
+        self.body_bytes = value.encode('utf-8')
+
+
+class RawResponse:
+    """
+    Pre-serialized response returned by a handler
+    
+    The dispatch path hands ``body_bytes`` to the core untouched, with no
+    encoding step.
+    """
+    
+    __slots__ = ('body_bytes', 'status', 'ctype')
+    
+    def __init__(self, body_bytes: bytes, status: int = 200,
+                 ctype: str = "application/json"):
+        self.body_bytes = body_bytes
+        self.status = status
+        self.ctype = ctype
+
+
+def cached_response(func: Callable) -> Callable:
+    """
+    Memoize a handler's encoded result per set of arguments
+    
+    The first call for given path parameters runs the handler and stores
+    the encoded body as a ``RawResponse``; later calls return it directly.
+    Only use for handlers whose output depends solely on their arguments.
+    """
+    @lru_cache(maxsize=4096)
+    def cached(*args, **kwargs):
+        result = func(*args, **kwargs)
+        if isinstance(result, RawResponse):
+            return result
+        return RawResponse(SufastUltraOptimized._encode_result(result))
+    
+    return wraps(func)(cached)
 
 
 # Legacy Sufast_server class for backward compatibility
@@ -684,69 +1098,105 @@ class Sufast_server:
 
 
 # === CONVENIENCE FUNCTIONS ===
+# (second, formatted "YYYY-MM-DDTHH:MM:SS") for the most recent timestamp
+_timestamp_cache = (-1, '')
+
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp; the date/time part is formatted once per second"""
+    global _timestamp_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1000000):06d}"
+
+def _announce(*lines: str) -> None:
+    """Write a banner in a single stdout call unless SUFAST_QUIET is set
+
+    Only used when the module runs as a script; library helpers stay silent.
+    """
+    if os.environ.get("SUFAST_QUIET"):
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def create_app(enable_rust_optimization: bool = True) -> SufastUltraOptimized:
     """Create a new ultra-optimized Sufast_server application"""
     return SufastUltraOptimized(enable_rust_optimization)
 
-def quick_static_app(routes: Dict[str, dict]) -> SufastUltraOptimized:
-    """Create an app with pre-compiled static routes for maximum performance"""
+def quick_static_app(routes: Mapping[str, Union[dict, bytes]]) -> SufastUltraOptimized:
+    """
+    Create an app with pre-compiled static routes for maximum performance
+
+    Values may be dicts or pre-serialized JSON bytes (e.g. straight from
+    ``Path.read_bytes()``); bytes must be valid JSON and are not re-encoded.
+    """
     app = create_app()
     
     for path, response in routes.items():
         app.static_route(path, response)
     
-    pass  # Quick static app created
     return app
 
+@lru_cache(maxsize=1)
 def benchmark_app() -> SufastUltraOptimized:
-    """Create a benchmark app to test performance"""
+    """
+    Create a benchmark app to test performance
+
+    The app is built once and shared; repeated calls (e.g. from test
+    fixtures) return the same instance without re-registering routes.
+    """
     app = create_app()
-    
-    # Add performance test routes
-    app.static_route("/benchmark/static", {
-        "test": "static_route",
-        "performance": "High",
-        "optimization": "rust_precompiled"
-    })
-    
-    @app.cached_route("/benchmark/cached", ttl=60)
+
     def cached_benchmark():
         return {
             "test": "cached_route", 
             "performance": "Medium",
             "optimization": "intelligent_ttl_cache",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utc_timestamp()
         }
     
-    @app.dynamic_route("/benchmark/dynamic")
     def dynamic_benchmark():
         return {
             "test": "dynamic_route",
-            "performance": "Standard", 
+            "performance": "Standard",
             "optimization": "python_processing",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "random": time.time()
         }
-    
-    @app.route("/benchmark/stats")
+
     def benchmark_stats():
         return app.get_performance_stats()
-    
-    pass  # Benchmark app created
+
+    # Register all performance test routes in one sweep
+    app.register_batch([
+        ("/benchmark/static", "static", {
+            "test": "static_route",
+            "performance": "High",
+            "optimization": "rust_precompiled"
+        }, None),
+        ("/benchmark/cached", "cached", cached_benchmark, {"ttl": 60}),
+        ("/benchmark/dynamic", "fused", dynamic_benchmark, None),
+        ("/benchmark/stats", "route", benchmark_stats, None),
+    ])
+
     return app
 
 
 # === MAIN EXECUTION ===
 if __name__ == "__main__":
-    pass  # Sufast server initialized
-    pass  # Three-tier optimization ready
-    
     # Create benchmark app for testing
     app = benchmark_app()
     
     # Display performance stats
     stats = app.get_performance_stats()
-    pass  # Performance statistics available
+    _announce(
+        "Sufast server initialized - three-tier optimization ready",
+        "Performance statistics:",
+        _json.dumps(stats, default=str, indent=True).decode('utf-8'),
+        "Starting server on http://127.0.0.1:8000",
+    )
     
     # Start server
     try:
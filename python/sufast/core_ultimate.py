@@ -7,27 +7,247 @@ Three-tier architecture:
 """
 
 import ctypes
-import json
+import hashlib
+import html
+import queue
 import re
 import threading
+from functools import lru_cache
 from pathlib import Path
+from . import _json
+from ._signatures import accepted_params, accepts_positional
+from .logging import configure_logging, get_logger
 from .middleware import MiddlewareStack
 from .request import Request, Response
+from .swagger import read_docui_asset
+
+# Rust -> Python callback: (method, path, params JSON) -> address of the
+# NUL-terminated reply, in the core's reply arena or a Python-owned buffer
+_PythonCallback = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p)
+
+# Callback for routes the core matched itself: (route id, method, path,
+# params JSON) -> reply address, as above
+_RouteCallback = ctypes.CFUNCTYPE(
+    ctypes.c_void_p, ctypes.c_uint32, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p
+)
+
+_log = get_logger("sufast.ultimate")
+
+# Callback errors are logged from a daemon thread, so a burst of failing
+# requests never waits on stderr; past the bound new ones are dropped
+_CALLBACK_ERRORS = queue.Queue(maxsize=1024)
+_callback_error_logger = None
+_callback_error_lock = threading.Lock()
+
+
+def _drain_callback_errors():
+    while True:
+        _log.error("Ultra-fast callback error", error=_CALLBACK_ERRORS.get())
+
+
+def _report_callback_error(message):
+    """Queue a callback error for the background logger."""
+    global _callback_error_logger
+    if _callback_error_logger is None:
+        with _callback_error_lock:
+            if _callback_error_logger is None:
+                _callback_error_logger = threading.Thread(
+                    target=_drain_callback_errors, name="sufast-error-log", daemon=True
+                )
+                _callback_error_logger.start()
+    try:
+        _CALLBACK_ERRORS.put_nowait(message)
+    except queue.Full:
+        pass
+
+
+# Method names as sent by the core, mapped to the interned strings used in route keys
+_METHOD_NAMES = {m.encode('ascii'): m for m in ('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS')}
+
+# Encoded forms handed to the core at registration
+_METHOD_BYTES = {name: raw for raw, name in _METHOD_NAMES.items()}
+_CONTENT_TYPE_BYTES = {'application/json': b'application/json'}
+
+# Per-thread reply buffer: initial size, and the size above which it is
+# shrunk back once replies are small again
+_REPLY_BUFFER_SIZE = 4096
+_REPLY_BUFFER_HIGH = 64 * 1024
+
+class _ReplyStorage(threading.local):
+    """Per-thread reply buffer, created empty on a thread's first callback."""
+
+    def __init__(self):
+        self.buf = None
+        self.view = None
+        self.address = None
+
+
+# "{name}" placeholders in route paths, and named groups in compiled patterns
+_PARAM_RE = re.compile(r'\{(\w+)\}')
+_NAMED_GROUP_RE = re.compile(r'\(\?P<(\w+)>')
+
+
+def _compile_route_call(groups):
+    """Generate ``call(handler, match)`` passing the named groups positionally."""
+    args = ", ".join(f"match.group({group!r})" for group in groups)
+    namespace = {}
+    exec(f"def call(handler, match):\n    return handler({args})\n", namespace)
+    return namespace['call']
+
+
+def _call_with_params(handler, accepted, params):
+    """Call the handler with the ``params`` its signature takes, if any."""
+    if accepted is not None:
+        params = {name: value for name, value in params.items() if name in accepted}
+    return handler(**params) if params else handler()
+
+
+# Callback reply with a JSON body; only the body and status vary per request
+_ENVELOPE_TEMPLATE = b'{"body":%b,"status":%d,"headers":{"Content-Type":"application/json"}}'
+
+# Headers given to a plain JSON Response
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+# Headers of a plain JSON Response once formatted by Response.to_dict, and
+# the matching reply template with them encoded once
+_DEFAULT_REPLY_HEADERS = {"Content-Type": "application/json", "content-type": "application/json"}
+_DEFAULT_REPLY_TEMPLATE = b'{"body":%b,"status":%d,"headers":' + _json.dumps(_DEFAULT_REPLY_HEADERS) + b'}'
+
+
+# 404 body; path, method and the route list are spliced in already encoded.
+# The route list is only exposed while docs are enabled
+_NOT_FOUND_TEMPLATE = '{"error":"Route not found","path":%s,"method":%s,"available_routes":%s}'
+_NOT_FOUND_BARE_TEMPLATE = '{"error":"Route not found","path":%s,"method":%s}'
+
+
+def _envelope(body: str, status: int = 200) -> bytes:
+    """Build the callback reply around an already-serialized body."""
+    return _ENVELOPE_TEMPLATE % (_json.dumps(body), status)
+
+
+def _js_arg(value):
+    """``value`` as a JS string literal, escaped for an inline event handler.
+
+    The browser HTML-decodes the attribute before running it, so the value
+    is JSON-encoded first and only then HTML-escaped.
+    """
+    return html.escape(_json.dumps(value).decode('utf-8'))
+
+
+def _handler_error(e):
+    """500 response for a handler that raised TypeError."""
+    return {
+        "body": _json.dumps({"error": f"Handler error: {str(e)}"}).decode('utf-8'),
+        "status": 500,
+        "headers": {"Content-Type": "application/json"}
+    }
+
+
+def _by_type(table, value, default):
+    """Pick ``table[type(value)]``, falling back to isinstance for subclasses."""
+    handler = table.get(type(value))
+    if handler is not None:
+        return handler
+    for kind, candidate in table.items():
+        if isinstance(value, kind):
+            return candidate
+    return default
+
+
+# Callback replies: handler result -> reply bytes
+
+def _reply_from_dict(response):
+    if 'body' in response and 'status' in response:
+        # Already formatted response; the usual JSON headers are spliced
+        # in pre-encoded
+        status = response['status']
+        if response.get('headers') == _DEFAULT_REPLY_HEADERS and type(status) is int:
+            return _DEFAULT_REPLY_TEMPLATE % (_json.dumps(response['body']), status)
+        return _json.dumps(response)
+    # Convert data to response format
+    return _envelope(_json.dumps(response).decode('utf-8'))
+
+
+def _reply_from_tuple(response):
+    if len(response) != 2:
+        return _reply_from_other(response)
+    # Handle (data, status) tuple
+    data, status = response
+    body = _json.dumps(data).decode('utf-8') if isinstance(data, dict) else str(data)
+    return _envelope(body, int(status))
+
+
+def _reply_from_other(response):
+    return _envelope(str(response))
+
+
+def _reply_from_response(response, inline_json):
+    """Encode a Response, serializing plain JSON content only once.
+
+    With ``inline_json`` the core takes the encoded content itself as the
+    body; otherwise it is embedded as a JSON string. Any other shape goes
+    through ``Response.to_dict``, as do subclasses, which may override it.
+    """
+    content = response.content
+    status = response.status
+    if (type(response) is Response and type(content) is dict and type(status) is int
+            and response._cookies is None
+            and response.content_type == 'application/json'
+            and response.headers == _JSON_CONTENT_TYPE):
+        body = _json.dumps(content)
+        if not inline_json:
+            body = _json.dumps(body.decode('utf-8'))
+        return _DEFAULT_REPLY_TEMPLATE % (body, status)
+    return _reply_from_dict(response.to_dict())
+
+
+_REPLY_ENCODERS = {dict: _reply_from_dict, tuple: _reply_from_tuple}
+
+
+# Static routes: handler result -> (body, status, content type)
+
+def _static_from_dict(response):
+    if 'body' in response:
+        return (response['body'], response.get('status', 200),
+                response.get('headers', {}).get('Content-Type', 'application/json'))
+    return _json.dumps(response).decode('utf-8'), 200, 'application/json'
+
+
+def _static_from_tuple(response):
+    if len(response) != 2:
+        return _static_from_other(response)
+    data, status = response
+    return (_json.dumps(data).decode('utf-8') if isinstance(data, dict) else str(data)), status, 'application/json'
+
+
+def _static_from_other(response):
+    return str(response), 200, 'application/json'
+
+
+_STATIC_NORMALIZERS = {dict: _static_from_dict, tuple: _static_from_tuple}
+
 
 class Sufast:
     """Ultimate Sufast framework with three-tier performance optimization."""
-    print("🚀 Welcome to Sufast - The Ultimate Python Web Framework")
-    print("\n")
     
     def __init__(self):
         self.routes = {}
         self.static_routes = {}
         self.dynamic_routes = {}
+        self._dynamic_routes_by_method = {}  # method -> {route_key: handler_info}
+        self._exact_routes = {}  # (method, path) -> handler, mirrors self.routes for lookups
+        self._dynamic_matchers = {}  # method -> fused regex, rebuilt lazily
         self.cached_routes = {}
+        self._routes_index_json = None  # JSON list of route keys for 404 bodies, built lazily
+        self._pending_static = []  # (route_key, body, status, content_type) awaiting one batch call
         self.route_metadata = {}  # Store route metadata for auto-docs
         self.docs_enabled = False  # Track if docs should be available
+        self._docs_cache = None  # (route keys, rendered /docs page), reset when route metadata changes
+        self._docs_assets_served = False  # CSS/JS registered as static routes
         self.rust_core = None
-        self._response_storage = threading.local()
+        self._inline_json_body = False  # core accepts any JSON value as the reply body
+        self._route_table = None  # route id -> handler_info, when the core dispatches by id
+        self._response_storage = _ReplyStorage()
         self.middleware_stack = MiddlewareStack()  # Initialize middleware stack
         self._load_ultimate_rust_core()
         
@@ -46,7 +266,7 @@ class Sufast:
                     self._setup_ultimate_ffi()
                     return
                 except Exception as e:
-                    print(f"⚠️ Failed to load {lib_path}: {e}")
+                    _log.warning("Failed to load Rust core", path=str(lib_path), error=str(e))
         
         raise RuntimeError("❌ Could not load ultimate Rust core")
 
@@ -66,8 +286,7 @@ class Sufast:
             self.rust_core.add_dynamic_route.restype = ctypes.c_bool
             
             # Ultra-fast Python callback registration (3 parameters)
-            PythonCallback = ctypes.CFUNCTYPE(ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p)
-            self.rust_core.set_python_callback.argtypes = [PythonCallback]
+            self.rust_core.set_python_callback.argtypes = [_PythonCallback]
             self.rust_core.set_python_callback.restype = None
             
             # Fast server start
@@ -86,6 +305,29 @@ class Sufast:
             self.rust_core.precompile_static_routes.argtypes = []
             self.rust_core.precompile_static_routes.restype = ctypes.c_uint64
             
+            # Dynamic routes registered by id and dispatched straight to
+            # their handler (older builds lack it)
+            if hasattr(self.rust_core, 'add_dynamic_route_with_id'):
+                self.rust_core.add_dynamic_route_with_id.argtypes = [
+                    ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint64, ctypes.c_uint32
+                ]
+                self.rust_core.add_dynamic_route_with_id.restype = ctypes.c_bool
+                self.rust_core.set_python_route_callback.argtypes = [_RouteCallback]
+                self.rust_core.set_python_route_callback.restype = None
+                self._route_table = []
+            
+            # Cores that parse a JSON reply body themselves
+            self._inline_json_body = hasattr(self.rust_core, 'supports_inline_json_body')
+            
+            # Bulk static registration, flushed once at server start
+            if hasattr(self.rust_core, 'add_static_routes_batch'):
+                self.rust_core.add_static_routes_batch.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+                self.rust_core.add_static_routes_batch.restype = ctypes.c_uint64
+            
+            # Reply arena owned by the core (older builds lack it)
+            if hasattr(self.rust_core, 'alloc_response'):
+                self.rust_core.alloc_response.argtypes = [ctypes.c_size_t]
+                self.rust_core.alloc_response.restype = ctypes.c_void_p
             
             # Register ultra-fast Python callback
             self._register_ultimate_callback()
@@ -98,93 +340,104 @@ class Sufast:
             raise RuntimeError(f"❌ Failed to setup ultra-fast FFI: {e}")
 
     def _register_ultimate_callback(self):
-        """Register the ultra-fast Python callback for dynamic routes."""
+        """Register the ultra-fast Python callbacks for dynamic routes."""
+        def parse_params(params_ptr):
+            # orjson reads the bytes directly; paths the core did not match
+            # arrive with an empty object
+            if params_ptr == b'{}':
+                return {}
+            try:
+                return _json.loads(params_ptr)
+            except Exception:
+                return {}
+        
+        def encode(response):
+            # Convert response to optimized JSON format; Response subclasses
+            # take the Response path too
+            if isinstance(response, Response):
+                return _reply_from_response(response, inline_json)
+            return _by_type(_REPLY_ENCODERS, response, _reply_from_other)(response)
+        
+        def error_reply(e):
+            _report_callback_error(str(e))
+            return _envelope(
+                _json.dumps({"error": f"Internal server error: {str(e)}"}).decode('utf-8'), 500
+            )
+        
         def ultra_fast_python_callback(method_ptr, path_ptr, params_ptr):
             try:
-                method = ctypes.string_at(method_ptr).decode('utf-8')
-                path = ctypes.string_at(path_ptr).decode('utf-8')
-                params_json = ctypes.string_at(params_ptr).decode('utf-8')
-                
-                # Parse parameters ultra-fast
-                try:
-                    params = json.loads(params_json)
-                except:
-                    params = {}
+                # c_char_p arguments already arrive as bytes
+                method = _METHOD_NAMES.get(method_ptr) or method_ptr.decode('utf-8')
+                path = path_ptr.decode('utf-8')
                 
                 # Handle dynamic route with ultra-fast processing
-                response = self._handle_ultra_fast_dynamic_route(method, path, params)
-                
-                # Convert response to optimized JSON format
-                if isinstance(response, dict):
-                    if 'body' in response and 'status' in response:
-                        # Already formatted response - check content type for HTML
-                        headers = response.get('headers', {})
-                        content_type = headers.get('Content-Type', '')
-                        
-                        if 'text/html' in content_type:
-                            # For HTML responses, return as-is without double JSON encoding
-                            response_json = json.dumps(response)
-                        else:
-                            # For JSON responses, handle normally
-                            response_json = json.dumps(response)
-                    else:
-                        # Convert data to response format
-                        response_json = json.dumps({
-                            "body": json.dumps(response),
-                            "status": 200,
-                            "headers": {"Content-Type": "application/json"}
-                        })
-                elif isinstance(response, tuple) and len(response) == 2:
-                    # Handle (data, status) tuple
-                    data, status = response
-                    response_json = json.dumps({
-                        "body": json.dumps(data) if isinstance(data, dict) else str(data),
-                        "status": status,
-                        "headers": {"Content-Type": "application/json"}
-                    })
-                else:
-                    response_json = json.dumps({
-                        "body": json.dumps(response) if isinstance(response, dict) else str(response),
-                        "status": 200,
-                        "headers": {"Content-Type": "application/json"}
-                    })
-                
-                # Create ultra-fast C string with memory pool
-                result_bytes = response_json.encode('utf-8')
-                result = ctypes.create_string_buffer(result_bytes)
-                
-                # Store in thread-local buffer to prevent memory leaks
-                if not hasattr(self._response_storage, 'buffer'):
-                    self._response_storage.buffer = []
-                
-                self._response_storage.buffer.append(result)
-                
-                # Limit buffer size for memory efficiency
-                if len(self._response_storage.buffer) > 50:
-                    self._response_storage.buffer = self._response_storage.buffer[-25:]
-                
-                return ctypes.cast(result, ctypes.c_char_p).value
-                
+                response = self._handle_ultra_fast_dynamic_route(method, path, parse_params(params_ptr))
+                result_bytes = encode(response)
             except Exception as e:
-                print(f"❌ Ultra-fast callback error: {e}")
-                error_response = json.dumps({
-                    "body": json.dumps({"error": f"Internal server error: {str(e)}"}),
-                    "status": 500,
-                    "headers": {"Content-Type": "application/json"}
-                })
+                result_bytes = error_reply(e)
+            
+            return write(result_bytes)
+        
+        def python_route_callback(route_id, method_ptr, path_ptr, params_ptr):
+            # The core already matched the route and extracted its params
+            try:
+                method = _METHOD_NAMES.get(method_ptr) or method_ptr.decode('utf-8')
+                path = path_ptr.decode('utf-8')
                 
-                result_bytes = error_response.encode('utf-8')
-                result = ctypes.create_string_buffer(result_bytes)
-                return ctypes.cast(result, ctypes.c_char_p).value
+                response = self._handle_ultra_fast_dynamic_route(
+                    method, path, parse_params(params_ptr), route_table[route_id]
+                )
+                result_bytes = encode(response)
+            except Exception as e:
+                result_bytes = error_reply(e)
+            
+            return write(result_bytes)
+        
+        route_table = self._route_table
+        inline_json = self._inline_json_body
+        storage = self._response_storage
+        alloc_response = getattr(self.rust_core, 'alloc_response', None)
+        
+        def write_arena_reply(data):
+            # Copy the reply into the core's per-thread arena; it owns the
+            # memory, so nothing has to be kept alive on this side
+            size = len(data)
+            address = alloc_response(size)
+            ctypes.memmove(address, data, size)
+            return address
+        
+        def write_reply(data):
+            # Copy the reply NUL-terminated into this thread's reusable buffer.
+            # It is only reallocated when too small, or shrunk back once a
+            # large reply has passed; Rust copies it before the next callback
+            size = len(data)
+            buf = storage.buf
+            if buf is None or size >= len(buf) or (
+                    len(buf) > _REPLY_BUFFER_HIGH and size < _REPLY_BUFFER_SIZE):
+                capacity = _REPLY_BUFFER_SIZE
+                while capacity <= size:
+                    capacity *= 2
+                buf = storage.buf = bytearray(capacity)
+                storage.view = (ctypes.c_char * capacity).from_buffer(buf)
+                storage.address = ctypes.addressof(storage.view)
+            buf[:size] = data
+            buf[size] = 0
+            return storage.address
+        
+        write = write_arena_reply if alloc_response is not None else write_reply
         
         # Create ultra-fast callback function with 3 parameters
-        callback_func = ctypes.CFUNCTYPE(ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p)(ultra_fast_python_callback)
+        callback_func = _PythonCallback(ultra_fast_python_callback)
         
         # Store reference to prevent garbage collection
         self._callback_func_ref = callback_func
         
         # Register with Rust
         self.rust_core.set_python_callback(callback_func)
+        
+        if route_table is not None:
+            self._route_callback_ref = _RouteCallback(python_route_callback)
+            self.rust_core.set_python_route_callback(self._route_callback_ref)
 
     def add_middleware(self, middleware):
         """Add middleware to the middleware stack.
@@ -193,10 +446,14 @@ class Sufast:
             middleware: Middleware instance (must have process_request and process_response methods)
         """
         self.middleware_stack.add(middleware)
-        print(f"🛡️ Added middleware: {middleware.__class__.__name__}")
+        _log.debug("Added middleware", middleware=middleware.__class__.__name__)
 
-    def _handle_ultra_fast_dynamic_route(self, method, path, params):
-        """Handle dynamic route with ultra-fast parameter processing and middleware."""
+    def _handle_ultra_fast_dynamic_route(self, method, path, params, handler_info=None):
+        """Handle dynamic route with ultra-fast parameter processing and middleware.
+        
+        ``handler_info`` is given when the core already matched the route;
+        ``params`` then holds everything the handler needs.
+        """
         
         # Create Request object for middleware
         request = Request(
@@ -212,91 +469,86 @@ class Sufast:
         middleware_response = self.middleware_stack.process_request(request)
         if middleware_response:
             # Middleware short-circuited, return its response
-            return self._format_response(middleware_response)
+            return middleware_response
         
-        route_key = f"{method}:{path}"
-        
-        # Try exact match first (fastest path)
-        if route_key in self.routes:
-            handler = self.routes[route_key]
+        # Try exact match first (fastest path): one probe with a tuple key,
+        # no string building per request. Routes the core matched go through
+        # it too, so a literal route always wins over an overlapping pattern
+        handler = self._exact_routes.get((method, path))
+        if handler is not None:
             response = handler()
+        elif handler_info is not None:
+            # Routed by the core: no matching left to do here
+            handler = handler_info['handler']
+            try:
+                response = _call_with_params(handler, handler_info['accepted_params'], params)
+            except TypeError as e:
+                response = _handler_error(e)
         else:
             # Ultra-fast pattern matching for dynamic routes
             response = None
-            for pattern_key, handler_info in self.dynamic_routes.items():
-                if method in pattern_key:
-                    regex = handler_info['regex']
-                    match = regex.match(path)
-                    if match:
-                        # Extract parameters ultra-fast
-                        extracted_params = match.groupdict()
-                        
-                        # Merge with any additional params
-                        final_params = {**extracted_params, **params}
-                        
-                        # Call handler with parameters
-                        handler = handler_info['handler']
-                        
-                        try:
-                            if final_params:
-                                # Call with extracted parameters
-                                response = handler(**final_params)
-                            else:
-                                # Call without parameters
-                                response = handler()
-                        except TypeError:
-                            # Handle case where handler doesn't accept parameters
-                            try:
-                                response = handler()
-                            except Exception as e:
-                                response = {
-                                    "body": json.dumps({"error": f"Handler error: {str(e)}"}),
-                                    "status": 500,
-                                    "headers": {"Content-Type": "application/json"}
-                                }
-                        break
+            matcher = self._dynamic_matchers.get(method) or self._build_dynamic_matcher(method)
+            fused, targets = matcher
+            match = fused.match(path) if fused is not None else None
+            if match:
+                # The outermost group that matched names the route
+                handler_info, param_groups, call = targets[match.lastgroup]
+                handler = handler_info['handler']
             
+                try:
+                    if call is not None and not params:
+                        # Generated at registration: captured groups go
+                        # straight in as positional arguments
+                        response = call(handler, match)
+                    else:
+                        # Extract parameters and merge with any additional
+                        # params; only the names the handler takes are passed
+                        extracted_params = {name: match.group(group) for group, name in param_groups}
+                        final_params = {**extracted_params, **params} if params else extracted_params
+                        response = _call_with_params(handler, handler_info['accepted_params'], final_params)
+                except TypeError as e:
+                    # Arity is settled at registration, so this is the
+                    # handler's own error: report it, don't retry
+                    response = _handler_error(e)
+        
             if response is None:
-                # Return 404 if no route found
+                # Return 404 if no route found; the route list is encoded
+                # once per registration change, not per miss
+                where = (_json.dumps(path).decode('utf-8'), _json.dumps(method).decode('utf-8'))
+                if self.docs_enabled:
+                    routes_index = self._routes_index_json
+                    if routes_index is None:
+                        routes_index = self._routes_index_json = _json.dumps(list(self.routes)).decode('utf-8')
+                    body = _NOT_FOUND_TEMPLATE % (where + (routes_index,))
+                else:
+                    body = _NOT_FOUND_BARE_TEMPLATE % where
                 response = {
-                    "body": json.dumps({
-                        "error": "Route not found",
-                        "path": path,
-                        "method": method,
-                        "available_routes": list(self.routes.keys())
-                    }),
+                    "body": body,
                     "status": 404,
                     "headers": {"Content-Type": "application/json"}
                 }
-        
+    
         # Convert response to Response object if needed
         if not isinstance(response, Response):
             response = self._dict_to_response(response)
         
         # Process response through middleware stack
-        final_response = self.middleware_stack.process_response(request, response)
-        
-        return self._format_response(final_response)
+        # The callback encodes whatever comes back, Response or dict
+        return self.middleware_stack.process_response(request, response)
     
     def _dict_to_response(self, response_dict):
         """Convert dictionary response to Response object."""
         if isinstance(response_dict, dict):
-            body = response_dict.get('body', json.dumps(response_dict))
+            # Plain data stays structured until the reply is encoded
+            body = response_dict['body'] if 'body' in response_dict else response_dict
             status = response_dict.get('status', 200)
             headers = response_dict.get('headers', {"Content-Type": "application/json"})
             return Response(content=body, status=status, headers=headers)
         else:
             # Simple response (string or dict)
-            body = json.dumps(response_dict) if isinstance(response_dict, dict) else str(response_dict)
+            body = _json.dumps(response_dict).decode('utf-8') if isinstance(response_dict, dict) else str(response_dict)
             return Response(content=body, status=200, headers={"Content-Type": "application/json"})
     
-    def _format_response(self, response):
-        """Format Response object back to dictionary for Rust layer."""
-        if isinstance(response, Response):
-            return response.to_dict()
-        else:
-            return response
-
     def route(self, path: str, cache_ttl: int = 0, static: bool = None, tags: list = None, group: str = None, summary: str = None, description: str = None):
         """Ultimate route decorator with intelligent three-tier optimization and enhanced documentation.
         
@@ -323,76 +575,37 @@ class Sufast:
                     response = func()
                     
                     # Normalize response format
-                    if isinstance(response, dict):
-                        if 'body' in response:
-                            body = response['body']
-                            status = response.get('status', 200)
-                            content_type = response.get('headers', {}).get('Content-Type', 'application/json')
-                        else:
-                            body = json.dumps(response)
-                            status = 200
-                            content_type = 'application/json'
-                    elif isinstance(response, tuple) and len(response) == 2:
-                        data, status = response
-                        body = json.dumps(data) if isinstance(data, dict) else str(data)
-                        content_type = 'application/json'
-                    else:
-                        body = json.dumps(response) if isinstance(response, dict) else str(response)
-                        status = 200
-                        content_type = 'application/json'
+                    normalize = _by_type(_STATIC_NORMALIZERS, response, _static_from_other)
+                    body, status, content_type = normalize(response)
                     
                     # Register as ultra-fast static route
-                    success = self.rust_core.add_static_route(
-                        route_key.encode('utf-8'),
-                        body.encode('utf-8'),
-                        status,
-                        content_type.encode('utf-8')
-                    )
+                    success = self._add_static_response(route_key, body, status, content_type)
                     
                     if success:
                         self.static_routes[route_key] = func
                     else:
-                        print(f"⚠️ Failed to optimize {path} as static, falling back to dynamic")
+                        _log.warning("Static optimization failed, falling back to dynamic", path=path)
                         is_static = False
                         
                 except Exception as e:
-                    print(f"⚠️ Failed to pre-compile {path}: {e}")
+                    _log.warning("Failed to pre-compile route", path=path, error=str(e))
                     # Fall back to dynamic route
                     is_static = False
             
             if not is_static:
                 # TIER 2 & 3: Dynamic/Cached routes
-                success = self.rust_core.add_dynamic_route(
-                    b"GET",
-                    path.encode('utf-8'),
-                    func.__name__.encode('utf-8'),
-                    cache_ttl
-                )
+                # Store for Python callback
+                handler_info = self._add_dynamic_route_entry("GET", route_key, path, func, cache_ttl)
+                success = self._add_core_dynamic_route("GET", path, func, cache_ttl, handler_info)
                 
                 if success:
                     if is_cached:
                         self.cached_routes[route_key] = func
-                    
-                
-                # Compile regex for ultra-fast parameter extraction
-                pattern_str = path
-                for match in re.finditer(r'\{(\w+)\}', path):
-                    param_name = match.group(1)
-                    pattern_str = pattern_str.replace(f'{{{param_name}}}', f'(?P<{param_name}>[^/]+)')
-                
-                pattern_str = f"^{pattern_str}$"
-                compiled_pattern = re.compile(pattern_str)
-                
-                # Store for Python callback
-                self.dynamic_routes[route_key] = {
-                    'handler': func,
-                    'regex': compiled_pattern,
-                    'cache_ttl': cache_ttl,
-                    'pattern': path
-                }
             
             # Always store in routes for reference
             self.routes[route_key] = func
+            self._exact_routes["GET", path] = func
+            self._routes_index_json = None
             
             # Store metadata for auto-generated docs
             self._store_route_metadata(path, "GET", func, is_static, is_cached, cache_ttl, tags, group, summary, description)
@@ -400,12 +613,148 @@ class Sufast:
             return func
         return decorator
 
+    def _add_static_response(self, route_key, body, status, content_type):
+        """Hand a pre-compiled response to the core.
+
+        With a core that supports bulk registration the route is queued and
+        sent by ``_flush_static_routes`` in a single call; otherwise it is
+        registered immediately. Returns False for a response the core cannot
+        take, so the caller can serve the route dynamically instead.
+        """
+        # Checked up front: one bad entry makes the core reject a whole batch
+        if not isinstance(body, str) or not 0 < int(status) < 65536:
+            return False
+        try:
+            encoded_body = body.encode('utf-8')
+        except UnicodeEncodeError:
+            # Lone surrogates cannot be sent as UTF-8
+            return False
+        if hasattr(self.rust_core, 'add_static_routes_batch'):
+            self._pending_static.append((route_key, body, int(status), content_type))
+            return True
+        return self.rust_core.add_static_route(
+            route_key.encode('utf-8'),
+            encoded_body,
+            int(status),
+            _CONTENT_TYPE_BYTES.get(content_type) or content_type.encode('utf-8')
+        )
+
+    def _flush_static_routes(self):
+        """Register every queued static route with one FFI call.
+
+        If the core stores fewer routes than were queued, they are sent again
+        one at a time; any it still rejects are served dynamically.
+        """
+        pending, self._pending_static = self._pending_static, []
+        if not pending:
+            return 0
+        payload = _json.dumps(pending)
+        registered = self.rust_core.add_static_routes_batch(payload, len(payload))
+        if registered == len(pending):
+            return registered
+        
+        _log.warning("Core did not register every static route, retrying one by one",
+                     registered=registered, queued=len(pending))
+        registered = 0
+        for route_key, body, status, content_type in pending:
+            if self.rust_core.add_static_route(
+                    route_key.encode('utf-8'),
+                    body.encode('utf-8'),
+                    status,
+                    _CONTENT_TYPE_BYTES.get(content_type) or content_type.encode('utf-8')):
+                registered += 1
+            else:
+                self._demote_static_route(route_key)
+        return registered
+
+    def _demote_static_route(self, route_key):
+        """Serve a static route the core rejected through the Python callback."""
+        func = self.static_routes.pop(route_key, None)
+        if func is None:
+            if route_key in {f"GET:{path}" for path, _, _ in _DOCS_ASSETS}:
+                # Inline the docs assets into the page instead
+                self._docs_assets_served = False
+                self._docs_cache = None
+            _log.warning("Core rejected static route", route=route_key)
+            return
+        _log.warning("Core rejected static route, serving it dynamically", route=route_key)
+        method, path = route_key.split(':', 1)
+        handler_info = self._add_dynamic_route_entry(method, route_key, path, func, 0)
+        self._add_core_dynamic_route(method, path, func, 0, handler_info)
+
+    def _add_dynamic_route_entry(self, method, route_key, path, func, cache_ttl):
+        """Compile ``path`` and index the route for the Python callback."""
+        # Compile regex for ultra-fast parameter extraction: every {name}
+        # becomes a named segment group in a single substitution pass
+        pattern_str = _PARAM_RE.sub(r'(?P<\1>[^/]+)', path)
+        compiled_pattern = re.compile(f"^{pattern_str}$")
+        
+        handler_info = {
+            'handler': func,
+            'regex': compiled_pattern,
+            'cache_ttl': cache_ttl,
+            'pattern': path,
+            'accepted_params': accepted_params(func)
+        }
+        self.dynamic_routes[route_key] = handler_info
+        # Bucketed by method so dispatch only scans candidates for that verb;
+        # keyed by route so re-registering a path replaces it in place
+        self._dynamic_routes_by_method.setdefault(method, {})[route_key] = handler_info
+        self._dynamic_matchers.pop(method, None)
+        return handler_info
+
+    def _add_core_dynamic_route(self, method, path, func, cache_ttl, handler_info):
+        """Register a dynamic route with the core.
+
+        Cores with route ids get the index of ``handler_info`` in the route
+        table and hand matches straight back to it; older cores route
+        through the path callback.
+        """
+        args = (
+            _METHOD_BYTES.get(method) or method.encode('utf-8'),
+            path.encode('utf-8'),
+            func.__name__.encode('utf-8'),
+            cache_ttl
+        )
+        if self._route_table is None:
+            return self.rust_core.add_dynamic_route(*args)
+        route_id = len(self._route_table)
+        self._route_table.append(handler_info)
+        return self.rust_core.add_dynamic_route_with_id(*args, route_id)
+
+    def _build_dynamic_matcher(self, method):
+        """Fuse every dynamic route of ``method`` into one alternation regex.
+
+        Each route becomes a group named ``r<i>``, with its parameters renamed
+        ``r<i>_<name>`` so names can repeat across routes. Alternatives are
+        tried in registration order, as the per-route loop did. Returns
+        ``(regex, {group: (handler_info, ((group, param), ...), call)})`` where
+        ``call`` invokes the handler positionally, or is None when its
+        signature does not take the parameters in path order.
+        """
+        branches = []
+        targets = {}
+        for i, handler_info in enumerate(self._dynamic_routes_by_method.get(method, {}).values()):
+            regex = handler_info['regex']
+            prefix = f"r{i}"
+            # Strip the ^...$ anchors; the fused pattern anchors once
+            body = _NAMED_GROUP_RE.sub(lambda m: f"(?P<{prefix}_{m.group(1)}>", regex.pattern[1:-1])
+            branches.append(f"(?P<{prefix}>{body})")
+            params = tuple((f"{prefix}_{name}", name)
+                           for name, _ in sorted(regex.groupindex.items(), key=lambda item: item[1]))
+            names = tuple(name for _, name in params)
+            call = (_compile_route_call(tuple(group for group, _ in params))
+                    if accepts_positional(handler_info['handler'], names) else None)
+            targets[prefix] = (handler_info, params, call)
+        matcher = (re.compile(f"^(?:{'|'.join(branches)})$") if branches else None, targets)
+        self._dynamic_matchers[method] = matcher
+        return matcher
+
     def _store_route_metadata(self, path, method, func, is_static, is_cached, cache_ttl, tags=None, group=None, summary=None, description=None):
         """Store route metadata for auto-generated documentation with enhanced organization."""
         # Extract parameters from path
         parameters = []
-        for match in re.finditer(r'\{(\w+)\}', path):
-            param_name = match.group(1)
+        for param_name in _PARAM_RE.findall(path):
             parameters.append({
                 'name': param_name,
                 'type': 'string',  # Default type, could be enhanced with type hints
@@ -473,6 +822,7 @@ class Sufast:
             'examples': self._generate_examples(path, parameters),
             'responses': self._generate_response_examples(func, tier)
         }
+        self._docs_cache = None
 
     def _auto_detect_group(self, path, func_name, tags):
         """Auto-detect appropriate group based on path and tags."""
@@ -558,16 +908,22 @@ class Sufast:
             """🌐 Auto-Generated API Documentation - Interactive Explorer"""
             if not self.docs_enabled:
                 return {
-                    "body": json.dumps({
+                    "body": _json.dumps({
                         "error": "Documentation not enabled",
                         "message": "To enable documentation, use app.run(doc=True)",
                         "example": "app.run(host='127.0.0.1', port=8080, doc=True)"
-                    }),
+                    }).decode('utf-8'),
                     "status": 403,
                     "headers": {"Content-Type": "application/json"}
                 }
             
-            swagger_html = self._generate_swagger_ui()
+            # The page only depends on route metadata, so render it once;
+            # the key check also catches direct edits to route_metadata
+            signature = tuple(self.route_metadata)
+            cached = self._docs_cache
+            if cached is None or cached[0] != signature:
+                cached = self._docs_cache = (signature, self._generate_swagger_ui())
+            swagger_html = cached[1]
             return {
                 "body": swagger_html,
                 "status": 200,
@@ -582,6 +938,14 @@ class Sufast:
         # Don't store metadata for the docs route itself to avoid recursion
         if "GET:/docs" in self.route_metadata:
             del self.route_metadata["GET:/docs"]
+        
+        # Serve the stylesheet and script from the static tier so the page
+        # itself only carries the generated markup; inline them otherwise
+        self._docs_assets_served = all([
+            self._add_static_response(f"GET:{path}", body, 200, content_type)
+            for path, body, content_type in _DOCS_ASSETS
+        ])
+        self._docs_cache = None
 
     def _generate_swagger_ui(self):
         """Generate modern, user-friendly API documentation with groups and tags."""
@@ -617,13 +981,18 @@ class Sufast:
         sorted_tags = sorted(list(all_tags))
         
         # Generate tag filter buttons
-        tag_filters = ""
-        for tag in sorted_tags:
-            tag_filters += f'''
-                <button class="tag-filter" data-tag="{tag}" onclick="filterByTag('{tag}')">
-                    <i class="fas fa-tag"></i> {tag.title()}
+        tag_filters = "".join(f'''
+                <button class="tag-filter" data-tag="{html.escape(tag)}" onclick="filterByTag({_js_arg(tag)})">
+                    <i class="fas fa-tag"></i> {html.escape(tag.title())}
                 </button>
-            '''
+            ''' for tag in sorted_tags)
+        
+        if self._docs_assets_served:
+            styles = f'<link href="{_DOCS_ASSETS[0][0]}?v={_DOCS_ASSET_VERSION}" rel="stylesheet">'
+            script = f'<script src="{_DOCS_ASSETS[1][0]}?v={_DOCS_ASSET_VERSION}"></script>'
+        else:
+            styles = f'<style>\n{_DOCS_CSS}    </style>'
+            script = f'<script>\n{_DOCS_JS}    </script>'
         
         return f'''<!DOCTYPE html>
 <html lang="en">
@@ -633,1157 +1002,7 @@ class Sufast:
     <title>Sufast API Documentation</title>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            color: #1a1a1a;
-            line-height: 1.6;
-        }}
-        
-        /* Page Loader Styles */
-        .page-loader {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            z-index: 9999;
-            transition: opacity 0.3s ease-out, visibility 0.3s ease-out;
-        }}
-        
-        .loader-content {{
-            text-align: center;
-            color: white;
-        }}
-        
-        .loader-spinner {{
-            width: 60px;
-            height: 60px;
-            border: 4px solid rgba(255, 255, 255, 0.3);
-            border-top: 4px solid white;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin: 0 auto 1.5rem;
-        }}
-        
-        .loader-text {{
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin-bottom: 0.5rem;
-            letter-spacing: 0.5px;
-        }}
-        
-        .loader-subtext {{
-            font-size: 1rem;
-            opacity: 0.8;
-            font-weight: 400;
-        }}
-        
-        @keyframes spin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
-        }}
-        
-        /* Loading states and transitions */
-        .page-loader.hidden {{
-            opacity: 0;
-            visibility: hidden;
-            transition: opacity 0.3s ease-out, visibility 0.3s ease-out;
-        }}
-        
-        #mainContent {{
-            opacity: 0;
-            transition: opacity 0.5s ease-in;
-        }}
-        
-        #mainContent.loaded {{
-            opacity: 1;
-        }}
-        
-        /* Enhanced Navigation Styles */
-        .nav-section {{
-            background: white;
-            border-radius: 16px;
-            padding: 2rem;
-            margin-bottom: 2rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            border: 1px solid #f1f5f9;
-        }}
-        
-        .nav-header h3 {{
-            color: #1e293b;
-            font-weight: 700;
-            margin-bottom: 1.5rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }}
-        
-        .view-modes {{
-            display: flex;
-            gap: 1rem;
-            margin-bottom: 2rem;
-            flex-wrap: wrap;
-        }}
-        
-        .view-mode {{
-            padding: 0.75rem 1.5rem;
-            border: 2px solid #e2e8f0;
-            border-radius: 10px;
-            background: white;
-            color: #64748b;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }}
-        
-        .view-mode:hover {{
-            border-color: #3b82f6;
-            color: #3b82f6;
-            transform: translateY(-1px);
-        }}
-        
-        .view-mode.active {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            border-color: #667eea;
-        }}
-        
-        .filter-section {{
-            border-top: 1px solid #f1f5f9;
-            padding-top: 1.5rem;
-        }}
-        
-        .filter-header {{
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            margin-bottom: 1rem;
-        }}
-        
-        .filter-header h4 {{
-            color: #1e293b;
-            font-weight: 600;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }}
-        
-        .clear-filters {{
-            padding: 0.5rem 1rem;
-            background: #f8fafc;
-            border: 1px solid #e2e8f0;
-            border-radius: 6px;
-            color: #64748b;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            font-size: 0.85rem;
-        }}
-        
-        .clear-filters:hover {{
-            background: #ef4444;
-            color: white;
-            border-color: #ef4444;
-        }}
-        
-        .tag-filters {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.75rem;
-        }}
-        
-        .tag-filter {{
-            padding: 0.5rem 1rem;
-            background: #f8fafc;
-            border: 1px solid #e2e8f0;
-            border-radius: 20px;
-            color: #64748b;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            font-size: 0.85rem;
-            font-weight: 500;
-        }}
-        
-        .tag-filter:hover {{
-            background: #3b82f6;
-            color: white;
-            border-color: #3b82f6;
-            transform: translateY(-1px);
-        }}
-        
-        .tag-filter.active {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            border-color: #667eea;
-        }}
-        
-        .view-content {{
-            display: none;
-        }}
-        
-        .view-content.active {{
-            display: block;
-        }}
-        
-        /* Route Tags Styles */
-        .route-tags {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.5rem;
-            margin-top: 1rem;
-        }}
-        
-        .route-tag {{
-            background: linear-gradient(135deg, #f8fafc, #e2e8f0);
-            color: #475569;
-            padding: 0.25rem 0.75rem;
-            border-radius: 12px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            border: 1px solid #e2e8f0;
-        }}
-        
-        .group-badge {{
-            background: #f1f5f9;
-            color: #475569;
-            padding: 0.25rem 0.75rem;
-            border-radius: 6px;
-            font-size: 0.8rem;
-            font-weight: 500;
-            display: flex;
-            align-items: center;
-            gap: 0.25rem;
-        }}
-        
-        .endpoint-meta {{
-            background: #f8fafc;
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin-bottom: 1.5rem;
-            border-left: 4px solid #3b82f6;
-        }}
-        
-        .meta-row {{
-            margin-bottom: 1rem;
-        }}
-        
-        .meta-item {{
-            color: #374151;
-            line-height: 1.5;
-        }}
-        
-        /* Group and Tag Section Styles */
-        .group-section, .tag-section {{
-            background: white;
-            border-radius: 16px;
-            margin-bottom: 2rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            overflow: hidden;
-            border: 1px solid #f1f5f9;
-        }}
-        
-        .group-header, .tag-header {{
-            background: linear-gradient(135deg, #f8fafc, #e2e8f0);
-            padding: 2rem;
-            display: flex;
-            align-items: center;
-            gap: 1.5rem;
-            border-bottom: 1px solid #f1f5f9;
-        }}
-        
-        .group-icon, .tag-icon {{
-            width: 3rem;
-            height: 3rem;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 1.25rem;
-        }}
-        
-        .group-info, .tag-info {{
-            flex: 1;
-        }}
-        
-        .group-title, .tag-title {{
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #1e293b;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .group-description, .tag-description {{
-            color: #64748b;
-            font-size: 1rem;
-        }}
-        
-        .group-stats {{
-            display: flex;
-            gap: 1.5rem;
-        }}
-        
-        .stat-item {{
-            text-align: center;
-        }}
-        
-        .stat-number {{
-            display: block;
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #1e293b;
-        }}
-        
-        .stat-label {{
-            font-size: 0.8rem;
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }}
-        
-        .tag-count, .group-count {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            padding: 0.75rem 1.25rem;
-            border-radius: 10px;
-            font-weight: 700;
-            font-size: 1.1rem;
-        }}
-        
-        .group-routes, .tag-routes {{
-            padding: 0;
-        }}
-        
-        .tags-overview {{
-            text-align: center;
-            padding: 3rem 2rem;
-            background: linear-gradient(135deg, #f8fafc, #e2e8f0);
-            border-radius: 16px;
-            margin-bottom: 2rem;
-        }}
-        
-        .tags-overview h3 {{
-            color: #1e293b;
-            font-weight: 700;
-            margin-bottom: 0.5rem;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 0.5rem;
-        }}
-        
-        .tags-overview p {{
-            color: #64748b;
-        }}
-        
-        .header {{
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(20px);
-            border-bottom: 1px solid rgba(255, 255, 255, 0.2);
-            padding: 1.5rem 0;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .header-content {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }}
-        
-        .logo {{
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #2563eb;
-            text-decoration: none;
-        }}
-        
-        .logo i {{
-            font-size: 2rem;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }}
-        
-        .version {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            padding: 0.5rem 1rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 600;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 2rem;
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(20px);
-            margin-top: 0;
-            border-radius: 0;
-            min-height: calc(100vh - 100px);
-        }}
-        
-        .hero {{
-            text-align: center;
-            padding: 3rem 0;
-            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-            border-radius: 16px;
-            margin-bottom: 3rem;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .hero::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="grid" width="10" height="10" patternUnits="userSpaceOnUse"><path d="M 10 0 L 0 0 0 10" fill="none" stroke="%23e2e8f0" stroke-width="0.5"/></pattern></defs><rect width="100" height="100" fill="url(%23grid)"/></svg>');
-            opacity: 0.5;
-        }}
-        
-        .hero-content {{
-            position: relative;
-            z-index: 2;
-        }}
-        
-        .hero h1 {{
-            font-size: 3rem;
-            font-weight: 800;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 1rem;
-        }}
-        
-        .hero p {{
-            font-size: 1.2rem;
-            color: #64748b;
-            margin-bottom: 2rem;
-            max-width: 600px;
-            margin-left: auto;
-            margin-right: auto;
-        }}
-        
-        .hero-stats {{
-            display: flex;
-            justify-content: center;
-            gap: 3rem;
-            flex-wrap: wrap;
-        }}
-        
-        .stat {{
-            text-align: center;
-        }}
-        
-        .stat-number {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #1e293b;
-        }}
-        
-        .stat-label {{
-            font-size: 0.9rem;
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }}
-        
-        .tabs {{
-            display: flex;
-            background: #f8fafc;
-            border-radius: 12px;
-            padding: 0.5rem;
-            margin-bottom: 2rem;
-            box-shadow: inset 0 2px 4px rgba(0, 0, 0, 0.06);
-        }}
-        
-        .tab {{
-            flex: 1;
-            padding: 1rem 1.5rem;
-            text-align: center;
-            cursor: pointer;
-            border-radius: 8px;
-            font-weight: 600;
-            color: #64748b;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 0.5rem;
-        }}
-        
-        .tab:hover {{
-            color: #3b82f6;
-            background: rgba(59, 130, 246, 0.1);
-        }}
-        
-        .tab.active {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
-            transform: translateY(-1px);
-        }}
-        
-        .tab-content {{
-            display: none;
-        }}
-        
-        .tab-content.active {{
-            display: block;
-        }}
-        
-        .tier-section {{
-            margin-bottom: 3rem;
-        }}
-        
-        .tier-header {{
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-            margin-bottom: 2rem;
-            padding: 2rem;
-            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-            border-radius: 16px;
-            border-left: 6px solid;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .tier-header::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            right: 0;
-            bottom: 0;
-            width: 100px;
-            background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1));
-        }}
-        
-        .tier-static {{ border-left-color: #ef4444; }}
-        .tier-cached {{ border-left-color: #f59e0b; }}
-        .tier-dynamic {{ border-left-color: #3b82f6; }}
-        
-        .tier-icon {{
-            width: 4rem;
-            height: 4rem;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 2rem;
-            color: white;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            box-shadow: 0 8px 24px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .tier-info {{
-            flex: 1;
-        }}
-        
-        .tier-title {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #1e293b;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .tier-description {{
-            color: #64748b;
-            font-size: 1.1rem;
-        }}
-        
-        .route-count {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            padding: 1rem 1.5rem;
-            border-radius: 12px;
-            font-weight: 700;
-            font-size: 1.1rem;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .endpoint {{
-            background: white;
-            border-radius: 12px;
-            margin-bottom: 1.5rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            transition: all 0.3s ease;
-            overflow: hidden;
-            border: 1px solid #f1f5f9;
-        }}
-        
-        .endpoint:hover {{
-            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.12);
-            transform: translateY(-2px);
-        }}
-        
-        .endpoint-header {{
-            padding: 1.5rem 2rem;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            background: #fafafa;
-            border-bottom: 1px solid #f1f5f9;
-            transition: background 0.2s ease;
-        }}
-        
-        .endpoint-header:hover {{
-            background: #f8fafc;
-        }}
-        
-        .endpoint.active .endpoint-header {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-        }}
-        
-        .endpoint.active .endpoint-header .method-badge {{
-            background: rgba(255, 255, 255, 0.2);
-            color: white;
-        }}
-        
-        .endpoint-left {{
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-        }}
-        
-        .method-badge {{
-            padding: 0.5rem 1rem;
-            border-radius: 8px;
-            font-weight: 700;
-            font-size: 0.8rem;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            min-width: 80px;
-            text-align: center;
-        }}
-        
-        .method-get {{ background: #dbeafe; color: #1e40af; }}
-        .method-post {{ background: #dcfce7; color: #166534; }}
-        .method-put {{ background: #fef3c7; color: #92400e; }}
-        .method-delete {{ background: #fee2e2; color: #991b1b; }}
-        
-        .endpoint-path {{
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            font-weight: 600;
-            font-size: 1.1rem;
-            color: #1e293b;
-        }}
-        
-        .endpoint.active .endpoint-path {{
-            color: white;
-        }}
-        
-        .endpoint-right {{
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-        }}
-        
-        .performance-badge {{
-            background: #f1f5f9;
-            color: #475569;
-            padding: 0.5rem 1rem;
-            border-radius: 8px;
-            font-size: 0.85rem;
-            font-weight: 600;
-        }}
-        
-        .endpoint.active .performance-badge {{
-            background: rgba(255, 255, 255, 0.2);
-            color: white;
-        }}
-        
-        .expand-icon {{
-            font-size: 1.2rem;
-            color: #94a3b8;
-            transition: transform 0.3s ease;
-        }}
-        
-        .endpoint.active .expand-icon {{
-            transform: rotate(180deg);
-            color: white;
-        }}
-        
-        .endpoint-body {{
-            padding: 2rem;
-            display: none;
-            background: #fafafa;
-        }}
-        
-        .endpoint.active .endpoint-body {{
-            display: block;
-        }}
-        
-        .description {{
-            color: #64748b;
-            font-size: 1rem;
-            margin-bottom: 2rem;
-            padding: 1rem;
-            background: white;
-            border-radius: 8px;
-            border-left: 4px solid #3b82f6;
-        }}
-        
-        .parameters {{
-            margin-bottom: 2rem;
-        }}
-        
-        .parameters h4 {{
-            font-size: 1.2rem;
-            font-weight: 600;
-            color: #1e293b;
-            margin-bottom: 1rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }}
-        
-        .parameter {{
-            background: white;
-            border: 1px solid #e2e8f0;
-            border-radius: 8px;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-            transition: all 0.2s ease;
-        }}
-        
-        .parameter:hover {{
-            border-color: #3b82f6;
-            box-shadow: 0 2px 8px rgba(59, 130, 246, 0.1);
-        }}
-        
-        .parameter-header {{
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            margin-bottom: 1rem;
-        }}
-        
-        .parameter-name {{
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            font-weight: 700;
-            color: #1e293b;
-            font-size: 1rem;
-        }}
-        
-        .parameter-type {{
-            background: #f1f5f9;
-            color: #475569;
-            padding: 0.25rem 0.75rem;
-            border-radius: 6px;
-            font-size: 0.8rem;
-            font-weight: 600;
-        }}
-        
-        .parameter-input {{
-            width: 100%;
-            padding: 0.75rem 1rem;
-            border: 2px solid #e2e8f0;
-            border-radius: 8px;
-            font-size: 1rem;
-            transition: all 0.2s ease;
-        }}
-        
-        .parameter-input:focus {{
-            outline: none;
-            border-color: #3b82f6;
-            box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
-        }}
-        
-        .try-section {{
-            background: white;
-            border-radius: 12px;
-            padding: 2rem;
-            border: 1px solid #e2e8f0;
-        }}
-        
-        .try-header {{
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-            margin-bottom: 1.5rem;
-        }}
-        
-        .try-header h4 {{
-            font-size: 1.2rem;
-            font-weight: 600;
-            color: #1e293b;
-        }}
-        
-        .btn {{
-            padding: 0.75rem 1.5rem;
-            border: none;
-            border-radius: 8px;
-            font-weight: 600;
-            font-size: 0.9rem;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-        }}
-        
-        .btn-primary {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .btn-primary:hover {{
-            transform: translateY(-1px);
-            box-shadow: 0 6px 16px rgba(102, 126, 234, 0.4);
-        }}
-        
-        .btn-secondary {{
-            background: #f8fafc;
-            color: #475569;
-            border: 1px solid #e2e8f0;
-        }}
-        
-        .btn-secondary:hover {{
-            background: #f1f5f9;
-        }}
-        
-        .response-section {{
-            margin-top: 1.5rem;
-        }}
-        
-        .response-container {{
-            border-radius: 12px;
-            overflow: hidden;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-            transition: all 0.3s ease;
-        }}
-        
-        .response-container.success {{
-            border: 2px solid #10b981;
-            box-shadow: 0 4px 16px rgba(16, 185, 129, 0.2);
-        }}
-        
-        .response-container.error {{
-            border: 2px solid #ef4444;
-            box-shadow: 0 4px 16px rgba(239, 68, 68, 0.2);
-        }}
-        
-        .response-container.warning {{
-            border: 2px solid #f59e0b;
-            box-shadow: 0 4px 16px rgba(245, 158, 11, 0.2);
-        }}
-        
-        .response-header {{
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            padding: 1rem 1.5rem;
-            margin: 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }}
-        
-        .response-header.success {{
-            background: linear-gradient(135deg, #10b981, #059669);
-            color: white;
-        }}
-        
-        .response-header.error {{
-            background: linear-gradient(135deg, #ef4444, #dc2626);
-            color: white;
-        }}
-        
-        .response-header.warning {{
-            background: linear-gradient(135deg, #f59e0b, #d97706);
-            color: white;
-        }}
-        
-        .response-header.info {{
-            background: linear-gradient(135deg, #3b82f6, #2563eb);
-            color: white;
-        }}
-        
-        .response-title {{
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            font-size: 1.1rem;
-            font-weight: 600;
-        }}
-        
-        .response-status {{
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-            font-weight: 600;
-            font-size: 0.95rem;
-        }}
-        
-        .status-badge {{
-            padding: 0.25rem 0.75rem;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .status-badge.success {{
-            background: rgba(255, 255, 255, 0.2);
-            color: white;
-        }}
-        
-        .status-badge.error {{
-            background: rgba(255, 255, 255, 0.2);
-            color: white;
-        }}
-        
-        .status-badge.warning {{
-            background: rgba(255, 255, 255, 0.2);
-            color: white;
-        }}
-        
-        .timing-badge {{
-            background: rgba(255, 255, 255, 0.15);
-            color: white;
-            padding: 0.25rem 0.75rem;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            font-weight: 600;
-        }}
-        
-        .response-body {{
-            padding: 0;
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            font-size: 0.9rem;
-            line-height: 1.6;
-            max-height: 500px;
-            overflow-y: auto;
-            position: relative;
-        }}
-        
-        .response-content {{
-            padding: 1.5rem;
-            overflow-x: auto;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-        }}
-        
-        .response-body.success .response-content {{
-            background: linear-gradient(135deg, #f0fdf4, #dcfce7);
-            color: #166534;
-            border-left: 4px solid #10b981;
-        }}
-        
-        .response-body.error .response-content {{
-            background: linear-gradient(135deg, #fef2f2, #fee2e2);
-            color: #991b1b;
-            border-left: 4px solid #ef4444;
-        }}
-        
-        .response-body.warning .response-content {{
-            background: linear-gradient(135deg, #fffbeb, #fef3c7);
-            color: #92400e;
-            border-left: 4px solid #f59e0b;
-        }}
-        
-        .response-body.info .response-content {{
-            background: linear-gradient(135deg, #eff6ff, #dbeafe);
-            color: #1e40af;
-            border-left: 4px solid #3b82f6;
-        }}
-        
-        .response-meta {{
-            background: rgba(0, 0, 0, 0.05);
-            padding: 0.75rem 1.5rem;
-            border-top: 1px solid rgba(0, 0, 0, 0.1);
-            font-size: 0.8rem;
-            color: #6b7280;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .content-type-badge {{
-            background: #f3f4f6;
-            color: #374151;
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-            font-weight: 500;
-        }}
-        
-        .loading {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 0.75rem;
-            padding: 2rem;
-            background: linear-gradient(135deg, #f8fafc, #e2e8f0);
-            border-radius: 12px;
-            border: 2px solid #cbd5e1;
-            color: #475569;
-            font-weight: 600;
-        }}
-        
-        .loading i {{
-            animation: spin 1s linear infinite;
-            font-size: 1.2rem;
-            color: #3b82f6;
-        }}
-        
-        @keyframes spin {{
-            from {{ transform: rotate(0deg); }}
-            to {{ transform: rotate(360deg); }}
-        }}
-        
-        /* JSON Syntax Highlighting */
-        .json-key {{
-            color: #7c3aed;
-            font-weight: 600;
-        }}
-        
-        .json-string {{
-            color: #059669;
-        }}
-        
-        .json-number {{
-            color: #dc2626;
-        }}
-        
-        .json-boolean {{
-            color: #2563eb;
-            font-weight: 600;
-        }}
-        
-        .json-null {{
-            color: #6b7280;
-            font-style: italic;
-        }}
-        
-        /* Copy button */
-        .copy-button {{
-            position: absolute;
-            top: 1rem;
-            right: 1rem;
-            background: rgba(255, 255, 255, 0.95);
-            border: 1px solid rgba(0, 0, 0, 0.1);
-            border-radius: 8px;
-            padding: 0.5rem 0.75rem;
-            cursor: pointer;
-            opacity: 0;
-            transition: all 0.3s ease;
-            color: #374151;
-            font-size: 0.85rem;
-            font-weight: 500;
-            display: flex;
-            align-items: center;
-            gap: 0.375rem;
-            backdrop-filter: blur(10px);
-            z-index: 10;
-            min-width: 70px;
-            justify-content: center;
-        }}
-        
-        .response-body:hover .copy-button {{
-            opacity: 1;
-            transform: translateY(-1px);
-        }}
-        
-        .copy-button:hover {{
-            background: white;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-            border-color: #3b82f6;
-            color: #3b82f6;
-            transform: translateY(-2px);
-        }}
-        
-        .copy-button:active {{
-            transform: translateY(0);
-            box-shadow: 0 2px 6px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .copy-button.copied {{
-            background: #10b981;
-            color: white;
-            border-color: #10b981;
-        }}
-        
-        .copy-button.copied:hover {{
-            background: #059669;
-            border-color: #059669;
-        }}
-        
-        /* Legacy status classes for backward compatibility */
-        .status-200 {{ color: #10b981; }}
-        .status-400 {{ color: #f59e0b; }}
-        .status-404 {{ color: #ef4444; }}
-        .status-500 {{ color: #ef4444; }}
-        
-        @media (max-width: 768px) {{
-            .container {{
-                padding: 1rem;
-            }}
-            
-            .hero h1 {{
-                font-size: 2rem;
-            }}
-            
-            .hero-stats {{
-                gap: 1.5rem;
-            }}
-            
-            .tabs {{
-                flex-direction: column;
-            }}
-            
-            .endpoint-header {{
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 1rem;
-            }}
-            
-            .endpoint-right {{
-                width: 100%;
-                justify-content: space-between;
-            }}
-        }}
-    </style>
+    {styles}
 </head>
 <body>
     <!-- Page Loader -->
@@ -1939,504 +1158,7 @@ class Sufast:
         </div>
     </div>
     
-    <script>
-        function showTab(tabName) {{
-            document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
-            document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
-            
-            document.getElementById(tabName).classList.add('active');
-            event.target.classList.add('active');
-        }}
-        
-        function toggleEndpoint(endpointId) {{
-            const endpoint = document.getElementById(endpointId);
-            const isActive = endpoint.classList.contains('active');
-            
-            document.querySelectorAll('.endpoint').forEach(ep => ep.classList.remove('active'));
-            
-            if (!isActive) {{
-                endpoint.classList.add('active');
-            }}
-        }}
-        
-        async function executeRequest(path, method, endpointId) {{
-            const inputs = document.querySelectorAll(`#${{endpointId}} .parameter-input`);
-            let url = path;
-            
-            for (const input of inputs) {{
-                const paramName = input.dataset.param;
-                const value = input.value.trim();
-                if (!value) {{
-                    alert(`Please enter a value for parameter: ${{paramName}}`);
-                    input.focus();
-                    return;
-                }}
-                url = url.replace(`{{${{paramName}}}}`, encodeURIComponent(value));
-            }}
-            
-            const responseContainer = document.getElementById(`response-${{endpointId}}`);
-            responseContainer.innerHTML = '<div class="loading"><i class="fas fa-spinner"></i> Executing request...</div>';
-            
-            try {{
-                const start = performance.now();
-                const response = await fetch(url, {{
-                    method: method,
-                    headers: {{
-                        'Accept': 'application/json',
-                        'Cache-Control': 'no-cache'
-                    }}
-                }});
-                const end = performance.now();
-                const responseTime = Math.round(end - start);
-                
-                const contentType = response.headers.get('content-type') || 'text/plain';
-                let data;
-                let isJson = false;
-                
-                if (contentType.includes('application/json')) {{
-                    data = await response.json();
-                    isJson = true;
-                }} else {{
-                    const text = await response.text();
-                    try {{
-                        data = JSON.parse(text);
-                        isJson = true;
-                    }} catch {{
-                        data = {{ raw_response: text, content_type: contentType }};
-                        isJson = false;
-                    }}
-                }}
-                
-                // Determine response type for styling
-                let responseType = 'info';
-                let statusIcon = 'fas fa-info-circle';
-                let statusText = response.statusText;
-                
-                if (response.status >= 200 && response.status < 300) {{
-                    responseType = 'success';
-                    statusIcon = 'fas fa-check-circle';
-                }} else if (response.status >= 400 && response.status < 500) {{
-                    responseType = 'warning';
-                    statusIcon = 'fas fa-exclamation-triangle';
-                }} else if (response.status >= 500) {{
-                    responseType = 'error';
-                    statusIcon = 'fas fa-times-circle';
-                }}
-                
-                // Format the response data with syntax highlighting if it's JSON
-                let formattedData;
-                if (isJson) {{
-                    formattedData = syntaxHighlightJson(JSON.stringify(data, null, 2));
-                }} else {{
-                    formattedData = escapeHtml(typeof data === 'string' ? data : JSON.stringify(data, null, 2));
-                }}
-                
-                responseContainer.innerHTML = `
-                    <div class="response-container ${{responseType}}">
-                        <div class="response-header ${{responseType}}">
-                            <div class="response-title">
-                                <i class="${{statusIcon}}"></i>
-                                Response
-                            </div>
-                            <div class="response-status">
-                                <div class="status-badge ${{responseType}}">
-                                    ${{response.status}} ${{statusText}}
-                                </div>
-                                <div class="timing-badge">
-                                    ${{responseTime}}ms
-                                </div>
-                            </div>
-                        </div>
-                        <div class="response-body ${{responseType}}">
-                            <div class="response-content">
-                                <button class="copy-button" onclick="copyResponse('${{endpointId}}')">
-                                    <i class="fas fa-copy"></i>
-                                    Copy
-                                </button>
-                                ${{formattedData}}
-                            </div>
-                            <div class="response-meta">
-                                <span class="content-type-badge">${{contentType}}</span>
-                                <span>Size: ${{new Blob([typeof data === 'string' ? data : JSON.stringify(data)]).size}} bytes</span>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            }} catch (error) {{
-                responseContainer.innerHTML = `
-                    <div class="response-container error">
-                        <div class="response-header error">
-                            <div class="response-title">
-                                <i class="fas fa-exclamation-triangle"></i>
-                                Network Error
-                            </div>
-                            <div class="response-status">
-                                <div class="status-badge error">Failed</div>
-                            </div>
-                        </div>
-                        <div class="response-body error">
-                            <div class="response-content">
-                                <button class="copy-button" onclick="copyResponse('${{endpointId}}')">
-                                    <i class="fas fa-copy"></i>
-                                    Copy
-                                </button>
-                                ${{syntaxHighlightJson(JSON.stringify({{ 
-                                    error: error.message,
-                                    type: error.name,
-                                    timestamp: new Date().toISOString()
-                                }}, null, 2))}}
-                            </div>
-                            <div class="response-meta">
-                                <span class="content-type-badge">application/json</span>
-                                <span>Request failed to complete</span>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            }}
-        }}
-        
-        function syntaxHighlightJson(json) {{
-            return json.replace(/("(\\u[a-zA-Z0-9]{{4}}|\\[^u]|[^\\"])*"(\s*:)?|\b(true|false|null)\b|-?\d+(?:\.\d*)?(?:[eE][+\-]?\d+)?)/g, function (match) {{
-                let cls = 'json-number';
-                if (/^"/.test(match)) {{
-                    if (/:$/.test(match)) {{
-                        cls = 'json-key';
-                    }} else {{
-                        cls = 'json-string';
-                    }}
-                }} else if (/true|false/.test(match)) {{
-                    cls = 'json-boolean';
-                }} else if (/null/.test(match)) {{
-                    cls = 'json-null';
-                }}
-                return '<span class="' + cls + '">' + match + '</span>';
-            }});
-        }}
-        
-        function escapeHtml(text) {{
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }}
-        
-        function copyResponse(endpointId) {{
-            const responseContent = document.querySelector(`#response-${{endpointId}} .response-content`);
-            if (responseContent) {{
-                // Clone the content to avoid modifying the original
-                const clone = responseContent.cloneNode(true);
-                
-                // Remove the copy button from the clone
-                const copyButton = clone.querySelector('.copy-button');
-                if (copyButton) {{
-                    copyButton.remove();
-                }}
-                
-                // Get clean text content without HTML tags and button text
-                const cleanText = (clone.textContent || clone.innerText || '').trim();
-                
-                navigator.clipboard.writeText(cleanText).then(() => {{
-                    const button = responseContent.querySelector('.copy-button');
-                    if (button) {{
-                        const originalHTML = button.innerHTML;
-                        
-                        // Show success state
-                        button.innerHTML = '<i class="fas fa-check"></i> Copied';
-                        button.classList.add('copied');
-                        
-                        // Reset after 2 seconds
-                        setTimeout(() => {{
-                            button.innerHTML = originalHTML;
-                            button.classList.remove('copied');
-                        }}, 2000);
-                    }}
-                }}).catch(err => {{
-                    console.error('Failed to copy response:', err);
-                    const button = responseContent.querySelector('.copy-button');
-                    if (button) {{
-                        const originalHTML = button.innerHTML;
-                        
-                        // Show error state
-                        button.innerHTML = '<i class="fas fa-times"></i> Failed';
-                        button.style.background = '#ef4444';
-                        button.style.color = 'white';
-                        button.style.borderColor = '#ef4444';
-                        
-                        // Reset after 2 seconds
-                        setTimeout(() => {{
-                            button.innerHTML = originalHTML;
-                            button.style.background = '';
-                            button.style.color = '';
-                            button.style.borderColor = '';
-                        }}, 2000);
-                    }}
-                }});
-            }}
-        }}
-        
-        function clearResponse(endpointId) {{
-            document.getElementById(`response-${{endpointId}}`).innerHTML = '';
-        }}
-        
-        function fillExample(endpointId) {{
-            const inputs = document.querySelectorAll(`#${{endpointId}} .parameter-input`);
-            inputs.forEach(input => {{
-                if (input.dataset.example) {{
-                    input.value = input.dataset.example;
-                }}
-            }});
-        }}
-        
-        // ========================================
-        // ENHANCED NAVIGATION AND FILTERING
-        // ========================================
-        
-        function switchView(viewName) {{
-            // Hide all views
-            document.querySelectorAll('.view-content').forEach(view => view.classList.remove('active'));
-            document.querySelectorAll('.view-mode').forEach(mode => mode.classList.remove('active'));
-            
-            // Show selected view
-            document.getElementById(viewName + '-view').classList.add('active');
-            document.querySelector(`[data-view="${{viewName}}"]`).classList.add('active');
-            
-            // Clear any active filters
-            clearAllFilters();
-        }}
-        
-        function filterByTag(tagName) {{
-            const tagFilter = document.querySelector(`[data-tag="${{tagName}}"]`);
-            const isActive = tagFilter.classList.contains('active');
-            
-            if (isActive) {{
-                // Remove filter
-                tagFilter.classList.remove('active');
-                showAllEndpoints();
-            }} else {{
-                // Clear other filters and apply this one
-                document.querySelectorAll('.tag-filter').forEach(filter => filter.classList.remove('active'));
-                tagFilter.classList.add('active');
-                
-                // Hide all endpoints
-                document.querySelectorAll('.endpoint').forEach(endpoint => {{
-                    endpoint.style.display = 'none';
-                }});
-                
-                // Show endpoints with this tag
-                document.querySelectorAll(`.endpoint[data-tags*="${{tagName}}"]`).forEach(endpoint => {{
-                    endpoint.style.display = 'block';
-                }});
-                
-                // Update counters
-                updateFilterCounters();
-            }}
-        }}
-        
-        function clearAllFilters() {{
-            document.querySelectorAll('.tag-filter').forEach(filter => filter.classList.remove('active'));
-            showAllEndpoints();
-        }}
-        
-        function showAllEndpoints() {{
-            document.querySelectorAll('.endpoint').forEach(endpoint => {{
-                endpoint.style.display = 'block';
-            }});
-            updateFilterCounters();
-        }}
-        
-        function updateFilterCounters() {{
-            // Update route counts in tier headers
-            document.querySelectorAll('.tier-section').forEach(section => {{
-                const visibleRoutes = section.querySelectorAll('.endpoint[style*="block"], .endpoint:not([style])');
-                const counter = section.querySelector('.route-count');
-                if (counter) {{
-                    counter.textContent = `${{visibleRoutes.length}} routes`;
-                }}
-            }});
-        }}
-        
-        function highlightMatchingTags(searchTerm) {{
-            document.querySelectorAll('.route-tag').forEach(tag => {{
-                if (tag.textContent.toLowerCase().includes(searchTerm.toLowerCase())) {{
-                    tag.style.background = 'linear-gradient(135deg, #667eea, #764ba2)';
-                    tag.style.color = 'white';
-                }} else {{
-                    tag.style.background = '';
-                    tag.style.color = '';
-                }}
-            }});
-        }}
-        
-        function searchRoutes(query) {{
-            const searchTerm = query.toLowerCase();
-            
-            document.querySelectorAll('.endpoint').forEach(endpoint => {{
-                const path = endpoint.querySelector('.endpoint-path').textContent.toLowerCase();
-                const description = endpoint.querySelector('.meta-item').textContent.toLowerCase();
-                const tags = endpoint.getAttribute('data-tags').toLowerCase();
-                const group = endpoint.getAttribute('data-group').toLowerCase();
-                
-                const matches = path.includes(searchTerm) || 
-                              description.includes(searchTerm) || 
-                              tags.includes(searchTerm) || 
-                              group.includes(searchTerm);
-                
-                endpoint.style.display = matches ? 'block' : 'none';
-            }});
-            
-            updateFilterCounters();
-            highlightMatchingTags(searchTerm);
-        }}
-        
-        // ========================================
-        // ENHANCED ROUTE INTERACTION
-        // ========================================
-        
-        function showTab(tabName) {{
-            document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
-            document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
-            
-            document.getElementById(tabName).classList.add('active');
-            event.target.classList.add('active');
-            
-            // Clear filters when switching tabs
-            clearAllFilters();
-        }}
-        
-        function toggleEndpoint(endpointId) {{
-            const endpoint = document.getElementById(endpointId);
-            const isActive = endpoint.classList.contains('active');
-            
-            document.querySelectorAll('.endpoint').forEach(ep => ep.classList.remove('active'));
-            
-            if (!isActive) {{
-                endpoint.classList.add('active');
-                endpoint.scrollIntoView({{ behavior: 'smooth', block: 'nearest' }});
-            }}
-        }}
-        
-        // ========================================
-        // PAGE INITIALIZATION AND VERSION FETCHING
-        // ========================================
-        
-        // Version fetching from GitHub API
-        async function fetchLatestVersion() {{
-            try {{
-                const response = await fetch('https://api.github.com/repos/shohan-dev/sufast/releases/latest', {{
-                    method: 'GET',
-                    headers: {{
-                        'Accept': 'application/vnd.github.v3+json'
-                    }}
-                }});
-                if (response.ok) {{
-                    const data = await response.json();
-                    const versionBadge = document.getElementById('version-badge');
-                    if (data.tag_name && versionBadge) {{
-                        versionBadge.textContent = data.tag_name;
-                        console.log('Version updated to:', data.tag_name);
-                    }}
-                }} else {{
-                    console.warn('Could not fetch latest version, using default');
-                }}
-            }} catch (error) {{
-                console.warn('Error fetching version:', error);
-                // Fallback to default version
-                const versionBadge = document.getElementById('version-badge');
-                if (versionBadge) {{
-                    versionBadge.textContent = 'v2.0';
-                }}
-            }}
-        }}
-        
-        // Page initialization with loading sequence
-        async function initializePage() {{
-            const pageLoader = document.getElementById('pageLoader');
-            const mainContent = document.getElementById('mainContent');
-            
-            console.log('Starting page initialization...');
-            
-            try {{
-                // Ensure elements exist
-                if (!pageLoader || !mainContent) {{
-                    console.error('Required elements not found:', {{ pageLoader: !!pageLoader, mainContent: !!mainContent }});
-                    // If elements don't exist, just show everything
-                    document.body.style.opacity = '1';
-                    return;
-                }}
-                
-                // Start version fetching (don't wait for it)
-                fetchLatestVersion().catch(e => console.warn('Version fetch failed:', e));
-                
-                // Minimum loading time for better UX
-                await new Promise(resolve => setTimeout(resolve, 1000));
-                
-                console.log('Initialization complete, showing content...');
-                
-            }} catch (error) {{
-                console.warn('Initialization error:', error);
-            }} finally {{
-                // Always show content after initialization
-                if (pageLoader) {{
-                    pageLoader.classList.add('hidden');
-                }}
-                if (mainContent) {{
-                    mainContent.classList.add('loaded');
-                }}
-                
-                // Remove loader from DOM after transition
-                setTimeout(() => {{
-                    if (pageLoader && pageLoader.parentNode) {{
-                        pageLoader.parentNode.removeChild(pageLoader);
-                    }}
-                }}, 500);
-                
-                console.log('Content displayed successfully');
-            }}
-        }}
-        
-        // Enhanced page load handling with multiple triggers
-        function startInitialization() {{
-            console.log('Document ready state:', document.readyState);
-            console.log('Starting initialization...');
-            initializePage();
-        }}
-        
-        // Multiple event listeners to ensure initialization happens
-        if (document.readyState === 'loading') {{
-            document.addEventListener('DOMContentLoaded', startInitialization);
-            console.log('Added DOMContentLoaded listener');
-        }} else if (document.readyState === 'interactive' || document.readyState === 'complete') {{
-            // Document already loaded
-            console.log('Document already ready, starting initialization');
-            setTimeout(startInitialization, 100);
-        }}
-        
-        // Additional load event listener
-        window.addEventListener('load', () => {{
-            console.log('Window load event fired');
-            // Extra check in case other events didn't work
-            setTimeout(() => {{
-                const pageLoader = document.getElementById('pageLoader');
-                if (pageLoader && !pageLoader.classList.contains('hidden')) {{
-                    console.log('Load event backup initialization');
-                    startInitialization();
-                }}
-            }}, 100);
-        }});
-        
-        // Backup initialization in case events don't fire
-        setTimeout(() => {{
-            const pageLoader = document.getElementById('pageLoader');
-            const mainContent = document.getElementById('mainContent');
-            if (pageLoader && !pageLoader.classList.contains('hidden')) {{
-                console.log('Backup initialization triggered');
-                pageLoader.classList.add('hidden');
-                if (mainContent) {{
-                    mainContent.classList.add('loaded');
-                }}
-            }}
-        }}, 2000); // 2 second backup timeout
-    </script>
+    {script}
     </div> <!-- Close mainContent -->
 </body>
 </html>'''
@@ -2445,142 +1167,86 @@ class Sufast:
     def _generate_modern_routes(self, routes, tier_type):
         """Generate modern, user-friendly route documentation HTML with tags and enhanced info."""
         if not routes:
-            return '''
-                <div style="text-align: center; padding: 4rem 2rem; color: #64748b;">
-                    <i class="fas fa-inbox" style="font-size: 4rem; margin-bottom: 1rem; opacity: 0.5;"></i>
-                    <h3 style="margin-bottom: 0.5rem; color: #475569;">No routes found</h3>
-                    <p>No routes have been registered in this tier yet.</p>
-                </div>
-            '''
+            return _NO_ROUTES_HTML
         
-        html = ""
+        # Collect fragments and join once; += on str re-copies the page so far
+        parts = []
         for i, route in enumerate(routes):
             endpoint_id = f"endpoint_{tier_type}_{i}"
+            # Route metadata is user-supplied; escape each value once and
+            # reuse it wherever the card interpolates it
+            path = html.escape(route['path'])
+            tags = [html.escape(tag) for tag in route.get('tags', [])]
+            group = html.escape(route.get('group', ''))
             
             # Generate tags HTML
             tags_html = ""
-            if route.get('tags'):
-                tags_html = '<div class="route-tags">'
-                for tag in route['tags']:
-                    tags_html += f'<span class="route-tag" data-tag="{tag}">#{tag}</span>'
-                tags_html += '</div>'
+            if tags:
+                tags_html = '<div class="route-tags">%s</div>' % "".join(
+                    f'<span class="route-tag" data-tag="{tag}">#{tag}</span>'
+                    for tag in tags
+                )
             
             # Generate parameters HTML
             params_html = ""
             if route['parameters']:
-                params_html = '''
+                param_parts = ['''
                     <div class="parameters">
                         <h4><i class="fas fa-sliders-h"></i> Parameters</h4>
-                '''
+                ''']
                 for param in route['parameters']:
-                    example_value = self._get_example_value(param['name'])
-                    params_html += f'''
-                        <div class="parameter">
-                            <div class="parameter-header">
-                                <div class="parameter-name">{param['name']}</div>
-                                <div class="parameter-type">{param['type']}</div>
-                            </div>
-                            <input type="text" class="parameter-input" 
-                                   data-param="{param['name']}" 
-                                   data-example="{example_value}"
-                                   placeholder="Enter {param['name']}" 
-                                   value="{example_value}">
-                        </div>
-                    '''
-                params_html += '</div>'
+                    name = param['name']
+                    param_parts.append(_PARAM_TMPL.format(
+                        name=html.escape(name), type=html.escape(param['type']),
+                        example=html.escape(self._get_example_value(name))))
+                param_parts.append('</div>')
+                params_html = "".join(param_parts)
             
             # Generate group badge
             group_badge = ""
-            if route.get('group'):
-                group_badge = f'<div class="group-badge"><i class="fas fa-folder"></i> {route["group"]}</div>'
-            
-            # Get performance info based on tier
-            tier_info = {
-                'static': {'performance': '', 'icon': 'fas fa-bolt', 'color': 'tier-static'},
-                'cached': {'performance': '', 'icon': 'fas fa-memory', 'color': 'tier-cached'},
-                'dynamic': {'performance': '', 'icon': 'fas fa-cogs', 'color': 'tier-dynamic'}
-            }
-            
-            tier_data = tier_info.get(route['tier'], {'performance': 'Unknown', 'icon': 'fas fa-question', 'color': ''})
-            
-            html += f'''
-                <div class="endpoint {route['tier']}" id="{endpoint_id}" data-tags="{','.join(route.get('tags', []))}" data-group="{route.get('group', '')}">
-                    <div class="endpoint-header" onclick="toggleEndpoint('{endpoint_id}')">
-                        <div class="endpoint-left">
-                            <div class="method-badge method-{route['method'].lower()}">{route['method']}</div>
-                            <div class="endpoint-path">{route['path']}</div>
-                            {group_badge}
-                        </div>
-                        <div class="endpoint-right">
-                            <div class="performance-badge {tier_data['color']}">
-                                <i class="{tier_data['icon']}"></i> 
-                                {tier_data['performance']}
-                            </div>
-                            <i class="fas fa-chevron-down expand-icon"></i>
-                        </div>
-                    </div>
-                    
-                    <div class="endpoint-body">
-                        <div class="endpoint-meta">
-                            <div class="meta-row">
-                                <div class="meta-item">
-                                    <strong>Summary:</strong> {route.get('summary', route.get('description', 'No description available'))}
-                                </div>
-                            </div>
-                            {tags_html}
-                        </div>
-                        
-                        {params_html}
-                        
-                        <div class="try-section">
-                            <div class="try-header">
-                                <h4><i class="fas fa-play-circle"></i> Try it out</h4>
-                            </div>
-                            
-                            <div style="display: flex; gap: 1rem; margin-bottom: 1.5rem;">
-                                <button class="btn btn-primary" onclick="executeRequest('{route['path']}', '{route['method']}', '{endpoint_id}')">
-                                    <i class="fas fa-paper-plane"></i>
-                                    Execute
-                                </button>
-                                <button class="btn btn-secondary" onclick="clearResponse('{endpoint_id}')">
-                                    <i class="fas fa-trash"></i>
-                                    Clear
-                                </button>'''
+            if group:
+                group_badge = f'<div class="group-badge"><i class="fas fa-folder"></i> {group}</div>'
             
-            if route['parameters']:
-                fill_button = f'''
-                                <button class="btn btn-secondary" onclick="fillExample('{endpoint_id}')">
-                                    <i class="fas fa-magic"></i>
-                                    Fill Example
-                                </button>'''
-                html += fill_button
+            tier_data = _TIER_BADGES.get(route['tier'], _UNKNOWN_TIER_BADGE)
+            method = route['method']
             
-            html += f'''
-                            </div>
-                            
-                            <div class="response-section">
-                                <div id="response-{endpoint_id}"></div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            '''
-        
-        return html
+            parts.append(_ENDPOINT_TMPL.format_map({
+                'endpoint_id': html.escape(endpoint_id),
+                'endpoint_js': _js_arg(endpoint_id),
+                'path_js': _js_arg(route['path']),
+                'method_js': _js_arg(method),
+                'tier': route['tier'],
+                'tags': ','.join(tags),
+                'group': group,
+                'method': method,
+                'method_lower': method.lower(),
+                'path': path,
+                'group_badge': group_badge,
+                'color': tier_data['color'],
+                'icon': tier_data['icon'],
+                'performance': tier_data['performance'],
+                'summary': html.escape(route.get('summary', route.get('description', 'No description available'))),
+                'tags_html': tags_html,
+                'params_html': params_html,
+                'fill_button': (_FILL_BUTTON_TMPL.format(endpoint_js=_js_arg(endpoint_id))
+                                if route['parameters'] else ''),
+            }))
+        
+        return "".join(parts)
 
     def _generate_groups_view(self, all_groups):
         """Generate the groups view with organized routes."""
-        html = ""
+        parts = []
         for group_name in sorted(all_groups.keys()):
             routes = all_groups[group_name]
-            html += f'''
+            parts.append(f'''
                 <div class="group-section">
                     <div class="group-header">
                         <div class="group-icon">
                             <i class="fas fa-folder"></i>
                         </div>
                         <div class="group-info">
-                            <div class="group-title">{group_name}</div>
+                            <div class="group-title">{html.escape(group_name)}</div>
                             <div class="group-description">{len(routes)} endpoints in this group</div>
                         </div>
                         <div class="group-stats">
@@ -2602,17 +1268,17 @@ class Sufast:
                         {self._generate_modern_routes(routes, f'group_{group_name.lower().replace(" ", "_")}')}
                     </div>
                 </div>
-            '''
-        return html
+            ''')
+        return "".join(parts)
     
     def _generate_tags_view(self, sorted_tags, all_groups):
         """Generate the tags view with tag-based organization."""
-        html = '''
+        parts = ['''
             <div class="tags-overview">
                 <h3><i class="fas fa-tags"></i> All Tags</h3>
                 <p>Click on any tag to see related endpoints</p>
             </div>
-        '''
+        ''']
         
         for tag in sorted_tags:
             # Get all routes with this tag
@@ -2623,15 +1289,16 @@ class Sufast:
                         tagged_routes.append(route)
             
             if tagged_routes:
-                html += f'''
-                    <div class="tag-section" data-tag="{tag}">
+                label = html.escape(tag)
+                parts.append(f'''
+                    <div class="tag-section" data-tag="{label}">
                         <div class="tag-header">
                             <div class="tag-icon">
                                 <i class="fas fa-tag"></i>
                             </div>
                             <div class="tag-info">
-                                <div class="tag-title">#{tag}</div>
-                                <div class="tag-description">{len(tagged_routes)} endpoints tagged with "{tag}"</div>
+                                <div class="tag-title">#{label}</div>
+                                <div class="tag-description">{len(tagged_routes)} endpoints tagged with "{label}"</div>
                             </div>
                             <div class="tag-count">{len(tagged_routes)}</div>
                         </div>
@@ -2639,23 +1306,15 @@ class Sufast:
                             {self._generate_modern_routes(tagged_routes, f'tag_{tag}')}
                         </div>
                     </div>
-                '''
+                ''')
         
-        return html
+        return "".join(parts)
 
-    def _get_example_value(self, param_name):
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _get_example_value(param_name):
         """Get example values for common parameter names."""
-        examples = {
-            'user_id': '1',
-            'product_id': '1', 
-            'id': '1',
-            'slug': 'ultimate-rust-performance',
-            'category': 'electronics',
-            'query': 'python',
-            'name': 'alice',
-            'email': 'user@example.com'
-        }
-        return examples.get(param_name.lower(), f'example_{param_name}')
+        return _EXAMPLE_VALUES.get(param_name.lower(), f'example_{param_name}')
 
     def get(self, path: str, **kwargs):
         """GET route decorator - FastAPI style."""
@@ -2682,8 +1341,8 @@ class Sufast:
         try:
             stats_ptr = self.rust_core.get_performance_stats()
             if stats_ptr:
-                stats_json = ctypes.string_at(stats_ptr).decode('utf-8')
-                rust_stats = json.loads(stats_json)
+                # orjson parses the bytes directly
+                rust_stats = _json.loads(ctypes.string_at(stats_ptr))
                 
                 # Add Python-side stats
                 python_stats = {
@@ -2723,6 +1382,12 @@ class Sufast:
             debug: Enable debug mode
             doc: Enable interactive documentation at /docs
         """
+        if debug:
+            configure_logging(level="debug")
+        
+        print("🚀 Welcome to Sufast - The Ultimate Python Web Framework")
+        print()
+        
         # Enable docs if requested
         if doc:
             self.docs_enabled = True
@@ -2744,21 +1409,37 @@ class Sufast:
             print(f"  ⚡ Dynamic: {len(self.dynamic_routes)} ({dynamic_pct:.1f}%)")
             print()
         
+        self._flush_static_routes()
+        
         print(f"🌐 Server starting on http://{host}:{port}")
         if doc:
             print(f"📖 Documentation: http://{host}:{port}/docs")
         # print("🔥 Press Ctrl+C to stop")
         
+        outcome = {}
+        
+        def serve():
+            # ctypes drops the GIL for the whole blocking call
+            try:
+                outcome['result'] = self.rust_core.start_ultra_fast_server(host.encode('utf-8'), port)
+            except Exception as e:
+                outcome['error'] = e
+        
+        # Serve from a daemon thread so the main thread stays in Python and
+        # can take Ctrl+C (a signal is only handled between bytecodes)
+        server_thread = threading.Thread(target=serve, name="sufast-rust-server", daemon=True)
         try:
-            # This blocks and runs the fast server
-            host_bytes = host.encode('utf-8')
-            result = self.rust_core.start_ultra_fast_server(host_bytes, port)
-            if result != 0:
-                print(f"❌ Server failed with code: {result}")
+            server_thread.start()
+            while server_thread.is_alive():
+                server_thread.join(0.2)
         except KeyboardInterrupt:
             print("\n🔄 Server stopped by user")
-        except Exception as e:
-            print(f"❌ Server error: {e}")
+            return
+        
+        if 'error' in outcome:
+            print(f"❌ Server error: {outcome['error']}")
+        elif outcome.get('result', 0) != 0:
+            print(f"❌ Server failed with code: {outcome['result']}")
 
     # ========================================
     # ENHANCED HTTP METHOD DECORATORS
@@ -2833,70 +1514,36 @@ class Sufast:
                 response = func()
                 
                 # Normalize response format
-                if isinstance(response, dict) and 'body' in response and 'status' in response:
-                    body = response['body']
-                    status = response['status']
-                    content_type = response.get('headers', {}).get('Content-Type', 'application/json')
-                elif isinstance(response, tuple) and len(response) == 2:
-                    body, status = response
-                    if isinstance(body, dict):
-                        body = json.dumps(body)
-                    content_type = 'application/json'
-                else:
-                    body = json.dumps(response) if isinstance(response, dict) else str(response)
-                    status = 200
-                    content_type = 'application/json'
+                normalize = _by_type(_STATIC_NORMALIZERS, response, _static_from_other)
+                body, status, content_type = normalize(response)
                 
                 # Register as ultra-fast static route
-                success = self.rust_core.add_static_route(
-                    route_key.encode('utf-8'),
-                    body.encode('utf-8'),
-                    status,
-                    content_type.encode('utf-8')
-                )
+                success = self._add_static_response(route_key, body, status, content_type)
                 
                 if success:
                     self.static_routes[route_key] = func
                 else:
-                    print(f"⚠️ Failed to register static route: {route_key}")
+                    _log.warning("Failed to register static route", route=route_key)
                     is_static = False
                     
             except Exception as e:
-                print(f"⚠️ Failed to pre-compile {path}: {e}")
+                _log.warning("Failed to pre-compile route", path=path, error=str(e))
                 is_static = False
         
         if not is_static:
             # Dynamic/Cached routes
-            success = self.rust_core.add_dynamic_route(
-                method.encode('utf-8'),
-                path.encode('utf-8'),
-                func.__name__.encode('utf-8'),
-                cache_ttl
-            )
+            # Store for Python callback
+            handler_info = self._add_dynamic_route_entry(method, route_key, path, func, cache_ttl)
+            success = self._add_core_dynamic_route(method, path, func, cache_ttl, handler_info)
             
             if success:
                 if is_cached:
                     self.cached_routes[route_key] = func
-            
-            # Compile regex for parameter extraction
-            pattern_str = path
-            for match in re.finditer(r'\{(\w+)\}', path):
-                param_name = match.group(1)
-                pattern_str = pattern_str.replace(f'{{{param_name}}}', f'(?P<{param_name}>[^/]+)')
-            
-            pattern_str = f"^{pattern_str}$"
-            compiled_pattern = re.compile(pattern_str)
-            
-            # Store for Python callback
-            self.dynamic_routes[route_key] = {
-                'handler': func,
-                'regex': compiled_pattern,
-                'cache_ttl': cache_ttl,
-                'pattern': path
-            }
         
         # Always store in routes for reference
         self.routes[route_key] = func
+        self._exact_routes[method, path] = func
+        self._routes_index_json = None
         
         # Store metadata for auto-generated docs
         self._store_route_metadata(path, method, func, is_static, is_cached, cache_ttl, tags, group, summary, description)
@@ -3041,6 +1688,126 @@ class RouteGroup:
             return decorator
 
 
+# ========================================
+# DOCS PAGE ASSETS
+# ========================================
+
+# Static parts of the /docs page, spliced into the generated HTML as-is
+_NO_ROUTES_HTML = '''
+                <div style="text-align: center; padding: 4rem 2rem; color: #64748b;">
+                    <i class="fas fa-inbox" style="font-size: 4rem; margin-bottom: 1rem; opacity: 0.5;"></i>
+                    <h3 style="margin-bottom: 0.5rem; color: #475569;">No routes found</h3>
+                    <p>No routes have been registered in this tier yet.</p>
+                </div>
+            '''
+
+# Per-route /docs fragments, filled with str.format / format_map
+_PARAM_TMPL = '''
+                        <div class="parameter">
+                            <div class="parameter-header">
+                                <div class="parameter-name">{name}</div>
+                                <div class="parameter-type">{type}</div>
+                            </div>
+                            <input type="text" class="parameter-input" 
+                                   data-param="{name}" 
+                                   data-example="{example}"
+                                   placeholder="Enter {name}" 
+                                   value="{example}">
+                        </div>
+                    '''
+
+_FILL_BUTTON_TMPL = '''
+                                <button class="btn btn-secondary" onclick="fillExample({endpoint_js})">
+                                    <i class="fas fa-magic"></i>
+                                    Fill Example
+                                </button>'''
+
+_ENDPOINT_TMPL = '''
+                <div class="endpoint {tier}" id="{endpoint_id}" data-tags="{tags}" data-group="{group}">
+                    <div class="endpoint-header" onclick="toggleEndpoint({endpoint_js})">
+                        <div class="endpoint-left">
+                            <div class="method-badge method-{method_lower}">{method}</div>
+                            <div class="endpoint-path">{path}</div>
+                            {group_badge}
+                        </div>
+                        <div class="endpoint-right">
+                            <div class="performance-badge {color}">
+                                <i class="{icon}"></i> 
+                                {performance}
+                            </div>
+                            <i class="fas fa-chevron-down expand-icon"></i>
+                        </div>
+                    </div>
+                    
+                    <div class="endpoint-body">
+                        <div class="endpoint-meta">
+                            <div class="meta-row">
+                                <div class="meta-item">
+                                    <strong>Summary:</strong> {summary}
+                                </div>
+                            </div>
+                            {tags_html}
+                        </div>
+                        
+                        {params_html}
+                        
+                        <div class="try-section">
+                            <div class="try-header">
+                                <h4><i class="fas fa-play-circle"></i> Try it out</h4>
+                            </div>
+                            
+                            <div style="display: flex; gap: 1rem; margin-bottom: 1.5rem;">
+                                <button class="btn btn-primary" onclick="executeRequest({path_js}, {method_js}, {endpoint_js})">
+                                    <i class="fas fa-paper-plane"></i>
+                                    Execute
+                                </button>
+                                <button class="btn btn-secondary" onclick="clearResponse({endpoint_js})">
+                                    <i class="fas fa-trash"></i>
+                                    Clear
+                                </button>{fill_button}
+                            </div>
+                            
+                            <div class="response-section">
+                                <div id="response-{endpoint_id}"></div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            '''
+
+_TIER_BADGES = {
+    'static': {'performance': '', 'icon': 'fas fa-bolt', 'color': 'tier-static'},
+    'cached': {'performance': '', 'icon': 'fas fa-memory', 'color': 'tier-cached'},
+    'dynamic': {'performance': '', 'icon': 'fas fa-cogs', 'color': 'tier-dynamic'},
+}
+_UNKNOWN_TIER_BADGE = {'performance': 'Unknown', 'icon': 'fas fa-question', 'color': ''}
+
+# Sample values prefilled into the docs "Try it out" inputs
+_EXAMPLE_VALUES = {
+    'user_id': '1',
+    'product_id': '1',
+    'id': '1',
+    'slug': 'ultimate-rust-performance',
+    'category': 'electronics',
+    'query': 'python',
+    'name': 'alice',
+    'email': 'user@example.com',
+}
+
+# Stylesheet and script of the page, shipped in sufast/docui with the
+# OpenAPI doc UIs
+_DOCS_CSS = read_docui_asset("ultimate.css")
+_DOCS_JS = read_docui_asset("ultimate.js")
+
+# The stylesheet and script are served from the core's static tier (which
+# sends a year-long max-age), versioned by content hash so edits bust it
+_DOCS_ASSET_VERSION = hashlib.sha1((_DOCS_CSS + _DOCS_JS).encode('utf-8')).hexdigest()[:12]
+_DOCS_ASSETS = (
+    ('/_sufast/docs.css', _DOCS_CSS, 'text/css; charset=utf-8'),
+    ('/_sufast/docs.js', _DOCS_JS, 'application/javascript; charset=utf-8'),
+)
+
+
 def create_app():
     """Create a new Sufast application instance."""
     return Sufast()
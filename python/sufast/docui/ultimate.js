@@ -0,0 +1,496 @@
+        function showTab(tabName) {
+            document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
+            document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
+            
+            document.getElementById(tabName).classList.add('active');
+            event.target.classList.add('active');
+        }
+        
+        function toggleEndpoint(endpointId) {
+            const endpoint = document.getElementById(endpointId);
+            const isActive = endpoint.classList.contains('active');
+            
+            document.querySelectorAll('.endpoint').forEach(ep => ep.classList.remove('active'));
+            
+            if (!isActive) {
+                endpoint.classList.add('active');
+            }
+        }
+        
+        async function executeRequest(path, method, endpointId) {
+            const inputs = document.getElementById(endpointId).querySelectorAll('.parameter-input');
+            let url = path;
+            
+            for (const input of inputs) {
+                const paramName = input.dataset.param;
+                const value = input.value.trim();
+                if (!value) {
+                    alert(`Please enter a value for parameter: ${paramName}`);
+                    input.focus();
+                    return;
+                }
+                url = url.replace(`{${paramName}}`, encodeURIComponent(value));
+            }
+            
+            const responseContainer = document.getElementById(`response-${endpointId}`);
+            responseContainer.innerHTML = '<div class="loading"><i class="fas fa-spinner"></i> Executing request...</div>';
+            
+            try {
+                const start = performance.now();
+                const response = await fetch(url, {
+                    method: method,
+                    headers: {
+                        'Accept': 'application/json',
+                        'Cache-Control': 'no-cache'
+                    }
+                });
+                const end = performance.now();
+                const responseTime = Math.round(end - start);
+                
+                const contentType = response.headers.get('content-type') || 'text/plain';
+                let data;
+                let isJson = false;
+                
+                if (contentType.includes('application/json')) {
+                    data = await response.json();
+                    isJson = true;
+                } else {
+                    const text = await response.text();
+                    try {
+                        data = JSON.parse(text);
+                        isJson = true;
+                    } catch {
+                        data = { raw_response: text, content_type: contentType };
+                        isJson = false;
+                    }
+                }
+                
+                // Determine response type for styling
+                let responseType = 'info';
+                let statusIcon = 'fas fa-info-circle';
+                let statusText = response.statusText;
+                
+                if (response.status >= 200 && response.status < 300) {
+                    responseType = 'success';
+                    statusIcon = 'fas fa-check-circle';
+                } else if (response.status >= 400 && response.status < 500) {
+                    responseType = 'warning';
+                    statusIcon = 'fas fa-exclamation-triangle';
+                } else if (response.status >= 500) {
+                    responseType = 'error';
+                    statusIcon = 'fas fa-times-circle';
+                }
+                
+                // Format the response data with syntax highlighting if it's JSON
+                let formattedData;
+                if (isJson) {
+                    formattedData = syntaxHighlightJson(JSON.stringify(data, null, 2));
+                } else {
+                    formattedData = escapeHtml(typeof data === 'string' ? data : JSON.stringify(data, null, 2));
+                }
+                
+                responseContainer.innerHTML = `
+                    <div class="response-container ${responseType}">
+                        <div class="response-header ${responseType}">
+                            <div class="response-title">
+                                <i class="${statusIcon}"></i>
+                                Response
+                            </div>
+                            <div class="response-status">
+                                <div class="status-badge ${responseType}">
+                                    ${response.status} ${statusText}
+                                </div>
+                                <div class="timing-badge">
+                                    ${responseTime}ms
+                                </div>
+                            </div>
+                        </div>
+                        <div class="response-body ${responseType}">
+                            <div class="response-content">
+                                <button class="copy-button" onclick="copyResponse(this.closest('.endpoint').id)">
+                                    <i class="fas fa-copy"></i>
+                                    Copy
+                                </button>
+                                ${formattedData}
+                            </div>
+                            <div class="response-meta">
+                                <span class="content-type-badge">${contentType}</span>
+                                <span>Size: ${new Blob([typeof data === 'string' ? data : JSON.stringify(data)]).size} bytes</span>
+                            </div>
+                        </div>
+                    </div>
+                `;
+            } catch (error) {
+                responseContainer.innerHTML = `
+                    <div class="response-container error">
+                        <div class="response-header error">
+                            <div class="response-title">
+                                <i class="fas fa-exclamation-triangle"></i>
+                                Network Error
+                            </div>
+                            <div class="response-status">
+                                <div class="status-badge error">Failed</div>
+                            </div>
+                        </div>
+                        <div class="response-body error">
+                            <div class="response-content">
+                                <button class="copy-button" onclick="copyResponse(this.closest('.endpoint').id)">
+                                    <i class="fas fa-copy"></i>
+                                    Copy
+                                </button>
+                                ${syntaxHighlightJson(JSON.stringify({ 
+                                    error: error.message,
+                                    type: error.name,
+                                    timestamp: new Date().toISOString()
+                                }, null, 2))}
+                            </div>
+                            <div class="response-meta">
+                                <span class="content-type-badge">application/json</span>
+                                <span>Request failed to complete</span>
+                            </div>
+                        </div>
+                    </div>
+                `;
+            }
+        }
+        
+        function syntaxHighlightJson(json) {
+            return json.replace(/("(\\u[a-zA-Z0-9]{4}|\\[^u]|[^\\"])*"(\s*:)?|\b(true|false|null)\b|-?\d+(?:\.\d*)?(?:[eE][+\-]?\d+)?)/g, function (match) {
+                let cls = 'json-number';
+                if (/^"/.test(match)) {
+                    if (/:$/.test(match)) {
+                        cls = 'json-key';
+                    } else {
+                        cls = 'json-string';
+                    }
+                } else if (/true|false/.test(match)) {
+                    cls = 'json-boolean';
+                } else if (/null/.test(match)) {
+                    cls = 'json-null';
+                }
+                return '<span class="' + cls + '">' + match + '</span>';
+            });
+        }
+        
+        function escapeHtml(text) {
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
+        }
+        
+        function copyResponse(endpointId) {
+            const responseContent = document.getElementById(`response-${endpointId}`).querySelector('.response-content');
+            if (responseContent) {
+                // Clone the content to avoid modifying the original
+                const clone = responseContent.cloneNode(true);
+                
+                // Remove the copy button from the clone
+                const copyButton = clone.querySelector('.copy-button');
+                if (copyButton) {
+                    copyButton.remove();
+                }
+                
+                // Get clean text content without HTML tags and button text
+                const cleanText = (clone.textContent || clone.innerText || '').trim();
+                
+                navigator.clipboard.writeText(cleanText).then(() => {
+                    const button = responseContent.querySelector('.copy-button');
+                    if (button) {
+                        const originalHTML = button.innerHTML;
+                        
+                        // Show success state
+                        button.innerHTML = '<i class="fas fa-check"></i> Copied';
+                        button.classList.add('copied');
+                        
+                        // Reset after 2 seconds
+                        setTimeout(() => {
+                            button.innerHTML = originalHTML;
+                            button.classList.remove('copied');
+                        }, 2000);
+                    }
+                }).catch(err => {
+                    console.error('Failed to copy response:', err);
+                    const button = responseContent.querySelector('.copy-button');
+                    if (button) {
+                        const originalHTML = button.innerHTML;
+                        
+                        // Show error state
+                        button.innerHTML = '<i class="fas fa-times"></i> Failed';
+                        button.style.background = '#ef4444';
+                        button.style.color = 'white';
+                        button.style.borderColor = '#ef4444';
+                        
+                        // Reset after 2 seconds
+                        setTimeout(() => {
+                            button.innerHTML = originalHTML;
+                            button.style.background = '';
+                            button.style.color = '';
+                            button.style.borderColor = '';
+                        }, 2000);
+                    }
+                });
+            }
+        }
+        
+        function clearResponse(endpointId) {
+            document.getElementById(`response-${endpointId}`).innerHTML = '';
+        }
+        
+        function fillExample(endpointId) {
+            const inputs = document.getElementById(endpointId).querySelectorAll('.parameter-input');
+            inputs.forEach(input => {
+                if (input.dataset.example) {
+                    input.value = input.dataset.example;
+                }
+            });
+        }
+        
+        // ========================================
+        // ENHANCED NAVIGATION AND FILTERING
+        // ========================================
+        
+        function switchView(viewName) {
+            // Hide all views
+            document.querySelectorAll('.view-content').forEach(view => view.classList.remove('active'));
+            document.querySelectorAll('.view-mode').forEach(mode => mode.classList.remove('active'));
+            
+            // Show selected view
+            document.getElementById(viewName + '-view').classList.add('active');
+            document.querySelector(`[data-view="${viewName}"]`).classList.add('active');
+            
+            // Clear any active filters
+            clearAllFilters();
+        }
+        
+        function filterByTag(tagName) {
+            const tagFilter = document.querySelector(`.tag-filter[data-tag="${CSS.escape(tagName)}"]`);
+            const isActive = tagFilter.classList.contains('active');
+            
+            if (isActive) {
+                // Remove filter
+                tagFilter.classList.remove('active');
+                showAllEndpoints();
+            } else {
+                // Clear other filters and apply this one
+                document.querySelectorAll('.tag-filter').forEach(filter => filter.classList.remove('active'));
+                tagFilter.classList.add('active');
+                
+                // Hide all endpoints
+                document.querySelectorAll('.endpoint').forEach(endpoint => {
+                    endpoint.style.display = 'none';
+                });
+                
+                // Show endpoints with this tag
+                document.querySelectorAll(`.endpoint[data-tags*="${CSS.escape(tagName)}"]`).forEach(endpoint => {
+                    endpoint.style.display = 'block';
+                });
+                
+                // Update counters
+                updateFilterCounters();
+            }
+        }
+        
+        function clearAllFilters() {
+            document.querySelectorAll('.tag-filter').forEach(filter => filter.classList.remove('active'));
+            showAllEndpoints();
+        }
+        
+        function showAllEndpoints() {
+            document.querySelectorAll('.endpoint').forEach(endpoint => {
+                endpoint.style.display = 'block';
+            });
+            updateFilterCounters();
+        }
+        
+        function updateFilterCounters() {
+            // Update route counts in tier headers
+            document.querySelectorAll('.tier-section').forEach(section => {
+                const visibleRoutes = section.querySelectorAll('.endpoint[style*="block"], .endpoint:not([style])');
+                const counter = section.querySelector('.route-count');
+                if (counter) {
+                    counter.textContent = `${visibleRoutes.length} routes`;
+                }
+            });
+        }
+        
+        function highlightMatchingTags(searchTerm) {
+            document.querySelectorAll('.route-tag').forEach(tag => {
+                if (tag.textContent.toLowerCase().includes(searchTerm.toLowerCase())) {
+                    tag.style.background = 'linear-gradient(135deg, #667eea, #764ba2)';
+                    tag.style.color = 'white';
+                } else {
+                    tag.style.background = '';
+                    tag.style.color = '';
+                }
+            });
+        }
+        
+        function searchRoutes(query) {
+            const searchTerm = query.toLowerCase();
+            
+            document.querySelectorAll('.endpoint').forEach(endpoint => {
+                const path = endpoint.querySelector('.endpoint-path').textContent.toLowerCase();
+                const description = endpoint.querySelector('.meta-item').textContent.toLowerCase();
+                const tags = endpoint.getAttribute('data-tags').toLowerCase();
+                const group = endpoint.getAttribute('data-group').toLowerCase();
+                
+                const matches = path.includes(searchTerm) || 
+                              description.includes(searchTerm) || 
+                              tags.includes(searchTerm) || 
+                              group.includes(searchTerm);
+                
+                endpoint.style.display = matches ? 'block' : 'none';
+            });
+            
+            updateFilterCounters();
+            highlightMatchingTags(searchTerm);
+        }
+        
+        // ========================================
+        // ENHANCED ROUTE INTERACTION
+        // ========================================
+        
+        function showTab(tabName) {
+            document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
+            document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
+            
+            document.getElementById(tabName).classList.add('active');
+            event.target.classList.add('active');
+            
+            // Clear filters when switching tabs
+            clearAllFilters();
+        }
+        
+        function toggleEndpoint(endpointId) {
+            const endpoint = document.getElementById(endpointId);
+            const isActive = endpoint.classList.contains('active');
+            
+            document.querySelectorAll('.endpoint').forEach(ep => ep.classList.remove('active'));
+            
+            if (!isActive) {
+                endpoint.classList.add('active');
+                endpoint.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+            }
+        }
+        
+        // ========================================
+        // PAGE INITIALIZATION AND VERSION FETCHING
+        // ========================================
+        
+        // Version fetching from GitHub API
+        async function fetchLatestVersion() {
+            try {
+                const response = await fetch('https://api.github.com/repos/shohan-dev/sufast/releases/latest', {
+                    method: 'GET',
+                    headers: {
+                        'Accept': 'application/vnd.github.v3+json'
+                    }
+                });
+                if (response.ok) {
+                    const data = await response.json();
+                    const versionBadge = document.getElementById('version-badge');
+                    if (data.tag_name && versionBadge) {
+                        versionBadge.textContent = data.tag_name;
+                        console.log('Version updated to:', data.tag_name);
+                    }
+                } else {
+                    console.warn('Could not fetch latest version, using default');
+                }
+            } catch (error) {
+                console.warn('Error fetching version:', error);
+                // Fallback to default version
+                const versionBadge = document.getElementById('version-badge');
+                if (versionBadge) {
+                    versionBadge.textContent = 'v2.0';
+                }
+            }
+        }
+        
+        // Page initialization with loading sequence
+        async function initializePage() {
+            const pageLoader = document.getElementById('pageLoader');
+            const mainContent = document.getElementById('mainContent');
+            
+            console.log('Starting page initialization...');
+            
+            try {
+                // Ensure elements exist
+                if (!pageLoader || !mainContent) {
+                    console.error('Required elements not found:', { pageLoader: !!pageLoader, mainContent: !!mainContent });
+                    // If elements don't exist, just show everything
+                    document.body.style.opacity = '1';
+                    return;
+                }
+                
+                // Start version fetching (don't wait for it)
+                fetchLatestVersion().catch(e => console.warn('Version fetch failed:', e));
+                
+                // Minimum loading time for better UX
+                await new Promise(resolve => setTimeout(resolve, 1000));
+                
+                console.log('Initialization complete, showing content...');
+                
+            } catch (error) {
+                console.warn('Initialization error:', error);
+            } finally {
+                // Always show content after initialization
+                if (pageLoader) {
+                    pageLoader.classList.add('hidden');
+                }
+                if (mainContent) {
+                    mainContent.classList.add('loaded');
+                }
+                
+                // Remove loader from DOM after transition
+                setTimeout(() => {
+                    if (pageLoader && pageLoader.parentNode) {
+                        pageLoader.parentNode.removeChild(pageLoader);
+                    }
+                }, 500);
+                
+                console.log('Content displayed successfully');
+            }
+        }
+        
+        // Enhanced page load handling with multiple triggers
+        function startInitialization() {
+            console.log('Document ready state:', document.readyState);
+            console.log('Starting initialization...');
+            initializePage();
+        }
+        
+        // Multiple event listeners to ensure initialization happens
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', startInitialization);
+            console.log('Added DOMContentLoaded listener');
+        } else if (document.readyState === 'interactive' || document.readyState === 'complete') {
+            // Document already loaded
+            console.log('Document already ready, starting initialization');
+            setTimeout(startInitialization, 100);
+        }
+        
+        // Additional load event listener
+        window.addEventListener('load', () => {
+            console.log('Window load event fired');
+            // Extra check in case other events didn't work
+            setTimeout(() => {
+                const pageLoader = document.getElementById('pageLoader');
+                if (pageLoader && !pageLoader.classList.contains('hidden')) {
+                    console.log('Load event backup initialization');
+                    startInitialization();
+                }
+            }, 100);
+        });
+        
+        // Backup initialization in case events don't fire
+        setTimeout(() => {
+            const pageLoader = document.getElementById('pageLoader');
+            const mainContent = document.getElementById('mainContent');
+            if (pageLoader && !pageLoader.classList.contains('hidden')) {
+                console.log('Backup initialization triggered');
+                pageLoader.classList.add('hidden');
+                if (mainContent) {
+                    mainContent.classList.add('loaded');
+                }
+            }
+        }, 2000); // 2 second backup timeout
@@ -21,8 +21,14 @@ class Request:
             name = request.query_params.get("name", "")
             token = request.headers.get("authorization", "")
             return {"user": data, "name": name}
+    
+    Attributes are fixed; per-request data from middleware goes in ``state``.
     """
     
+    __slots__ = ('method', 'path', 'headers', 'body', 'query_string',
+                 '_query_params', '_json_data', '_form_data', '_cookies',
+                 'path_params', 'remote_addr', 'state')
+    
     def __init__(self, method: str, path: str, headers: Dict[str, str], 
                  body: Union[bytes, str], query_string: str = "",
                  path_params: Optional[Dict[str, str]] = None,
@@ -165,6 +171,8 @@ class Request:
 class Response:
     """HTTP Response object for building responses."""
     
+    __slots__ = ('content', 'status', 'headers', 'content_type', '_cookies')
+    
     def __init__(self, content: Any = None, status: int = 200, 
                  headers: Optional[Dict[str, str]] = None, 
                  content_type: str = 'application/json'):
@@ -172,7 +180,7 @@ class Response:
         self.status = status
         self.headers = headers or {}
         self.content_type = content_type
-        self._cookies = SimpleCookie()
+        self._cookies: Optional[SimpleCookie] = None  # Created on first set_cookie
     
     def set_header(self, name: str, value: str) -> 'Response':
         """Set response header."""
@@ -184,6 +192,8 @@ class Response:
                    domain: Optional[str] = None, secure: bool = False,
                    httponly: bool = False, samesite: Optional[str] = None) -> 'Response':
         """Set cookie in response."""
+        if self._cookies is None:
+            self._cookies = SimpleCookie()
         self._cookies[name] = value
         if max_age is not None:
             self._cookies[name]['max-age'] = max_age
@@ -211,7 +221,7 @@ class Response:
         headers['content-type'] = self.content_type
         
         # Add cookies to headers
-        for cookie in self._cookies.values():
+        for cookie in (self._cookies.values() if self._cookies else ()):
             if 'set-cookie' not in headers:
                 headers['set-cookie'] = []
             elif not isinstance(headers['set-cookie'], list):
@@ -15,7 +15,7 @@ from typing import Any, Dict
 _DOCUI_DIR = Path(__file__).with_name("docui")
 
 
-def _read_docui_asset(filename: str) -> str:
+def read_docui_asset(filename: str) -> str:
     """Read a doc UI asset as UTF-8 text."""
     path = _DOCUI_DIR / filename
     try:
@@ -69,9 +69,9 @@ def generate_swagger_html(openapi_spec: dict, theme: str = "default") -> str:
     version = info.get("version", "1.0.0")
     description = info.get("description", "Interactive API documentation.")
 
-    css = _read_docui_asset("swagger.css")
-    js = _read_docui_asset("swagger.js")
-    html_template = _read_docui_asset("swagger.html")
+    css = read_docui_asset("swagger.css")
+    js = read_docui_asset("swagger.js")
+    html_template = read_docui_asset("swagger.html")
 
     default_theme = "dark" if theme not in {"light", "dark"} else theme
     context = {
@@ -91,9 +91,9 @@ def generate_redoc_html(openapi_spec: dict) -> str:
     """Generate `/redoc` HTML from OpenAPI spec."""
     title = openapi_spec.get("info", {}).get("title", "Sufast API")
 
-    css = _read_docui_asset("redoc.css")
-    js = _read_docui_asset("redoc.js")
-    html_template = _read_docui_asset("redoc.html")
+    css = read_docui_asset("redoc.css")
+    js = read_docui_asset("redoc.js")
+    html_template = read_docui_asset("redoc.html")
 
     context = {
         "TITLE": html_escape(str(title)),
@@ -1,5 +1,9 @@
 """Unit tests for core app behavior via public API."""
 
+import sys
+
+import pytest
+
 from sufast import App
 from sufast.testclient import TestClient
 
@@ -68,3 +72,194 @@ def test_handler_exception_returns_500():
         response = client.get("/error")
         assert response.status_code == 500
         assert "Internal Server Error" in response.text
+
+
+def test_ffi_request_handler_returns_json_envelope():
+    import json
+
+    app = App()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id):
+        return {"item_id": item_id}
+
+    envelope = json.loads(app._handle_ffi_request(b"GET", b"/items/5", b"{}"))
+    assert envelope["status"] == 200
+    assert json.loads(envelope["body"]) == {"item_id": "5"}
+
+    missing = json.loads(app._handle_ffi_request(b"GET", b"/nope", b""))
+    assert missing["status"] == 404
+
+
+def test_router_buckets_pattern_routes_and_names():
+    app = App()
+
+    @app.get("/users/{user_id}")
+    def get_user(user_id):
+        return {"user_id": user_id}
+
+    @app.delete("/users/{user_id}")
+    def delete_user(user_id):
+        return {"deleted": user_id}
+
+    route, params = app._router.find("delete", "/users/3")
+    assert route.handler is delete_user and params == {"user_id": "3"}
+    assert app._router.find("PUT", "/users/3") is None
+    assert app.url_for("get_user", user_id=7) == "/users/7"
+    with pytest.raises(ValueError):
+        app.url_for("missing")
+
+
+def test_ffi_callback_reuses_its_response_buffer():
+    import ctypes
+    import json
+
+    app = App()
+
+    @app.get("/echo/{text}")
+    def echo(text):
+        return {"text": text}
+
+    callback = app._make_ffi_callback()
+    first = callback(b"GET", b"/echo/hi", b"{}")
+    assert json.loads(json.loads(ctypes.string_at(first))["body"]) == {"text": "hi"}
+    assert callback(b"GET", b"/echo/again", b"{}") == first
+
+    big = callback(b"GET", b"/echo/" + b"x" * 10000, b"{}")
+    envelope = json.loads(ctypes.string_at(big))
+    assert json.loads(envelope["body"]) == {"text": "x" * 10000}
+
+
+def test_ffi_request_runs_async_handlers_on_shared_loop():
+    import json
+
+    app = App()
+
+    @app.get("/greet/{name}")
+    async def greet(name, request=None):
+        return {"hello": name}
+
+    assert app._router.find("GET", "/greet/x")[0].arg_names == ("name", "request")
+    for name in ("a", "b"):
+        envelope = json.loads(app._handle_ffi_request(b"GET", b"/greet/" + name.encode(), b""))
+        assert json.loads(envelope["body"]) == {"hello": name}
+    assert app._ffi_loop.is_running()
+
+
+def test_ffi_request_hides_error_details_unless_debug(capsys):
+    import json
+
+    for debug in (False, True):
+        app = App(debug=debug)
+
+        @app.get("/boom")
+        def boom():
+            raise RuntimeError("secret")
+
+        envelope = json.loads(app._handle_ffi_request(b"GET", b"/boom", b""))
+        assert envelope["status"] == 500
+        assert ("secret" in envelope["body"]) is debug
+        assert ("RuntimeError" in capsys.readouterr().err) is debug
+
+
+def test_format_handler_response_dispatches_on_type():
+    import json
+    from collections import OrderedDict
+
+    app = App()
+
+    assert app._format_handler_response("hi")["headers"]["Content-Type"] == "text/plain"
+    assert app._format_handler_response(None)["status"] == 204
+    assert app._format_handler_response([1], 201)["status"] == 201
+    assert json.loads(app._format_handler_response(OrderedDict(a=1))["body"]) == {"a": 1}
+    envelope = {"body": "x", "status": 202, "headers": {}}
+    assert app._format_handler_response(envelope) is envelope
+
+
+def test_rust_library_probe_is_cached_per_directory(tmp_path):
+    from sufast.app import _rust_library_candidates
+
+    _rust_library_candidates.cache_clear()
+    assert _rust_library_candidates(str(tmp_path)) == ()
+    (tmp_path / "libsufast_server.so").write_bytes(b"")
+    assert _rust_library_candidates(str(tmp_path)) == ()  # served from cache
+
+    _rust_library_candidates.cache_clear()
+    if sys.platform.startswith("linux"):
+        assert tmp_path / "libsufast_server.so" in _rust_library_candidates(str(tmp_path))
+    _rust_library_candidates.cache_clear()
+
+
+def test_rust_library_loader_is_cached(tmp_path):
+    from sufast.app import _load_rust_library
+
+    missing = str(tmp_path / "libsufast_server.so")
+    assert _load_rust_library(missing) is None
+    assert _load_rust_library.cache_info().currsize >= 1
+    _load_rust_library(missing)
+    assert _load_rust_library.cache_info().hits >= 1
+
+
+def test_ffi_request_inlines_json_bodies_when_core_supports_it():
+    import json
+
+    app = App()
+
+    @app.get("/data/{key}")
+    def data(key):
+        return {"key": key}
+
+    @app.get("/text/{key}")
+    def text(key):
+        return key
+
+    app._inline_json_body = True
+    envelope = json.loads(app._handle_ffi_request(b"GET", b"/data/a", b""))
+    assert envelope["body"] == {"key": "a"}
+    envelope = json.loads(app._handle_ffi_request(b"GET", b"/text/a", b""))
+    assert envelope["body"] == "a"
+
+
+def test_rust_callback_is_created_once_and_kept_alive():
+    from pathlib import Path
+
+    from sufast import app as app_module
+
+    lib_path = Path(app_module.__file__).with_name("sufast_server.so")
+    lib = app_module._load_rust_library(str(lib_path))
+    if lib is None:
+        pytest.skip("no compatible Rust core library built")
+
+    app = App()
+    app._rust_core = lib
+    app._register_rust_callback()
+    first = app._python_callback_ref
+    app._register_rust_callback()
+    assert app._python_callback_ref is first
+    assert app_module._installed_callbacks[lib._handle] is first
+
+
+def test_ffi_request_keeps_typed_path_params():
+    import json
+
+    app = App()
+
+    @app.get("/orders/{order_id:int}")
+    def order(order_id):
+        return {"order_id": order_id}
+
+    envelope = json.loads(
+        app._handle_ffi_request(b"GET", b"/orders/12", b'{"order_id":"12"}')
+    )
+    assert json.loads(envelope["body"]) == {"order_id": 12}
+
+
+def test_envelope_encoding_matches_generic_json():
+    import json
+
+    from sufast.app import _encode_envelope
+
+    plain = {"body": {"a": [1, 2]}, "status": 201, "headers": {"Content-Type": "application/json"}}
+    extra = {"body": "<p>", "status": 200, "headers": {"Content-Type": "text/html", "X-A": "1"}}
+    for resp in (plain, extra):
+        assert json.loads(_encode_envelope(resp)) == resp
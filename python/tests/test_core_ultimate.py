@@ -0,0 +1,353 @@
+"""Tests for the ultimate core (sufast.core_ultimate) against a fake Rust library."""
+
+import ctypes
+import json
+
+import pytest
+
+from sufast.core_ultimate import Sufast
+
+
+class FakeCore:
+    """Stand-in for the Rust library that records what Python registers.
+
+    Exports are plain functions stored on the instance, so optional ones
+    can be left out and ``argtypes``/``restype`` can be set on them.
+    """
+
+    def __init__(self, route_ids=False, static_batch=False):
+        self.static = {}
+        self.dynamic = []
+        self.callback = None
+        self.route_callback = None
+
+        def add_static_route(route_key, body, status, content_type):
+            self.static[route_key.decode()] = (body.decode(), status, content_type.decode())
+            return True
+
+        def add_dynamic_route(method, path, name, cache_ttl):
+            self.dynamic.append((method.decode(), path.decode(), cache_ttl, None))
+            return True
+
+        def set_python_callback(callback):
+            self.callback = callback
+
+        self.add_static_route = add_static_route
+        self.add_dynamic_route = add_dynamic_route
+        self.set_python_callback = set_python_callback
+        self.start_ultra_fast_server = lambda host, port: 0
+        self.get_performance_stats = lambda: None
+        self.clear_cache = lambda: True
+        self.precompile_static_routes = lambda: 0
+
+        if route_ids:
+            def add_dynamic_route_with_id(method, path, name, cache_ttl, route_id):
+                self.dynamic.append((method.decode(), path.decode(), cache_ttl, route_id))
+                return True
+
+            def set_python_route_callback(callback):
+                self.route_callback = callback
+
+            self.add_dynamic_route_with_id = add_dynamic_route_with_id
+            self.set_python_route_callback = set_python_route_callback
+
+        if static_batch:
+            self.batches = []
+
+            def add_static_routes_batch(payload, size):
+                # Like serde_json: any bad entry rejects the whole array
+                routes = json.loads(payload[:size])
+                for route_key, body, status, content_type in routes:
+                    if not isinstance(body, str) or not 0 <= status < 65536:
+                        return 0
+                self.batches.append(routes)
+                for route_key, body, status, content_type in routes:
+                    self.static[route_key] = (body, status, content_type)
+                return len(routes)
+
+            self.add_static_routes_batch = add_static_routes_batch
+
+    def call(self, method, path, params=b"{}"):
+        """Send a request through the path callback, returning the reply."""
+        return json.loads(ctypes.string_at(self.callback(method, path, params)))
+
+    def call_route(self, route_id, method, path, params=b"{}"):
+        """Send a request the core matched itself to the route callback."""
+        return json.loads(ctypes.string_at(self.route_callback(route_id, method, path, params)))
+
+    def route_id(self, path):
+        return next(route_id for _, pattern, _, route_id in self.dynamic if pattern == path)
+
+
+@pytest.fixture
+def make_app(monkeypatch):
+    """Build a Sufast app wired to a FakeCore, returning ``(app, core)``."""
+
+    def _build(**core_options):
+        core = FakeCore(**core_options)
+
+        def load(self):
+            self.rust_core = core
+            self._setup_ultimate_ffi()
+
+        monkeypatch.setattr(Sufast, "_load_ultimate_rust_core", load)
+        return Sufast(), core
+
+    return _build
+
+
+def body_of(reply):
+    body = reply["body"]
+    return json.loads(body) if isinstance(body, str) else body
+
+
+@pytest.mark.parametrize("route_ids", [False, True])
+def test_literal_route_wins_over_overlapping_pattern(make_app, route_ids):
+    app, core = make_app(route_ids=route_ids)
+
+    @app.route("/users/{user_id}")
+    def user(user_id):
+        return {"user": user_id}
+
+    @app.route("/users/me", cache_ttl=30)
+    def me():
+        return {"self": True}
+
+    assert body_of(core.call(b"GET", b"/users/me")) == {"self": True}
+    assert body_of(core.call(b"GET", b"/users/7")) == {"user": "7"}
+
+    if route_ids:
+        # Even if the core hands over the pattern route, the literal one wins
+        pattern_id = core.route_id("/users/{user_id}")
+        reply = core.call_route(pattern_id, b"GET", b"/users/me", b'{"user_id":"me"}')
+        assert body_of(reply) == {"self": True}
+        reply = core.call_route(pattern_id, b"GET", b"/users/a\\b", b'{"user_id":"a\\\\b"}')
+        assert body_of(reply) == {"user": "a\\b"}
+
+
+def test_response_subclasses_are_encoded_as_responses(make_app):
+    from sufast.request import Response
+
+    class TextResponse(Response):
+        def __init__(self, text):
+            super().__init__(text, headers={"Content-Type": "text/plain"},
+                             content_type="text/plain")
+
+    app, core = make_app()
+
+    @app.route("/hello/{name}")
+    def hello(name):
+        return TextResponse(f"hi {name}")
+
+    reply = core.call(b"GET", b"/hello/bob")
+    assert reply["body"] == "hi bob"
+    assert reply["status"] == 200
+    assert reply["headers"]["content-type"] == "text/plain"
+
+
+def test_static_batch_skips_entries_the_core_would_reject(make_app):
+    app, core = make_app(static_batch=True)
+
+    @app.route("/ok")
+    def ok():
+        return {"ok": True}
+
+    @app.route("/structured")
+    def structured():
+        return {"body": {"nested": True}, "status": 200}
+
+    @app.route("/surrogate")
+    def surrogate():
+        return "\ud800"
+
+    assert app._flush_static_routes() == 1
+    assert list(core.static) == ["GET:/ok"]
+    assert set(app.static_routes) == {"GET:/ok"}
+    assert body_of(core.call(b"GET", b"/structured")) == {"nested": True}
+
+
+def test_static_batch_falls_back_when_the_core_stores_too_few(make_app):
+    app, core = make_app(static_batch=True)
+    core.add_static_routes_batch = lambda payload, size: 0
+    accept_static = core.add_static_route
+
+    def add_static_route(route_key, body, status, content_type):
+        return route_key != b"GET:/b" and accept_static(route_key, body, status, content_type)
+
+    core.add_static_route = add_static_route
+
+    @app.route("/a")
+    def a():
+        return {"route": "a"}
+
+    @app.route("/b")
+    def b():
+        return {"route": "b"}
+
+    assert app._flush_static_routes() == 1
+    assert list(core.static) == ["GET:/a"]
+    assert "GET:/b" not in app.static_routes
+    assert [pattern for _, pattern, _, _ in core.dynamic] == ["/b"]
+    assert body_of(core.call(b"GET", b"/b")) == {"route": "b"}
+
+
+def test_docs_page_escapes_route_metadata(make_app):
+    import html
+    import re
+
+    app, core = make_app()
+
+    @app.route("/it's/{item_id}", tags=["o'neil"], summary="<b>bold</b> & more")
+    def item(item_id):
+        return {}
+
+    page = app._generate_swagger_ui()
+    assert "<b>bold</b>" not in page
+    assert "&lt;b&gt;bold&lt;/b&gt; &amp; more" in page
+
+    # Every inline handler argument must still be one JS string literal
+    # once the browser has decoded the attribute
+    handlers = re.findall(
+        r'onclick="(?:filterByTag|toggleEndpoint|executeRequest|clearResponse|fillExample)\(([^"]*)\)"',
+        page,
+    )
+    assert len(handlers) >= 5
+    for args in handlers:
+        assert all(isinstance(arg, str) for arg in json.loads(f"[{html.unescape(args)}]"))
+    assert 'filterByTag(&quot;o&#x27;neil&quot;)' in page
+    assert "executeRequest(&quot;/it&#x27;s/{item_id}&quot;" in page
+
+
+def test_fused_matcher_keeps_registration_order_and_repeated_names(make_app):
+    app, core = make_app()
+
+    @app.route("/items/{item_id}")
+    def item(item_id):
+        return {"item": item_id}
+
+    @app.route("/items/{other}")
+    def shadowed(other):
+        return {"shadowed": other}
+
+    @app.route("/users/{item_id}/posts/{post_id}")
+    def post(post_id, item_id):
+        return {"user": item_id, "post": post_id}
+
+    @app.route("/orders/{item_id}")
+    def order(**params):
+        return params
+
+    assert body_of(core.call(b"GET", b"/items/1")) == {"item": "1"}
+    assert body_of(core.call(b"GET", b"/users/2/posts/3")) == {"user": "2", "post": "3"}
+    assert body_of(core.call(b"GET", b"/orders/4")) == {"item_id": "4"}
+    assert core.call(b"GET", b"/items/1/extra")["status"] == 404
+
+    # Re-registering a pattern replaces it in place, ahead of later routes
+    @app.route("/items/{item_id}")
+    def item_v2(item_id):
+        return {"item_v2": item_id}
+
+    assert body_of(core.call(b"GET", b"/items/5")) == {"item_v2": "5"}
+
+
+def test_core_params_are_merged_over_captured_ones(make_app):
+    app, core = make_app()
+
+    @app.route("/items/{item_id}")
+    def item(item_id, q=None):
+        return {"item": item_id, "q": q}
+
+    reply = core.call(b"GET", b"/items/1", b'{"q":"x"}')
+    assert body_of(reply) == {"item": "1", "q": "x"}
+
+
+def test_route_id_dispatch_calls_the_registered_handler(make_app):
+    app, core = make_app(route_ids=True)
+
+    @app.route("/items/{item_id}")
+    def item(item_id):
+        return {"item": item_id}
+
+    @app.route("/ping", static=False)
+    def ping():
+        return {"pong": True}
+
+    assert [route_id for *_, route_id in core.dynamic] == [0, 1]
+    assert body_of(core.call_route(0, b"GET", b"/items/9", b'{"item_id":"9"}')) == {"item": "9"}
+    assert body_of(core.call_route(1, b"GET", b"/ping")) == {"pong": True}
+
+
+def test_reply_buffer_grows_and_shrinks_back(make_app):
+    app, core = make_app()
+    size = {"n": 10}
+
+    @app.route("/blob", static=False)
+    def blob():
+        return {"data": "x" * size["n"]}
+
+    assert len(body_of(core.call(b"GET", b"/blob"))["data"]) == 10
+    initial = len(app._response_storage.buf)
+
+    size["n"] = 200_000
+    assert len(body_of(core.call(b"GET", b"/blob"))["data"]) == 200_000
+    assert len(app._response_storage.buf) > 200_000
+
+    size["n"] = 10
+    assert len(body_of(core.call(b"GET", b"/blob"))["data"]) == 10
+    assert len(app._response_storage.buf) == initial
+
+
+def test_replies_go_to_the_core_arena_when_exported(make_app):
+    app, core = make_app()
+    # Not exported by FakeCore by default; add it before wiring the callback
+    arena = []
+
+    def alloc_response(size):
+        buf = ctypes.create_string_buffer(size + 1)
+        arena.append(buf)
+        return ctypes.addressof(buf)
+
+    core.alloc_response = alloc_response
+    app._register_ultimate_callback()
+
+    @app.route("/items/{item_id}")
+    def item(item_id):
+        return {"item": item_id}
+
+    assert body_of(core.call(b"GET", b"/items/3")) == {"item": "3"}
+    assert len(arena) == 1
+    assert app._response_storage.buf is None
+
+
+@pytest.mark.parametrize("route_ids", [False, True])
+def test_handlers_get_only_the_params_they_take(make_app, route_ids):
+    app, core = make_app(route_ids=route_ids)
+
+    @app.route("/users/{id}")
+    def user(request=None):
+        return {"request": request}
+
+    @app.route("/posts/{post_id}/{slug}")
+    def post(post_id):
+        return {"post": post_id}
+
+    assert body_of(core.call(b"GET", b"/users/1")) == {"request": None}
+    assert body_of(core.call(b"GET", b"/posts/2/hello")) == {"post": "2"}
+
+    if route_ids:
+        reply = core.call_route(core.route_id("/users/{id}"), b"GET", b"/users/1", b'{"id":"1"}')
+        assert body_of(reply) == {"request": None}
+        reply = core.call_route(core.route_id("/posts/{post_id}/{slug}"), b"GET", b"/posts/2/hello",
+                                b'{"post_id":"2","slug":"hello"}')
+        assert body_of(reply) == {"post": "2"}
+
+
+def test_import_and_construction_are_silent(make_app, capsys):
+    import subprocess
+    import sys
+
+    imported = subprocess.run([sys.executable, "-c", "import sufast.core_ultimate"],
+                              capture_output=True, text=True, check=True)
+    assert imported.stdout == ""
+    make_app()
+    assert capsys.readouterr().out == ""
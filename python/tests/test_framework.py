@@ -3,6 +3,8 @@
 import asyncio
 import gzip
 
+import pytest
+
 from sufast import APIRouter, HTTPException, Request, Response, Sufast
 from sufast.compression import CompressionMiddleware
 from sufast.logging import LogLevel, Logger, get_logger
@@ -158,3 +160,15 @@ def test_sessions_uploads_sse_and_middleware_helpers():
         rl_req, Response(content="ok", status=200, content_type="text/plain")
     )
     assert sec_resp.headers.get("x-content-type-options") == "nosniff"
+
+
+def test_request_and_response_use_fixed_slots():
+    req = Request(method="get", path="/", headers={}, body="")
+    req.state["user"] = "ada"
+    with pytest.raises(AttributeError):
+        req.user = "ada"
+
+    plain = Response({"ok": True})
+    assert "set-cookie" not in plain.to_dict()["headers"]
+    with_cookie = Response("hi").set_cookie("sid", "abc")
+    assert with_cookie.to_dict()["headers"]["set-cookie"][0].startswith("sid=abc")
@@ -0,0 +1,370 @@
+"""Tests for the ultra-optimized core (sufast.core) on the pure-Python path."""
+
+import dataclasses
+import json
+
+import pytest
+
+from sufast.core import Response, SufastUltraOptimized
+
+
+def make_app():
+    return SufastUltraOptimized(enable_rust_optimization=False)
+
+
+def test_register_batch_registers_every_kind():
+    app = make_app()
+
+    def cached():
+        return {"tier": "cached"}
+
+    def dynamic():
+        return {"tier": "dynamic"}
+
+    def plain():
+        return {"tier": "route"}
+
+    count = app.register_batch([
+        ("/static", "static", {"tier": "static"}, None),
+        ("/cached", "cached", cached, {"ttl": 30}),
+        ("/dynamic", "dynamic", dynamic, None),
+        ("/plain", "route", plain, {"methods": ["GET", "POST"]}),
+    ])
+
+    assert count == 4
+    assert app.routes["GET:/static"]["is_static"] is True
+    assert app.routes["GET:/cached"]["cache_ttl"] == 30
+    assert app.routes["GET:/dynamic"]["handler"] is dynamic
+    assert "POST:/plain" in app.routes
+    # Registered in the order given, as with one decorator call per spec
+    assert [key for key in app.routes if key.startswith("GET:")][:4] == [
+        "GET:/static", "GET:/cached", "GET:/dynamic", "GET:/plain",
+    ]
+
+
+def test_register_batch_rejects_unknown_kind():
+    app = make_app()
+
+    with pytest.raises(ValueError, match="bogus"):
+        app.register_batch([("/x", "bogus", lambda: None, None)])
+
+
+def test_encode_result_fast_path_for_native_types():
+    app = make_app()
+
+    assert json.loads(app._encode_result({"a": 1})) == {"a": 1}
+    assert json.loads(app._encode_result([1, 2])) == [1, 2]
+    assert json.loads(app._encode_result("hi")) == "hi"
+    assert app._encode_result(b'{"raw":true}') == b'{"raw":true}'
+
+
+def test_encode_result_handles_exotic_types():
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        y: int
+
+    app = make_app()
+
+    assert json.loads(app._encode_result(Point(1, 2))) == {"x": 1, "y": 2}
+    assert json.loads(app._encode_result(Response({"ok": True}))) == {"ok": True}
+    assert json.loads(app._encode_result(object()))["result"].startswith("<object")
+
+
+def test_response_body_stays_text_alongside_encoded_bytes():
+    response = Response("héllo", content_type="text/plain")
+    assert response.body == "héllo"
+    assert response.body_bytes == "héllo".encode("utf-8")
+    assert json.loads(Response({"ok": True}).body) == {"ok": True}
+
+    response.body = "bye"
+    assert make_app()._encode_result(response) == b"bye"
+
+
+def test_announce_respects_quiet_flag(monkeypatch, capsys):
+    from sufast.core import _announce
+
+    monkeypatch.setenv("SUFAST_QUIET", "1")
+    _announce("hidden")
+    assert capsys.readouterr().out == ""
+
+    monkeypatch.delenv("SUFAST_QUIET")
+    _announce("line one", "line two")
+    assert capsys.readouterr().out == "line one\nline two\n"
+
+
+def test_static_route_accepts_preserialized_bytes():
+    app = make_app()
+    payload = b'{"from":"disk"}'
+
+    app.static_route("/raw", payload)
+
+    handler = app.routes["GET:/raw"]["handler"]
+    assert app._encode_result(handler()) == payload
+
+
+def test_fused_dynamic_route_returns_serialized_body():
+    app = make_app()
+
+    @app.fused_dynamic_route("/items/{item_id}")
+    def get_item(item_id):
+        return {"item_id": item_id}
+
+    handler = app.routes["GET:/items/{item_id}"]["handler"]
+    body = handler(item_id="7")
+    assert isinstance(body, bytes)
+    assert app._encode_result(body) == body
+    assert json.loads(body) == {"item_id": "7"}
+
+
+def test_fused_dynamic_route_awaits_async_handlers():
+    app = make_app()
+
+    @app.fused_dynamic_route("/items/{item_id}")
+    async def get_item(item_id):
+        return {"item_id": item_id}
+
+    assert app.routes["GET:/items/{item_id}"]["is_async"] is True
+    body = app._dispatch(b'{"method": "GET"}', b"/items/7")
+    assert json.loads(body) == {"item_id": "7"}
+
+
+def test_dispatch_routes_and_encodes():
+    app = make_app()
+
+    @app.dynamic_route("/users/{user_id}")
+    def get_user(user_id):
+        return {"user_id": user_id}
+
+    body = app._dispatch(b'{"method": "GET"}', b"/users/42")
+    assert json.loads(body) == {"user_id": "42"}
+
+    missing = app._dispatch(b'{"method": "GET"}', b"/nope")
+    assert json.loads(missing) == {"error": "Route not found"}
+
+    broken = app._dispatch(b"not json", b"/users/42")
+    assert json.loads(broken) == {"error": "Internal server error"}
+
+
+def test_route_trie_prefers_literals_and_backtracks():
+    app = make_app()
+
+    @app.dynamic_route("/users/me")
+    def me():
+        return {"who": "me"}
+
+    @app.dynamic_route("/users/{user_id}")
+    def user(user_id):
+        return {"user_id": user_id}
+
+    @app.dynamic_route("/users/{user_id}/posts/{post_id}")
+    def post(user_id, post_id):
+        return {"user_id": user_id, "post_id": post_id}
+
+    @app.route("/users/me/settings", methods=["POST"])
+    def settings():
+        return {}
+
+    route, params = app._find_matching_route("GET", "/users/me")
+    assert route["handler"] is me and params == {}
+
+    route, params = app._find_matching_route("GET", "/users/me/posts/3")
+    assert route["handler"] is post
+    assert params == {"user_id": "me", "post_id": "3"}
+
+    assert app._find_matching_route("GET", "/users/me/settings") == (None, None)
+    assert app._find_matching_route("GET", "/users/") == (None, None)
+
+
+def test_resolve_cache_is_invalidated_on_registration():
+    from sufast.core import _resolve_cache_size
+
+    app = make_app()
+
+    @app.dynamic_route("/items/{item_id}")
+    def item(item_id):
+        return {}
+
+    route, params = app._find_matching_route("GET", "/items/special")
+    assert route["handler"] is item and params == {"item_id": "special"}
+
+    @app.dynamic_route("/items/special")
+    def special():
+        return {}
+
+    route, params = app._find_matching_route("GET", "/items/special")
+    assert route["handler"] is special and params == {}
+
+    assert _resolve_cache_size(3) == 5000
+    assert _resolve_cache_size(6000) == 8192
+    assert _resolve_cache_size(10 ** 6) == 100000
+
+
+def test_dispatch_runs_async_handlers_on_background_loop():
+    app = make_app()
+
+    @app.dynamic_route("/async/{name}")
+    async def greet(name):
+        return {"hello": name}
+
+    assert app.routes["GET:/async/{name}"]["is_async"] is True
+    body = app._dispatch(b'{"method": "GET"}', b"/async/world")
+    assert json.loads(body) == {"hello": "world"}
+    assert app._loop.is_running()
+
+
+def test_literal_routes_bypass_the_trie():
+    app = make_app()
+
+    @app.route("/health", methods=["GET", "HEAD"])
+    def health():
+        return {"ok": True}
+
+    assert app._literal_routes[("HEAD", "/health")]["handler"] is health
+    app._resolve_cache = None  # literal lookups must not touch the cache
+    route, params = app._find_matching_route("GET", "/health")
+    assert route["handler"] is health and params == {}
+
+
+def test_library_lookup_honours_override(monkeypatch, tmp_path):
+    from sufast.core import RustCore, _load_shared_library
+
+    monkeypatch.setenv("SUFAST_LIB_PATH", str(tmp_path / "missing.so"))
+    _load_shared_library.cache_clear()
+    try:
+        core = RustCore()
+        assert core.is_loaded is False
+        assert core.lib is None
+    finally:
+        _load_shared_library.cache_clear()
+
+
+def test_utc_timestamp_is_iso_formatted():
+    from datetime import datetime
+
+    from sufast.core import _utc_timestamp
+
+    first = _utc_timestamp()
+    parsed = datetime.fromisoformat(first)
+    assert abs((datetime.utcnow() - parsed).total_seconds()) < 5
+    assert len(first) == len("2024-01-01T00:00:00.000000")
+
+
+def test_compiled_param_builder():
+    from sufast.core import _compile_param_builder
+
+    build = _compile_param_builder(("user_id", "post's id"))
+    assert build(("7", "9")) == {"user_id": "7", "post's id": "9"}
+    assert _compile_param_builder(())(()) == {}
+
+
+def test_stop_releases_run():
+    import threading
+
+    app = make_app()
+    runner = threading.Thread(target=app.run, daemon=True)
+    runner.start()
+
+    app.stop()
+    runner.join(timeout=5)
+    assert not runner.is_alive()
+
+
+def test_cached_response_memoizes_raw_bodies():
+    from sufast.core import RawResponse, cached_response
+
+    calls = []
+    app = make_app()
+
+    @app.dynamic_route("/square/{n}")
+    @cached_response
+    def square(n):
+        calls.append(n)
+        return {"square": int(n) ** 2}
+
+    first = app._dispatch(b'{"method": "GET"}', b"/square/4")
+    second = app._dispatch(b'{"method": "GET"}', b"/square/4")
+    assert first == second and json.loads(first) == {"square": 16}
+    assert calls == ["4"]
+    assert app._encode_result(RawResponse(b"<p>hi</p>", ctype="text/html")) == b"<p>hi</p>"
+
+
+def test_core_counters_are_packed_and_reset():
+    from sufast.core import RustCore
+
+    core = RustCore()
+    core.request_count = 5
+    core.static_hits += 2
+    assert list(core.counters) == [5, 0, 2, 0]
+
+    core.clear_all_caches()
+    assert core.request_count == 0 and core.static_hits == 0
+
+
+def test_dynamic_hits_count_only_matched_requests():
+    from sufast.core import RustCore
+
+    app = make_app()
+    app.rust_core = RustCore()
+
+    @app.dynamic_route("/items/{item_id}")
+    def item(item_id):
+        return {"item": item_id}
+
+    app._dispatch(b'{"method": "GET"}', b"/items/1")
+    app._dispatch(b'{"method": "GET"}', b"/missing")
+    assert app.rust_core.request_count == 2
+    assert app.rust_core.dynamic_hits == 1
+
+
+def test_handlers_called_positionally_only_when_signature_matches():
+    app = make_app()
+
+    @app.dynamic_route("/a/{x}/{y}")
+    def ordered(x, y):
+        return [x, y]
+
+    @app.dynamic_route("/b/{x}/{y}")
+    def swapped(y, x):
+        return [x, y]
+
+    @app.dynamic_route("/c/{x}")
+    def kwargs_only(**params):
+        return params
+
+    assert app._resolve_route("GET", "/a/1/2")[2] is True
+    assert app._resolve_route("GET", "/b/1/2")[2] is False
+    assert json.loads(app._dispatch(b'{}', b"/a/1/2")) == ["1", "2"]
+    assert json.loads(app._dispatch(b'{}', b"/b/1/2")) == ["1", "2"]
+    assert json.loads(app._dispatch(b'{}', b"/c/9")) == {"x": "9"}
+
+
+def test_app_helpers_are_silent(capsys):
+    from sufast.core import benchmark_app, quick_static_app
+
+    quick_static_app({"/a": {"a": 1}})
+    benchmark_app.cache_clear()
+    try:
+        benchmark_app()
+    finally:
+        benchmark_app.cache_clear()
+    assert capsys.readouterr().out == ""
+
+
+def test_library_lookup_without_importlib_files(monkeypatch):
+    import importlib.resources
+    from pathlib import Path
+
+    from sufast import core
+    from sufast.core import _load_shared_library
+
+    monkeypatch.delenv("SUFAST_LIB_PATH", raising=False)
+    monkeypatch.delattr(importlib.resources, "files", raising=False)
+    calls = []
+    monkeypatch.setattr("sufast.core.ctypes.CDLL", lambda path: calls.append(path) or object())
+    _load_shared_library.cache_clear()
+    try:
+        assert _load_shared_library() is not None
+    finally:
+        _load_shared_library.cache_clear()
+    assert calls and all(Path(path).parent == Path(core.__file__).parent for path in calls)
@@ -676,6 +676,16 @@ pub extern "C" fn get_performance_stats() -> *mut c_char {
     c_string.into_raw()
 }
 
+/// Free a string returned by `get_performance_stats`.
+#[no_mangle]
+pub extern "C" fn free_rust_string(ptr: *mut c_char) {
+    if !ptr.is_null() {
+        unsafe {
+            drop(CString::from_raw(ptr));
+        }
+    }
+}
+
 // === MAIN SERVER FUNCTION ===
 pub async fn run_server(addr: &str) -> Result<(), Box<dyn std::error::Error>> {
     let app = Router::new()
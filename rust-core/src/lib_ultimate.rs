@@ -9,10 +9,11 @@ use dashmap::DashMap;
 use once_cell::sync::Lazy;
 use regex::Regex;
 use serde_json::{json, Value};
+use std::cell::RefCell;
 use std::collections::HashMap;
 use std::ffi::{c_char, CStr, CString};
 use std::sync::atomic::{AtomicU64, Ordering};
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, RwLock};
 use std::time::{Duration, Instant};
 use tokio::net::TcpListener;
 use tower_http::cors::CorsLayer;
@@ -28,8 +29,11 @@ static STATIC_RESPONSES: Lazy<DashMap<String, StaticResponse>> = Lazy::new(DashM
 // Response cache: Intelligent caching for dynamic routes
 static RESPONSE_CACHE: Lazy<DashMap<String, CachedResponse>> = Lazy::new(DashMap::new);
 
-// Dynamic patterns: Fast pattern matching (stores "METHOD:PATTERN" -> DynamicRoute)
-static DYNAMIC_ROUTES: Lazy<DashMap<String, DynamicRoute>> = Lazy::new(DashMap::new);
+// Dynamic patterns in registration order ("METHOD:PATTERN", DynamicRoute).
+// Matching must be deterministic and agree with Python's resolution, so
+// this is a Vec rather than a map with arbitrary iteration order
+static DYNAMIC_ROUTES: Lazy<RwLock<Vec<(String, DynamicRoute)>>> =
+    Lazy::new(|| RwLock::new(Vec::new()));
 
 // WebSocket routes
 static WS_ROUTES: Lazy<DashMap<String, WsRoute>> = Lazy::new(DashMap::new);
@@ -63,6 +67,11 @@ struct DynamicRoute {
     regex: Regex,
     handler_name: String,
     cache_ttl: Option<Duration>,
+    // Pattern without parameters: tried before every parameterised route
+    literal: bool,
+    // Set when Python registered the route with an id: the handler is then
+    // called directly through PYTHON_ROUTE_CALLBACK, without re-routing
+    route_id: Option<u32>,
 }
 
 #[derive(Clone)]
@@ -75,6 +84,18 @@ struct WsRoute {
 type PythonCallback = extern "C" fn(*const c_char, *const c_char, *const c_char) -> *const c_char;
 static PYTHON_CALLBACK: Lazy<Mutex<Option<PythonCallback>>> = Lazy::new(|| Mutex::new(None));
 
+// Python callback for routes matched here: (route id, method, path, params)
+type PythonRouteCallback =
+    extern "C" fn(u32, *const c_char, *const c_char, *const c_char) -> *const c_char;
+static PYTHON_ROUTE_CALLBACK: Lazy<Mutex<Option<PythonRouteCallback>>> =
+    Lazy::new(|| Mutex::new(None));
+
+// Per-thread reply arena: the callback runs on the calling worker thread,
+// so Python can write its reply straight into memory this side owns
+thread_local! {
+    static RESPONSE_ARENA: RefCell<Vec<u8>> = RefCell::new(Vec::with_capacity(4096));
+}
+
 // Response pool to prevent memory leaks
 static RESPONSE_POOL: Lazy<Arc<Mutex<Vec<CString>>>> =
     Lazy::new(|| Arc::new(Mutex::new(Vec::new())));
@@ -141,66 +162,76 @@ async fn ultra_fast_handler(
     // TIER 3: Dynamic processing - Call Python via FFI
     DYNAMIC_HITS.fetch_add(1, Ordering::Relaxed);
 
-    // Match dynamic routes by method + path pattern
-    for route_entry in DYNAMIC_ROUTES.iter() {
-        let route = route_entry.value();
-
-        // Check method matches
-        if route.method != "*" && route.method != method_str {
-            continue;
-        }
-
-        if let Some(captures) = route.regex.captures(path) {
-            // Extract parameters
-            let mut params_json = String::from("{");
-            let mut first = true;
+    // Match dynamic routes by method + path pattern: literal patterns first,
+    // then registration order, as Python resolves them. The route is picked
+    // under the read lock, which is released before calling into Python
+    let matched = {
+        let routes = DYNAMIC_ROUTES.read().unwrap();
+        let candidates = routes
+            .iter()
+            .filter(|entry| entry.1.literal)
+            .chain(routes.iter().filter(|entry| !entry.1.literal));
+
+        let mut found = None;
+        for (_, route) in candidates {
+            // Check method matches
+            if route.method != "*" && route.method != method_str {
+                continue;
+            }
 
-            for name in route.regex.capture_names() {
-                if let Some(name) = name {
+            if let Some(captures) = route.regex.captures(path) {
+                // Extract parameters; serde_json escapes the captured text
+                let mut params = serde_json::Map::new();
+                for name in route.regex.capture_names().flatten() {
                     if let Some(value) = captures.name(name) {
-                        if !first {
-                            params_json.push(',');
-                        }
-                        params_json.push_str(&format!(
-                            "\"{}\":\"{}\"",
-                            name,
-                            value.as_str().replace('\"', "\\\"")
-                        ));
-                        first = false;
+                        params.insert(name.to_string(), Value::String(value.as_str().to_string()));
                     }
                 }
+                found = Some((
+                    route.route_id,
+                    route.cache_ttl,
+                    route.handler_name.clone(),
+                    Value::Object(params).to_string(),
+                ));
+                break;
             }
-            params_json.push('}');
-
-            // Call Python handler
-            if let Ok((body, status, response_headers)) =
-                call_ultra_fast_python_handler(method_str, path, &params_json).await
-            {
-                // Cache successful responses
-                if status == 200 && route.cache_ttl.is_some() {
-                    let cached = CachedResponse {
-                        body: body.clone(),
-                        status,
-                        headers: response_headers.clone(),
-                        cached_at: Instant::now(),
-                        ttl: route.cache_ttl.unwrap(),
-                    };
-                    RESPONSE_CACHE.insert(route_key, cached);
-                }
+        }
+        found
+    };
 
-                let mut response_builder = Response::builder().status(status);
-                for (key, value) in &response_headers {
-                    response_builder = response_builder.header(key, value);
-                }
+    if let Some((route_id, cache_ttl, handler_name, params_json)) = matched {
+        // Call Python handler: straight to it when the route has an id
+        let result = match route_id {
+            Some(route_id) => {
+                call_python_route_handler(route_id, method_str, path, &params_json).await
+            }
+            None => call_ultra_fast_python_handler(method_str, path, &params_json).await,
+        };
+        if let Ok((body, status, response_headers)) = result {
+            // Cache successful responses
+            if let (200, Some(ttl)) = (status, cache_ttl) {
+                let cached = CachedResponse {
+                    body: body.clone(),
+                    status,
+                    headers: response_headers.clone(),
+                    cached_at: Instant::now(),
+                    ttl,
+                };
+                RESPONSE_CACHE.insert(route_key, cached);
+            }
 
-                return response_builder
-                    .header("x-sufast-tier", "dynamic")
-                    .header("x-sufast-request-id", request_id.to_string())
-                    .header("x-sufast-handler", &route.handler_name)
-                    .header("server", "sufast-ultra/3.0")
-                    .body(Body::from(body))
-                    .unwrap();
+            let mut response_builder = Response::builder().status(status);
+            for (key, value) in &response_headers {
+                response_builder = response_builder.header(key, value);
             }
+
+            return response_builder
+                .header("x-sufast-tier", "dynamic")
+                .header("x-sufast-request-id", request_id.to_string())
+                .header("x-sufast-handler", &handler_name)
+                .header("server", "sufast-ultra/3.0")
+                .body(Body::from(body))
+                .unwrap();
         }
     }
 
@@ -256,46 +287,103 @@ async fn call_ultra_fast_python_handler(
             path_cstr.as_ptr(),
             params_cstr.as_ptr(),
         );
-        drop(callback); // Release lock before processing
         if result_ptr.is_null() {
             return Err("Python callback returned null".to_string());
         }
 
-        let response_json = unsafe {
-            let c_str = CStr::from_ptr(result_ptr);
-            let s = c_str.to_string_lossy().to_string();
-            // Reclaim the CString to prevent memory leak
-            drop(CString::from_raw(result_ptr as *mut c_char));
-            s
-        };
+        // The reply lives either in this thread's arena (see alloc_response)
+        // or in a buffer Python reuses on its next callback: copy it out,
+        // never free it
+        let response_json = unsafe { CStr::from_ptr(result_ptr).to_string_lossy().into_owned() };
+        drop(callback); // Release lock before processing
+
+        return parse_python_reply(&response_json);
+    }
+    Err("Python callback failed".to_string())
+}
 
-        // Parse response
-        if let Ok(response_data) = serde_json::from_str::<Value>(&response_json) {
-            let body = response_data["body"].as_str().unwrap_or("{}").to_string();
-            let status = response_data["status"].as_u64().unwrap_or(200) as u16;
+async fn call_python_route_handler(
+    route_id: u32,
+    method: &str,
+    path: &str,
+    params_json: &str,
+) -> Result<(String, u16, HashMap<String, String>), String> {
+    let callback = PYTHON_ROUTE_CALLBACK.lock().unwrap();
+    if let Some(cb) = *callback {
+        let method_cstr = CString::new(method).map_err(|e| e.to_string())?;
+        let path_cstr = CString::new(path).map_err(|e| e.to_string())?;
+        let params_cstr = CString::new(params_json).map_err(|e| e.to_string())?;
 
-            let mut headers = HashMap::new();
-            headers.insert("content-type".to_string(), "application/json".to_string());
-            headers.insert("x-sufast-engine".to_string(), "rust-python-ffi".to_string());
+        let result_ptr = cb(
+            route_id,
+            method_cstr.as_ptr(),
+            path_cstr.as_ptr(),
+            params_cstr.as_ptr(),
+        );
+        if result_ptr.is_null() {
+            return Err("Python route callback returned null".to_string());
+        }
 
-            if let Some(response_headers) = response_data["headers"].as_object() {
-                for (key, value) in response_headers {
-                    if let Some(value_str) = value.as_str() {
-                        headers.insert(key.clone(), value_str.to_string());
-                    }
-                }
-            }
+        // Same reply ownership as call_ultra_fast_python_handler
+        let response_json = unsafe { CStr::from_ptr(result_ptr).to_string_lossy().into_owned() };
+        drop(callback); // Release lock before processing
+
+        return parse_python_reply(&response_json);
+    }
+    Err("Python route callback not set".to_string())
+}
 
-            return Ok((body, status, headers));
+fn parse_python_reply(
+    response_json: &str,
+) -> Result<(String, u16, HashMap<String, String>), String> {
+    let response_data = serde_json::from_str::<Value>(response_json).map_err(|e| e.to_string())?;
+
+    // A string body is sent as-is; any other JSON value is the
+    // response document itself (see supports_inline_json_body)
+    let body = match &response_data["body"] {
+        Value::String(s) => s.clone(),
+        Value::Null => "{}".to_string(),
+        other => other.to_string(),
+    };
+    let status = response_data["status"].as_u64().unwrap_or(200) as u16;
+
+    let mut headers = HashMap::new();
+    headers.insert("content-type".to_string(), "application/json".to_string());
+    headers.insert("x-sufast-engine".to_string(), "rust-python-ffi".to_string());
+
+    if let Some(response_headers) = response_data["headers"].as_object() {
+        for (key, value) in response_headers {
+            if let Some(value_str) = value.as_str() {
+                headers.insert(key.clone(), value_str.to_string());
+            }
         }
     }
-    Err("Python callback failed".to_string())
+
+    Ok((body, status, headers))
 }
 
 // ========================
 // FFI ROUTE REGISTRATION
 // ========================
 
+fn insert_static_response(method_path: String, body: String, status: u16, content_type: String) {
+    let mut headers = HashMap::new();
+    headers.insert("content-type".to_string(), content_type);
+    headers.insert("x-sufast-optimized".to_string(), "static".to_string());
+    headers.insert(
+        "cache-control".to_string(),
+        "public, max-age=31536000".to_string(),
+    );
+
+    let static_response = StaticResponse {
+        body,
+        status,
+        headers,
+    };
+
+    STATIC_RESPONSES.insert(method_path, static_response);
+}
+
 #[no_mangle]
 pub extern "C" fn add_static_route(
     method_path: *const c_char,
@@ -316,31 +404,39 @@ pub extern "C" fn add_static_route(
             CStr::from_ptr(content_type).to_string_lossy().to_string()
         };
 
-        let mut headers = HashMap::new();
-        headers.insert("content-type".to_string(), content_type_str);
-        headers.insert("x-sufast-optimized".to_string(), "static".to_string());
-        headers.insert(
-            "cache-control".to_string(),
-            "public, max-age=31536000".to_string(),
-        );
-
-        let static_response = StaticResponse {
-            body: body_str,
-            status,
-            headers,
-        };
-
-        STATIC_RESPONSES.insert(method_path_str, static_response);
+        insert_static_response(method_path_str, body_str, status, content_type_str);
         true
     }
 }
 
+/// Registers many static routes in one call. `data` is a JSON array of
+/// `[method_path, body, status, content_type]` entries; returns how many
+/// were stored (0 if the payload does not parse).
 #[no_mangle]
-pub extern "C" fn add_dynamic_route(
+pub extern "C" fn add_static_routes_batch(data: *const u8, len: usize) -> u64 {
+    if data.is_null() {
+        return 0;
+    }
+
+    let bytes = unsafe { std::slice::from_raw_parts(data, len) };
+    let routes: Vec<(String, String, u16, String)> = match serde_json::from_slice(bytes) {
+        Ok(routes) => routes,
+        Err(_) => return 0,
+    };
+
+    let count = routes.len() as u64;
+    for (method_path, body, status, content_type) in routes {
+        insert_static_response(method_path, body, status, content_type);
+    }
+    count
+}
+
+fn register_dynamic_route(
     method: *const c_char,
     pattern: *const c_char,
     handler_name: *const c_char,
     cache_ttl_seconds: u64,
+    route_id: Option<u32>,
 ) -> bool {
     unsafe {
         if method.is_null() || pattern.is_null() || handler_name.is_null() {
@@ -350,6 +446,7 @@ pub extern "C" fn add_dynamic_route(
         let method_str = CStr::from_ptr(method).to_string_lossy().to_string();
         let pattern_str = CStr::from_ptr(pattern).to_string_lossy().to_string();
         let handler_str = CStr::from_ptr(handler_name).to_string_lossy().to_string();
+        let literal = !pattern_str.contains('{');
 
         // Compile fast regex pattern
         if let Ok(regex) = compile_ultra_fast_pattern(&pattern_str) {
@@ -364,11 +461,18 @@ pub extern "C" fn add_dynamic_route(
                 regex,
                 handler_name: handler_str,
                 cache_ttl,
+                literal,
+                route_id,
             };
 
-            // Key includes method for proper multi-method routing
+            // Key includes method for proper multi-method routing;
+            // re-registering a pattern replaces it in place
             let key = format!("{}:{}", method_str, pattern_str);
-            DYNAMIC_ROUTES.insert(key, dynamic_route);
+            let mut routes = DYNAMIC_ROUTES.write().unwrap();
+            match routes.iter_mut().find(|entry| entry.0 == key) {
+                Some(entry) => entry.1 = dynamic_route,
+                None => routes.push((key, dynamic_route)),
+            }
             true
         } else {
             false
@@ -376,6 +480,29 @@ pub extern "C" fn add_dynamic_route(
     }
 }
 
+#[no_mangle]
+pub extern "C" fn add_dynamic_route(
+    method: *const c_char,
+    pattern: *const c_char,
+    handler_name: *const c_char,
+    cache_ttl_seconds: u64,
+) -> bool {
+    register_dynamic_route(method, pattern, handler_name, cache_ttl_seconds, None)
+}
+
+/// Like `add_dynamic_route`, but matches are handed to the route callback
+/// with `route_id` so Python can call the handler without routing again.
+#[no_mangle]
+pub extern "C" fn add_dynamic_route_with_id(
+    method: *const c_char,
+    pattern: *const c_char,
+    handler_name: *const c_char,
+    cache_ttl_seconds: u64,
+    route_id: u32,
+) -> bool {
+    register_dynamic_route(method, pattern, handler_name, cache_ttl_seconds, Some(route_id))
+}
+
 #[no_mangle]
 pub extern "C" fn add_websocket_route(
     pattern: *const c_char,
@@ -426,6 +553,32 @@ pub extern "C" fn set_python_callback(callback: PythonCallback) {
     *cb = Some(callback);
 }
 
+#[no_mangle]
+pub extern "C" fn set_python_route_callback(callback: PythonRouteCallback) {
+    let mut cb = PYTHON_ROUTE_CALLBACK.lock().unwrap();
+    *cb = Some(callback);
+}
+
+/// Hands the Python callback a NUL-terminated buffer of `len` bytes from
+/// the calling thread's reply arena. It stays valid until the next call on
+/// the same thread; the callback returns this pointer after filling it.
+#[no_mangle]
+pub extern "C" fn alloc_response(len: usize) -> *mut u8 {
+    RESPONSE_ARENA.with(|arena| {
+        let mut arena = arena.borrow_mut();
+        arena.clear();
+        arena.resize(len + 1, 0);
+        arena.as_mut_ptr()
+    })
+}
+
+/// Tells the Python side it may put a JSON object/array directly in the
+/// callback envelope's "body" instead of a pre-encoded string.
+#[no_mangle]
+pub extern "C" fn supports_inline_json_body() -> bool {
+    true
+}
+
 #[no_mangle]
 pub extern "C" fn get_performance_stats() -> *mut c_char {
     let static_hits = STATIC_HITS.load(Ordering::Relaxed);
@@ -448,7 +601,7 @@ pub extern "C" fn get_performance_stats() -> *mut c_char {
         "route_counts": {
             "static_routes": STATIC_RESPONSES.len(),
             "cached_responses": RESPONSE_CACHE.len(),
-            "dynamic_patterns": DYNAMIC_ROUTES.len(),
+            "dynamic_patterns": DYNAMIC_ROUTES.read().unwrap().len(),
             "websocket_routes": WS_ROUTES.len()
         },
         "server": "sufast-ultra/3.0"
@@ -562,7 +715,7 @@ pub extern "C" fn start_ultra_fast_server(host: *const c_char, port: u16) -> i32
             "[sufast] Rust core listening on {} (routes: {} static, {} dynamic, {} ws)",
             addr,
             STATIC_RESPONSES.len(),
-            DYNAMIC_ROUTES.len(),
+            DYNAMIC_ROUTES.read().unwrap().len(),
             WS_ROUTES.len()
         );
 
@@ -582,7 +735,7 @@ pub extern "C" fn start_ultra_fast_server(host: *const c_char, port: u16) -> i32
 
 #[no_mangle]
 pub extern "C" fn get_route_count() -> u64 {
-    (STATIC_RESPONSES.len() + DYNAMIC_ROUTES.len()) as u64
+    (STATIC_RESPONSES.len() + DYNAMIC_ROUTES.read().unwrap().len()) as u64
 }
 
 #[no_mangle]